@@ -0,0 +1,65 @@
+"""Benchmark the startup time of the ``piper`` command line interface.
+
+Each scenario is run in a fresh interpreter so that the measured time includes
+the cost of importing modules, which is what a shell script invoking ``piper``
+pays on every call. The ``eager imports`` scenario imports everything the CLI
+used to import up front and serves as the baseline for comparison.
+
+Usage:
+    python benchmarks/startup.py [--runs N]
+
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+SCENARIOS = {
+    "piper --version": ["-m", "piper_kit", "--version"],
+    "piper --help": ["-m", "piper_kit", "--help"],
+    "import piper_kit": ["-c", "import piper_kit"],
+    "eager imports": ["-c", "import piper_kit._piper, cursers"],
+}
+
+
+def measure(args: list[str], runs: int) -> list[float]:
+    """Measure the wall-clock time of running the interpreter with the arguments.
+
+    Args:
+        args: Arguments passed to the Python interpreter.
+        runs: Number of times to run the interpreter.
+
+    Returns:
+        Elapsed times in milliseconds, one per run.
+
+    """
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(  # noqa: S603
+            [sys.executable, *args], check=True, stdout=subprocess.DEVNULL
+        )
+        times.append((time.perf_counter() - start) * 1000)
+
+    return times
+
+
+def main() -> None:
+    """Run all startup scenarios and print a summary table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20, help="runs per scenario")
+    args = parser.parse_args()
+
+    sys.stdout.write(f"{'scenario':<20} {'mean':>10} {'min':>10} {'max':>10}\n")
+    for name, scenario_args in SCENARIOS.items():
+        times = measure(scenario_args, args.runs)
+        sys.stdout.write(
+            f"{name:<20} {statistics.mean(times):>8.1f}ms"
+            f" {min(times):>8.1f}ms {max(times):>8.1f}ms\n"
+        )
+
+
+if __name__ == "__main__":
+    main()
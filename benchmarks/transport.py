@@ -0,0 +1,123 @@
+"""Benchmark receiving and sending frames through python-can and raw sockets.
+
+A background thread floods a virtual CAN interface with joint feedback frames
+while `piper_kit.Piper` decodes them with `Piper.read_message`, once through
+python-can and once through the native ``AF_CAN`` socket of ``raw://`` URIs.
+The send benchmark measures `Piper.set_joint_control` on both paths.
+
+The interface must exist beforehand, for example:
+
+    sudo ip link add dev vcan0 type vcan
+    sudo ip link set up vcan0
+
+Usage:
+    python benchmarks/transport.py [--frames N] [interface]
+
+"""
+
+import argparse
+import socket
+import sys
+import threading
+import time
+
+from piper_kit import Piper
+from piper_kit.messages import JointFeedback12Message, TransmitMessage
+
+# Maximum number of frames in flight, kept low so that the receive queue of the
+# socket under test never overflows and drops frames.
+MAX_IN_FLIGHT = 64
+
+
+def flood(interface: str, frames: int, tokens: threading.Semaphore) -> None:
+    """Send joint feedback frames to the interface as fast as possible.
+
+    Args:
+        interface: CAN interface to send the frames to.
+        frames: Number of frames to send.
+        tokens: Semaphore acquired before sending each frame.
+
+    """
+    frame = TransmitMessage(JointFeedback12Message.ID, 0x12, 0x34, 0x56, 0x78).frame
+    with socket.socket(socket.AF_CAN, socket.SOCK_RAW, socket.CAN_RAW) as sock:
+        sock.bind((interface,))
+        for _ in range(frames):
+            tokens.acquire()
+            while True:
+                try:
+                    sock.send(frame)
+                    break
+                except OSError:
+                    time.sleep(0.0001)
+
+
+def bench_recv(interface: str, frames: int, uri: str) -> float:
+    """Measure the time to receive and decode frames in microseconds per frame.
+
+    Args:
+        interface: CAN interface to send the frames to.
+        frames: Number of frames to receive.
+        uri: Transport URI to receive the frames from.
+
+    Returns:
+        Average time in microseconds to receive and decode a single frame.
+
+    """
+    with Piper(uri) as piper:
+        tokens = threading.Semaphore(MAX_IN_FLIGHT)
+        thread = threading.Thread(target=flood, args=(interface, frames, tokens))
+        thread.start()
+
+        start = time.perf_counter()
+        for _ in range(frames):
+            piper.read_message()
+            tokens.release()
+        elapsed = time.perf_counter() - start
+
+        thread.join()
+
+    return elapsed / frames * 1e6
+
+
+def bench_send(frames: int, uri: str) -> float:
+    """Measure the time to encode and send joint control frames.
+
+    Args:
+        frames: Number of joint control commands to send.
+        uri: Transport URI to send the frames to.
+
+    Returns:
+        Average time in microseconds to send a single joint control command.
+
+    """
+    with Piper(uri) as piper:
+        start = time.perf_counter()
+        for i in range(frames):
+            while True:
+                try:
+                    piper.set_joint_control(i, i, i, i, i, i)
+                    break
+                except OSError:
+                    time.sleep(0.0001)
+        elapsed = time.perf_counter() - start
+
+    return elapsed / frames * 1e6
+
+
+def main() -> None:
+    """Run the transport benchmarks and print a summary table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("interface", nargs="?", default="vcan0", help="CAN interface")
+    parser.add_argument("--frames", type=int, default=100000, help="frames per run")
+    args = parser.parse_args()
+
+    sys.stdout.write(f"{'transport':<12} {'recv':>14} {'send':>14}\n")
+    for name, scheme in (("python-can", "socketcan"), ("raw socket", "raw")):
+        uri = f"{scheme}://{args.interface}"
+        recv = bench_recv(args.interface, args.frames, uri)
+        send = bench_send(args.frames, uri)
+        sys.stdout.write(f"{name:<12} {recv:>8.2f}us/msg {send:>8.2f}us/cmd\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,170 @@
 import argparse
 
-from .clear import register_clear_command
-from .disable import register_disable_command
-from .enable import register_enable_command
-from .play import register_play_command
+from ._arguments import add_fps_argument, positive_float, positive_int
+from ._lazy import lazy_command
 from .teleop import register_teleop_commands
+from .trajectory import register_trajectory_commands
+
+
+def add_fleet_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "can_interfaces",
+        nargs="*",
+        default=["can0"],
+        metavar="can_interface",
+        help="CAN interfaces or transport URIs of the arms to use concurrently",
+    )
+    parser.add_argument(
+        "-t",
+        "--timeout",
+        type=float,
+        help="maximum time in seconds to wait for each arm",
+    )
+
+
+def register_clear_command(subparsers: argparse.ArgumentParser) -> None:
+    parser = subparsers.add_parser("clear", help="clear errors of PiPER arms")
+    parser.set_defaults(func=lazy_command(f"{__name__}.clear"))
+    add_fleet_arguments(parser)
+
+
+def register_disable_command(subparsers: argparse.ArgumentParser) -> None:
+    parser = subparsers.add_parser("disable", help="disable PiPER arms")
+    parser.set_defaults(func=lazy_command(f"{__name__}.disable"))
+    add_fleet_arguments(parser)
+
+
+def register_enable_command(subparsers: argparse.ArgumentParser) -> None:
+    parser = subparsers.add_parser("enable", help="enable PiPER arms")
+    parser.set_defaults(func=lazy_command(f"{__name__}.enable"))
+    add_fleet_arguments(parser)
+
+
+def register_monitor_command(subparsers: argparse.ArgumentParser) -> None:
+    parser = subparsers.add_parser("monitor", help="show live statistics of CAN buses")
+    parser.set_defaults(func=lazy_command(f"{__name__}.monitor"))
+    parser.add_argument(
+        "can_interfaces",
+        nargs="*",
+        default=["can0"],
+        metavar="can_interface",
+        help="CAN interfaces or transport URIs of the buses to monitor",
+    )
+    parser.add_argument(
+        "-w",
+        "--window",
+        type=float,
+        default=1.0,
+        help="length in seconds of the window over which statistics are computed",
+    )
+    parser.add_argument(
+        "-b",
+        "--bitrate",
+        type=int,
+        default=1_000_000,
+        help="bitrate of the buses in bits per second, used to estimate the load",
+    )
+    add_fps_argument(parser, 5)
+
+
+def register_play_command(subparsers: argparse.ArgumentParser) -> None:
+    parser = subparsers.add_parser("play", help="play trajectories with the PiPER arm")
+    parser.set_defaults(func=lazy_command(f"{__name__}.play"))
+    parser.add_argument(
+        "csv_file",
+        help="CSV file containing trajectory data, with the columns of each arm in "
+        "turn, or a comma-separated list of one CSV file per arm",
+    )
+    parser.add_argument(
+        "can_interfaces",
+        nargs="*",
+        default=["can0"],
+        metavar="can_interface",
+        help="CAN interfaces or transport URIs of the arms to play on",
+    )
+    parser.add_argument(
+        "-s",
+        "--speed",
+        type=positive_float,
+        default=1.0,
+        help="playback speed, where 1.0 is real time",
+    )
+    parser.add_argument(
+        "--start",
+        type=float,
+        default=0.0,
+        help="time in seconds in the trajectory to start playing from",
+    )
+    parser.add_argument(
+        "--loop", action="store_true", help="restart the trajectory after it ends"
+    )
+    parser.add_argument(
+        "--max-error",
+        type=positive_float,
+        help="slow playback down while the tracking error of any joint exceeds "
+        "this many 0.001 degrees, and report the tracking errors",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        help="directory of the cache of parsed trajectories, which defaults to "
+        "piper-kit/trajectories in the user cache directory",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=positive_int,
+        default=1024,
+        help="maximum size of the cache of parsed trajectories in megabytes",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="parse the trajectories without caching them",
+    )
+
+
+def register_record_command(subparsers: argparse.ArgumentParser) -> None:
+    parser = subparsers.add_parser(
+        "record", help="record feedback of PiPER arms into an episode"
+    )
+    parser.set_defaults(func=lazy_command(f"{__name__}.record"))
+    parser.add_argument("output_dir", help="directory to write the episode into")
+    parser.add_argument(
+        "can_interfaces",
+        nargs="*",
+        default=["can0"],
+        metavar="can_interface",
+        help="CAN interfaces or transport URIs of the arms to record",
+    )
+    parser.add_argument(
+        "-r",
+        "--rate",
+        type=positive_float,
+        default=100.0,
+        help="rate in hertz at which rows are recorded",
+    )
+    parser.add_argument(
+        "-d",
+        "--duration",
+        type=positive_float,
+        help="time in seconds to record for, instead of until interrupted",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=positive_int,
+        default=1024,
+        help="number of rows written to each chunk file",
+    )
+    parser.add_argument(
+        "--no-compress",
+        action="store_true",
+        help="write .npy files that can be memory-mapped instead of .npz archives",
+    )
+    parser.add_argument(
+        "--metrics",
+        metavar="FILE",
+        help="periodically write frame and loop metrics to this file in the "
+        "Prometheus text format",
+    )
 
 
 def register_commands(parser: argparse.ArgumentParser) -> None:
@@ -13,8 +173,11 @@ def register_commands(parser: argparse.ArgumentParser) -> None:
     register_clear_command(subparsers)
     register_disable_command(subparsers)
     register_enable_command(subparsers)
+    register_monitor_command(subparsers)
     register_play_command(subparsers)
+    register_record_command(subparsers)
     register_teleop_commands(subparsers)
+    register_trajectory_commands(subparsers)
 
 
 __all__ = ["register_commands"]
@@ -0,0 +1,39 @@
+import time
+
+from cursers import ThreadedApp
+
+# Rate in hertz at which keys are polled, independent of the redraw rate.
+INPUT_RATE = 30
+
+
+class CachedApp(ThreadedApp):
+    def __init__(self, *, fps: int) -> None:
+        super().__init__(fps=max(fps, INPUT_RATE))
+        self._cells: dict[tuple[int, int], str] = {}
+        self._render_interval = 1 / fps
+        self._render_time = 0.0
+
+    def on_update(self, key: int) -> None:
+        self.on_key(key)
+        if not self.is_running():
+            return
+
+        now = time.monotonic()
+        if now >= self._render_time:
+            self._render_time = now + self._render_interval
+            self.on_render()
+
+    def on_key(self, key: int) -> None:
+        pass
+
+    def on_render(self) -> None:
+        pass
+
+    def draw_cell(self, y: int, x: int, text: str) -> None:
+        # Only touch the terminal when the text at this position actually changed.
+        if self._cells.get((y, x)) != text:
+            self._cells[(y, x)] = text
+            self.draw_text(y, x, text)
+
+
+__all__ = ["CachedApp"]
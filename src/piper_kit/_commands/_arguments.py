@@ -0,0 +1,39 @@
+import argparse
+
+
+def positive_int(value: str) -> int:
+    number = int(value)
+    if number <= 0:
+        msg = f"must be positive: {value!r}"
+        raise argparse.ArgumentTypeError(msg)
+    return number
+
+
+def positive_float(value: str) -> float:
+    number = float(value)
+    if number <= 0:
+        msg = f"must be positive: {value!r}"
+        raise argparse.ArgumentTypeError(msg)
+    return number
+
+
+def add_fps_argument(parser: argparse.ArgumentParser, default: int) -> None:
+    parser.add_argument(
+        "--fps",
+        type=positive_int,
+        default=default,
+        help="maximum rate at which the user interface is redrawn",
+    )
+
+
+def add_rate_argument(parser: argparse.ArgumentParser, default: float) -> None:
+    parser.add_argument(
+        "-r",
+        "--rate",
+        type=positive_float,
+        default=default,
+        help="rate in hertz at which setpoints are sent to the arm",
+    )
+
+
+__all__ = ["add_fps_argument", "add_rate_argument", "positive_float", "positive_int"]
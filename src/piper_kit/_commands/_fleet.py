@@ -0,0 +1,46 @@
+import sys
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
+from piper_kit import Piper
+
+# Returns the remaining time in seconds until the per-arm timeout, or None if the
+# arm has no timeout.
+Remaining = Callable[[], float | None]
+
+
+def run_on_arms(
+    uris: list[str],
+    action: Callable[[Piper, Remaining], None],
+    timeout: float | None,
+) -> None:
+    def run(uri: str) -> tuple[bool, float, str]:
+        start = time.monotonic()
+        deadline = None if timeout is None else start + timeout
+
+        def remaining() -> float | None:
+            return None if deadline is None else max(deadline - time.monotonic(), 0)
+
+        try:
+            with Piper(uri) as piper:
+                action(piper, remaining)
+        except Exception as e:  # noqa: BLE001
+            return False, time.monotonic() - start, str(e) or type(e).__name__
+
+        return True, time.monotonic() - start, "ok"
+
+    # Each arm spends most of its time blocked on its own bus, so running them in
+    # threads makes the total time that of the slowest arm.
+    with ThreadPoolExecutor(max_workers=len(uris)) as executor:
+        results = list(executor.map(run, uris))
+
+    width = max(len(uri) for uri in uris)
+    for uri, (_, elapsed, status) in zip(uris, results, strict=True):
+        sys.stdout.write(f"{uri:<{width}}  {elapsed:>6.2f}s  {status}\n")
+
+    if not all(ok for ok, _, _ in results):
+        sys.exit(1)
+
+
+__all__ = ["Remaining", "run_on_arms"]
@@ -0,0 +1,15 @@
+import argparse
+import importlib
+from collections.abc import Callable
+
+
+def lazy_command(module: str) -> Callable[[argparse.Namespace], None]:
+    # Command modules depend on python-can and cursers, which are slow to import,
+    # so the module is only imported once its command has been chosen.
+    def on_command(args: argparse.Namespace) -> None:
+        importlib.import_module(module).on_command(args)
+
+    return on_command
+
+
+__all__ = ["lazy_command"]
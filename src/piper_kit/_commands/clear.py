@@ -2,18 +2,15 @@ import argparse
 
 from piper_kit import Piper
 
+from ._fleet import Remaining, run_on_arms
 
-def on_command(args: argparse.Namespace) -> None:
-    with Piper(args.can_interface) as piper:
-        piper.set_all_joint_configs(clear_error=True)
+
+def clear(piper: Piper, _remaining: Remaining) -> None:
+    piper.set_all_joint_configs(clear_error=True)
 
 
-def register_clear_command(subparsers: argparse.ArgumentParser) -> None:
-    parser = subparsers.add_parser("clear", help="clear errors of the PiPER arm")
-    parser.set_defaults(func=on_command)
-    parser.add_argument(
-        "can_interface", nargs="?", default="can0", help="CAN interface to use"
-    )
+def on_command(args: argparse.Namespace) -> None:
+    run_on_arms(args.can_interfaces, clear, args.timeout)
 
 
-__all__ = ["register_clear_command"]
+__all__ = ["on_command"]
@@ -3,36 +3,35 @@ import time
 
 from piper_kit import Piper
 
+from ._fleet import Remaining, run_on_arms
+
 JOINT_TOLERANCE = 1000
 
 
-def on_command(args: argparse.Namespace) -> None:
-    with Piper(args.can_interface) as piper:
-        piper.set_motion_control_b("joint", 20)
-        time.sleep(0.1)
-
-        positions = [0, 0, 0, 0, 17000, 0]
-        piper.set_joint_control(*positions)
-        piper.set_gripper_control(90000, 1000)
-
-        while True:
-            feedbacks = piper.read_all_joint_feedbacks()
-            if all(
-                abs(p - f) <= JOINT_TOLERANCE
-                for p, f in zip(positions, feedbacks, strict=False)
-            ):
-                break
-
-        piper.disable_all_joints()
-        piper.disable_gripper()
-
-
-def register_disable_command(subparsers: argparse.ArgumentParser) -> None:
-    parser = subparsers.add_parser("disable", help="disable the PiPER arm")
-    parser.set_defaults(func=on_command)
-    parser.add_argument(
-        "can_interface", nargs="?", default="can0", help="CAN interface to use"
+def disable(piper: Piper, remaining: Remaining) -> None:
+    piper.set_motion_control_b("joint", 20)
+    time.sleep(0.1)
+
+    piper.set_gripper_control(90000, 1000)
+    result = piper.move_joints_to(
+        [0, 0, 0, 0, 17000, 0], tolerance=JOINT_TOLERANCE, timeout=remaining()
     )
 
+    # Leave the joints powered if the arm did not reach the safe position, since
+    # disabling them would drop the arm wherever it is.
+    if not result.settled:
+        msg = (
+            "timed out moving to safe position, joints left enabled "
+            f"(error: {result.error})"
+        )
+        raise TimeoutError(msg)
+
+    piper.disable_all_joints()
+    piper.disable_gripper()
+
+
+def on_command(args: argparse.Namespace) -> None:
+    run_on_arms(args.can_interfaces, disable, args.timeout)
+
 
-__all__ = ["register_disable_command"]
+__all__ = ["on_command"]
@@ -3,29 +3,34 @@ import time
 
 from piper_kit import Piper
 
+from ._fleet import Remaining, run_on_arms
 
-def on_command(args: argparse.Namespace) -> None:
-    with Piper(args.can_interface) as piper:
-        piper.enable_all_joints()
-
-        while True:
-            infos = piper.read_all_motor_info_bs()
-            if all(i.driver_status.driver_enabled for i in infos):
-                break
+# Time in seconds to wait for the home position when no timeout is given, so an
+# arm that stops just outside the tolerance does not block forever.
+HOME_TIMEOUT = 10.0
 
-        piper.set_motion_control_b("joint", 20)
-        time.sleep(0.1)
 
-        piper.set_joint_control(0, 0, 0, 0, 0, 0)
-        piper.set_gripper_control(45000, 1000)
+def enable(piper: Piper, remaining: Remaining) -> None:
+    piper.enable_all_joints()
+    if not piper.wait_all_joints_enabled(timeout=remaining()):
+        msg = "timed out waiting for joints to be enabled"
+        raise TimeoutError(msg)
 
+    piper.set_motion_control_b("joint", 20)
+    time.sleep(0.1)
 
-def register_enable_command(subparsers: argparse.ArgumentParser) -> None:
-    parser = subparsers.add_parser("enable", help="enable the PiPER arm")
-    parser.set_defaults(func=on_command)
-    parser.add_argument(
-        "can_interface", nargs="?", default="can0", help="CAN interface to use"
+    piper.set_gripper_control(45000, 1000)
+    timeout = remaining()
+    result = piper.move_joints_to(
+        [0, 0, 0, 0, 0, 0], timeout=HOME_TIMEOUT if timeout is None else timeout
     )
+    if not result.settled:
+        msg = f"timed out moving to home position (error: {result.error})"
+        raise TimeoutError(msg)
+
+
+def on_command(args: argparse.Namespace) -> None:
+    run_on_arms(args.can_interfaces, enable, args.timeout)
 
 
-__all__ = ["register_enable_command"]
+__all__ = ["on_command"]
@@ -0,0 +1,112 @@
+import argparse
+import time
+from contextlib import ExitStack
+
+from cursers import Thread
+
+from piper_kit.errors import EndOfReplayError
+from piper_kit.messages import RECEIVE_MESSAGE_TYPES
+from piper_kit.monitor import BusMonitor
+from piper_kit.transports import Transport, open_transport
+
+from ._app import CachedApp
+
+ESC = 0x1B
+
+# Interval in seconds between sweeps that expire IDs that stopped sending.
+EXPIRE_INTERVAL = 0.1
+
+
+class MonitorApp(CachedApp):
+    def __init__(self, monitors: dict[str, BusMonitor], *, fps: int) -> None:
+        super().__init__(fps=fps)
+        self._monitors = monitors
+
+    def on_enter(self) -> None:
+        title = "PiPER Bus Monitor"
+        self.draw_text(0, (55 - len(title)) // 2, title, bold=True)
+        self.draw_text(1, 2, "ESC - Exit monitor", bold=True)
+
+    def on_key(self, key: int) -> None:
+        if key == ESC:
+            self.exit()
+
+    def on_render(self) -> None:
+        y = 3
+        for name, monitor in self._monitors.items():
+            summary = f"load {monitor.load:>6.1%}  unknown {monitor.unknown_count:<10}"
+            self.draw_cell(y, 2, f"{name:<20} {summary}")
+
+            headers = f"{'ID':<7} {'Rate (Hz)':>10} {'Jitter (ms)':>12} {'Gaps':>8}"
+            self.draw_cell(y + 1, 4, f"{headers} {'Frames':>10}")
+
+            # Copy the table once since the bus thread may add new IDs to it.
+            for i, (arbitration_id, stats) in enumerate(
+                sorted(dict(monitor.stats).items())
+            ):
+                row = (
+                    f"0x{arbitration_id:<5X} {stats.rate:>10.1f} "
+                    f"{stats.jitter * 1000:>12.3f} {stats.gaps:>8} {stats.count:>10}"
+                )
+                self.draw_cell(y + 2 + i, 4, row)
+
+            y += len(monitor.stats) + 3
+
+
+class BusThread(Thread):
+    def __init__(
+        self, transport: Transport, monitor: BusMonitor, app: MonitorApp
+    ) -> None:
+        super().__init__()
+        self._transport = transport
+        self._monitor = monitor
+        self._app = app
+
+    def run(self) -> None:
+        expire_time = 0.0
+        # Timestamp of the last frame and when it arrived, used to advance the clock
+        # of the frame timestamps while idle, which may be a replayed log clock.
+        frame_time = None
+        arrival_time = 0.0
+        while self._app.is_running():
+            try:
+                frame = self._transport.recv(timeout=EXPIRE_INTERVAL)
+            except EndOfReplayError:
+                return
+
+            if frame is None:
+                if frame_time is not None:
+                    now = frame_time + time.monotonic() - arrival_time
+                    self._monitor.expire(now)
+                continue
+
+            frame_time = frame.timestamp
+            arrival_time = time.monotonic()
+            self._monitor.update(frame)
+            if frame.timestamp - expire_time > EXPIRE_INTERVAL:
+                self._monitor.expire(frame.timestamp)
+                expire_time = frame.timestamp
+
+
+def on_command(args: argparse.Namespace) -> None:
+    with ExitStack() as stack:
+        transports = {}
+        for uri in args.can_interfaces:
+            transports[uri] = open_transport(uri)
+            stack.callback(transports[uri].close)
+
+        monitors = {
+            uri: BusMonitor(
+                window=args.window,
+                bitrate=args.bitrate,
+                known_ids=RECEIVE_MESSAGE_TYPES,
+            )
+            for uri in transports
+        }
+
+        app = stack.enter_context(MonitorApp(monitors, fps=args.fps))
+        for uri, transport in transports.items():
+            stack.enter_context(BusThread(transport, monitors[uri], app))
+
+
+__all__ = ["on_command"]
@@ -1,81 +1,244 @@
 import argparse
-import csv
+import os
+import select
 import sys
+import termios
 import time
+import tty
+from collections.abc import Callable, Iterator
+from contextlib import ExitStack, contextmanager
 from pathlib import Path
 
 from piper_kit import Piper
-
-
-def interpolate(x0: float, y0: float, x1: float, y1: float, x: float) -> float:
-    return y0 + (y1 - y0) * (x - x0) / (x1 - x0)
+from piper_kit.cache import ArrayTrajectoryStream, TrajectoryCache
+from piper_kit.messages import (
+    JointFeedback12Message,
+    JointFeedback34Message,
+    JointFeedback56Message,
+)
+from piper_kit.stats import RunningStats
+from piper_kit.trajectory import SyncPlayer, TrackingGovernor, TrajectoryStream
+
+# Factor by which the speed keys change the playback speed.
+SPEED_STEP = 1.25
+
+# Seconds by which the seek keys move through the trajectory.
+SEEK_STEP = 5.0
+
+# Joint feedback message types mapped to the index of their first joint and the
+# attribute names of their joints.
+JOINT_FEEDBACKS = {
+    JointFeedback12Message: (0, ("joint_1", "joint_2")),
+    JointFeedback34Message: (2, ("joint_3", "joint_4")),
+    JointFeedback56Message: (4, ("joint_5", "joint_6")),
+}
+
+
+def send_positions(
+    pipers: list[Piper], positions: list[tuple[list[float], float]]
+) -> float:
+    # Sends each frame to every arm before the next frame, so the arms receive
+    # their complete setpoints at most one frame apart, and returns the skew in
+    # seconds between the first and the last arm to receive theirs.
+    for piper, (joints, gripper) in zip(pipers, positions, strict=True):
+        # Checks all joints and the gripper against the safety envelope before
+        # any are sent.
+        if piper.safety is not None:
+            piper.safety.check_joints(0, [round(j) for j in joints])
+            piper.safety.check_gripper(round(gripper))
+        piper.set_motion_control_b("joint", 100)
+    for piper, (joints, _) in zip(pipers, positions, strict=True):
+        piper.set_joint_control_12(round(joints[0]), round(joints[1]))
+    for piper, (joints, _) in zip(pipers, positions, strict=True):
+        piper.set_joint_control_34(round(joints[2]), round(joints[3]))
+    for piper, (joints, _) in zip(pipers, positions, strict=True):
+        piper.set_joint_control_56(round(joints[4]), round(joints[5]))
+
+    times = []
+    for piper, (_, gripper) in zip(pipers, positions, strict=True):
+        piper.set_gripper_control(round(gripper), 1000)
+        times.append(time.perf_counter())
+
+    return times[-1] - times[0]
+
+
+def read_joint_feedbacks(piper: Piper, joints: list[int | None]) -> None:
+    # Updates the joint positions from all feedback received since the last tick,
+    # without waiting for more.
+    while (msg := piper.read_message(timeout=0)) is not None:
+        feedback = JOINT_FEEDBACKS.get(type(msg))
+        if feedback is not None:
+            index, names = feedback
+            for i, name in enumerate(names, index):
+                joints[i] = getattr(msg, name)
+
+
+def tracking_scale(
+    pipers: list[Piper],
+    governors: list[TrackingGovernor],
+    feedbacks: list[list[int | None]],
+    positions: list[tuple[list[float], float]],
+) -> float:
+    # Slows the trajectory clock down to the arm that lags the most behind the
+    # setpoints sent on the previous tick.
+    scale = 1.0
+    for piper, governor, joints, (targets, _) in zip(
+        pipers, governors, feedbacks, positions, strict=True
+    ):
+        read_joint_feedbacks(piper, joints)
+        scale = min(scale, governor.update(targets, joints))
+    return scale
+
+
+def write_report(
+    uris: list[str], skew: RunningStats, governors: list[TrackingGovernor] | None
+) -> None:
+    if len(uris) > 1:
+        sys.stdout.write(
+            f"skew between arms over {skew.count} ticks: "
+            f"mean {skew.mean * 1000:.3f} ms, std {skew.std * 1000:.3f} ms, "
+            f"max {max(skew.max, 0) * 1000:.3f} ms\n"
+        )
+
+    for uri, governor in zip(uris, governors or [], strict=False):
+        sys.stdout.write(f"tracking error of {uri} in degrees:\n")
+        for joint, stats in enumerate(governor.errors, 1):
+            worst = max(abs(stats.min), abs(stats.max)) if stats.count > 0 else 0
+            sys.stdout.write(
+                f"  J{joint}: mean {stats.mean / 1000:>8.3f}  "
+                f"std {stats.std / 1000:>8.3f}  max {worst / 1000:>8.3f}\n"
+            )
+
+
+def open_cache(args: argparse.Namespace) -> TrajectoryCache | None:
+    if args.no_cache:
+        return None
+
+    directory = args.cache_dir
+    if directory is None:
+        base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+        directory = Path(base) / "piper-kit" / "trajectories"
+    return TrajectoryCache(directory, max_size=args.cache_size * 1024 * 1024)
+
+
+def open_arms(
+    csv_file: str, arms: list[int | None], cache: TrajectoryCache | None
+) -> list[TrajectoryStream | ArrayTrajectoryStream]:
+    if cache is None:
+        return [TrajectoryStream(csv_file, arm=arm) for arm in arms]
+    return cache.open(csv_file, arms)
+
+
+def open_streams(
+    csv_file: str, arms: int, cache: TrajectoryCache | None
+) -> list[TrajectoryStream | ArrayTrajectoryStream]:
+    # Either one file per arm separated by commas, or one file with the columns
+    # of every arm in turn, which is parsed once for all of them.
+    files = csv_file.split(",")
+    if len(files) > 1:
+        return [stream for file in files for stream in open_arms(file, [None], cache)]
+    if arms > 1:
+        return open_arms(csv_file, list(range(arms)), cache)
+    return open_arms(csv_file, [None], cache)
+
+
+@contextmanager
+def keyboard() -> Iterator[Callable[[], str | None]]:
+    # Yields a function that returns a pressed key without blocking, or None. Keys
+    # are only read when the standard input is a terminal.
+    if not sys.stdin.isatty():
+        yield lambda: None
+        return
+
+    fd = sys.stdin.fileno()
+    attributes = termios.tcgetattr(fd)
+    tty.setcbreak(fd)
+    try:
+        yield lambda: (
+            os.read(fd, 1).decode(errors="ignore")
+            if select.select([fd], [], [], 0)[0]
+            else None
+        )
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, attributes)
+
+
+def handle_key(player: SyncPlayer, key: str) -> None:
+    match key:
+        case " ":
+            if player.paused:
+                player.resume()
+            else:
+                player.pause()
+        case "+" | "=":
+            player.speed *= SPEED_STEP
+        case "-":
+            player.speed /= SPEED_STEP
+        case "]":
+            player.seek(player.time + SEEK_STEP)
+        case "[":
+            player.seek(max(player.time - SEEK_STEP, 0))
+        case _:
+            return
+
+    state = "paused" if player.paused else "playing"
+    sys.stdout.write(f"{state} at {player.time:.1f}s, speed {player.speed:.2f}x\n")
 
 
 def on_command(args: argparse.Namespace) -> None:
     sys.stdout.write("initializing...\n")
-    with (
-        Piper(args.can_interface) as piper,
-        Path(args.csv_file).open() as csv_file,
-    ):
-        reader = csv.reader(csv_file)
+    with ExitStack() as stack:
+        pipers = [stack.enter_context(Piper(uri)) for uri in args.can_interfaces]
+        streams = open_streams(args.csv_file, len(pipers), open_cache(args))
+        for stream in streams:
+            stack.enter_context(stream)
+        if len(streams) != len(pipers):
+            msg = f"got {len(streams)} trajectory files for {len(pipers)} arms"
+            raise SystemExit(msg)
+        read_key = stack.enter_context(keyboard())
 
         sys.stdout.write("reading joint and gripper positions...\n")
-        prev_joints = piper.read_all_joint_feedbacks()
-        prev_gripper = piper.read_gripper_feedback().position
-        next_joints = prev_joints
-        next_gripper = prev_gripper
-
-        try:
-            prev_t = time.time()
-            dt = 0
-            max_dt = 0
-            while True:
-                t = time.time()
-                dt += t - prev_t
-                prev_t = t
-
-                while dt >= max_dt:
-                    dt -= max_dt
-
-                    prev_joints = next_joints
-                    prev_gripper = next_gripper
-
-                    row = next(reader)
-                    max_dt = float(row[0])
-                    next_joints = [float(v) for v in row[1:7]]
-                    next_gripper = float(row[7])
-
-                    sys.stdout.write(
-                        f"next target: {[max_dt, *next_joints, next_gripper]}\n"
-                    )
-
-                joints = [
-                    interpolate(0, prev_joints[i], max_dt, next_joints[i], dt)
-                    for i in range(6)
-                ]
-                gripper = interpolate(0, prev_gripper, max_dt, next_gripper, dt)
-
-                piper.set_motion_control_b("joint", 100)
-                piper.set_joint_control(*(round(j) for j in joints))
-                piper.set_gripper_control(round(gripper), 1000)
-
-                time.sleep(1 / 100)
-
-        except StopIteration:
-            piper.set_motion_control_b("joint", 100)
-            piper.set_joint_control(*(round(j) for j in prev_joints))
-            piper.set_gripper_control(round(prev_gripper), 1000)
-
+        player = SyncPlayer(
+            streams,
+            [
+                (
+                    piper.read_all_joint_feedbacks(),
+                    piper.read_gripper_feedback().position,
+                )
+                for piper in pipers
+            ],
+            speed=args.speed,
+            loop=args.loop,
+        )
+        if args.start > 0:
+            player.seek(args.start)
+
+        sys.stdout.write(
+            "playing trajectories "
+            "(space: pause/resume, +/-: speed, [/]: seek back/forward)...\n"
+        )
+        governors = None
+        if args.max_error is not None:
+            governors = [TrackingGovernor(args.max_error) for _ in pipers]
+        feedbacks = [[None] * 6 for _ in pipers]
+
+        skew = RunningStats()
+        positions = player.sample()
+        while not player.finished:
+            key = read_key()
+            if key is not None:
+                handle_key(player, key)
+
+            if governors is not None:
+                player.scale = tracking_scale(pipers, governors, feedbacks, positions)
+
+            positions = player.sample()
+            skew.update(send_positions(pipers, positions))
+            time.sleep(1 / 100)
+
+        send_positions(pipers, player.sample())
         sys.stdout.write("finished playing trajectories\n")
+        write_report(args.can_interfaces, skew, governors)
 
 
-def register_play_command(subparsers: argparse.ArgumentParser) -> None:
-    parser = subparsers.add_parser("play", help="play trajectories with the PiPER arm")
-    parser.set_defaults(func=on_command)
-    parser.add_argument("csv_file", help="CSV file containing trajectory data")
-    parser.add_argument(
-        "can_interface", nargs="?", default="can0", help="CAN interface to use"
-    )
-
-
-__all__ = ["register_play_command"]
+__all__ = ["on_command"]
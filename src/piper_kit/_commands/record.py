@@ -0,0 +1,94 @@
+import argparse
+import sys
+import threading
+import time
+from contextlib import ExitStack, suppress
+
+from piper_kit import Piper
+from piper_kit.metrics import Metrics, PrometheusExporter
+from piper_kit.recorder import EpisodeRecorder
+
+# Seconds the reader threads wait for a message before checking whether to stop.
+READ_TIMEOUT = 0.1
+
+# Seconds between snapshots written by the metrics exporter.
+EXPORT_INTERVAL = 1.0
+
+
+def read_arm(
+    piper: Piper, recorder: EpisodeRecorder, arm: int, stop: threading.Event
+) -> None:
+    while not stop.is_set():
+        msg = piper.read_message(timeout=READ_TIMEOUT)
+        if msg is not None:
+            recorder.update(arm, msg)
+
+
+def sample_rows(
+    recorder: EpisodeRecorder,
+    args: argparse.Namespace,
+    metrics: Metrics | None,
+    exporter: PrometheusExporter | None,
+) -> None:
+    start = time.monotonic()
+    deadline = None if args.duration is None else start + args.duration
+    export_time = start
+
+    # Ticks are scheduled from the start so that the rate does not drift.
+    tick = 0
+    while deadline is None or time.monotonic() < deadline:
+        recorder.sample()
+        tick += 1
+
+        now = time.monotonic()
+        if exporter is not None and now >= export_time:
+            exporter.write()
+            export_time += EXPORT_INTERVAL
+
+        delay = start + tick / args.rate - now
+        if delay < 0 and metrics is not None:
+            metrics.loop_overrun("record", -delay)
+        time.sleep(max(delay, 0))
+
+
+def on_command(args: argparse.Namespace) -> None:
+    metrics = exporter = None
+    if args.metrics is not None:
+        metrics = Metrics()
+        exporter = PrometheusExporter(metrics, args.metrics)
+
+    with ExitStack() as stack:
+        pipers = [
+            stack.enter_context(Piper(uri, metrics=metrics))
+            for uri in args.can_interfaces
+        ]
+        recorder = stack.enter_context(
+            EpisodeRecorder(
+                args.output_dir,
+                args.can_interfaces,
+                chunk_size=args.chunk_size,
+                compress=not args.no_compress,
+            )
+        )
+
+        # Stop the reader threads before the recorder is closed.
+        stop = threading.Event()
+        for arm, piper in enumerate(pipers):
+            thread = threading.Thread(
+                target=read_arm, args=(piper, recorder, arm, stop)
+            )
+            thread.start()
+            stack.callback(thread.join)
+        stack.callback(stop.set)
+
+        sys.stdout.write("recording (Ctrl+C: stop)...\n")
+        with suppress(KeyboardInterrupt):
+            sample_rows(recorder, args, metrics, exporter)
+
+        sys.stdout.write(f"recorded {recorder.rows} rows into {args.output_dir}\n")
+
+    if exporter is not None:
+        exporter.write()
+
+
+__all__ = ["on_command"]
@@ -1,8 +1,64 @@
 import argparse
 
-from .end_pose import register_end_pose_command
-from .follow import register_follow_command
-from .joint import register_joint_command
+from piper_kit._commands._arguments import add_fps_argument, add_rate_argument
+from piper_kit._commands._lazy import lazy_command
+
+
+def register_end_pose_command(subparsers: argparse.ArgumentParser) -> None:
+    parser = subparsers.add_parser(
+        "end_pose", help="teleop the end-effector pose of PiPER arm"
+    )
+    parser.set_defaults(func=lazy_command(f"{__name__}.end_pose"))
+    parser.add_argument(
+        "can_interface",
+        nargs="?",
+        default="can0",
+        help="CAN interface or transport URI to use",
+    )
+    add_fps_argument(parser, 20)
+    add_rate_argument(parser, 100)
+
+
+def register_follow_command(subparsers: argparse.ArgumentParser) -> None:
+    parser = subparsers.add_parser(
+        "follow", help="teleop the follower PiPER arm using the leader PiPER arm"
+    )
+    parser.set_defaults(func=lazy_command(f"{__name__}.follow"))
+    parser.add_argument(
+        "leader_can",
+        help="CAN interface or transport URI of the leader, or udp://HOST:PORT to "
+        "listen on for a remote leader",
+    )
+    parser.add_argument(
+        "follower_can",
+        nargs="?",
+        default="can0",
+        help="CAN interface or transport URI of the follower, or udp://HOST:PORT "
+        "of a remote follower",
+    )
+    parser.add_argument(
+        "--remote",
+        action="store_true",
+        help="teleop an arm on another host, streaming the state of the leader "
+        "over UDP",
+    )
+    add_fps_argument(parser, 20)
+    add_rate_argument(parser, 100)
+
+
+def register_joint_command(subparsers: argparse.ArgumentParser) -> None:
+    parser = subparsers.add_parser(
+        "joint", help="teleop the joint positions of PiPER arm"
+    )
+    parser.set_defaults(func=lazy_command(f"{__name__}.joint"))
+    parser.add_argument(
+        "can_interface",
+        nargs="?",
+        default="can0",
+        help="CAN interface or transport URI to use",
+    )
+    add_fps_argument(parser, 20)
+    add_rate_argument(parser, 100)
 
 
 def register_teleop_commands(subparsers: argparse.ArgumentParser) -> None:
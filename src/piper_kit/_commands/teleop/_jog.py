@@ -0,0 +1,37 @@
+import time
+from collections.abc import Callable
+
+from cursers import Thread
+
+from piper_kit._commands._app import CachedApp
+from piper_kit.jog import JogController
+
+# Seconds the main loop waits for a message before checking whether to stop.
+READ_TIMEOUT = 0.1
+
+
+class JogThread(Thread):
+    def __init__(
+        self,
+        app: CachedApp,
+        jog: JogController,
+        send: Callable[[tuple[int, ...]], None],
+        rate: float,
+    ) -> None:
+        super().__init__()
+        self._app = app
+        self._jog = jog
+        self._send = send
+        self._rate = rate
+
+    def run(self) -> None:
+        # Ticks are scheduled from the start so that the rate does not drift.
+        start = time.monotonic()
+        tick = 0
+        while self._app.is_running():
+            self._send(self._jog.step())
+            tick += 1
+            time.sleep(max(start + tick / self._rate - time.monotonic(), 0))
+
+
+__all__ = ["READ_TIMEOUT", "JogThread"]
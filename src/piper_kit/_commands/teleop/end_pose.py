@@ -1,25 +1,49 @@
 import argparse
-
-from cursers import ThreadedApp
+from functools import partial
 
 from piper_kit import Piper
-from piper_kit.messages import GripperFeedbackMessage
-
-
-class TeleopEndPoseApp(ThreadedApp):
-    def __init__(self) -> None:
-        super().__init__()
-
-        self.target_x = 50000
-        self.target_y = 0
-        self.target_z = 260000
-
-        self.target_pitch = -90000
-        self.target_roll = 0
-        self.target_yaw = -90000
-
-        self.current_gripper = 0
-        self.target_gripper = 0
+from piper_kit._commands._app import CachedApp
+from piper_kit._commands.teleop._jog import READ_TIMEOUT, JogThread
+from piper_kit.jog import JogController
+from piper_kit.state import ArmStateTracker
+
+ESC = 0x1B
+
+# Keys mapped to the index of the target they move and the direction to move it in.
+JOG_KEYS = {
+    "w": (0, 1),
+    "s": (0, -1),
+    "a": (1, 1),
+    "d": (1, -1),
+    "q": (2, -1),
+    "e": (2, 1),
+    "i": (3, 1),
+    "k": (3, -1),
+    "u": (4, -1),
+    "o": (4, 1),
+    "j": (5, 1),
+    "l": (5, -1),
+    "f": (6, 1),
+    "h": (6, -1),
+}
+
+# Maximum velocity and acceleration of the position in 0.001 mm, of the rotation
+# in 0.001 degrees, and of the gripper in 0.001 mm, per second.
+JOG_VELOCITY = (50000,) * 3 + (30000,) * 3 + (20000,)
+JOG_ACCELERATION = (100000,) * 3 + (60000,) * 3 + (40000,)
+JOG_LIMITS = (None,) * 6 + ((0, 70000),)
+
+
+class TeleopEndPoseApp(CachedApp):
+    def __init__(
+        self, jog: JogController, tracker: ArmStateTracker, *, fps: int
+    ) -> None:
+        super().__init__(fps=fps)
+
+        # The jog controller targets the pose (x, y, z, pitch, roll, yaw) followed
+        # by the gripper position.
+        self.jog = jog
+        self.tracker = tracker
 
     def on_enter(self) -> None:
         title = "PiPER End-Effector Pose Teleoperation"
@@ -43,78 +67,44 @@ class TeleopEndPoseApp(ThreadedApp):
         self.draw_text(20, 4, "F/H - Open/close gripper")
         self.draw_text(22, 4, "ESC - Exit teleoperation", bold=True)
 
-    def on_update(self, key: int) -> None:  # noqa: C901, PLR0912
-        match chr(key) if key != -1 else None:
-            case "\x1b":  # ESC
-                self.exit()
-                return
-            case "w" | "W":
-                self.target_x += 5000
-            case "s" | "S":
-                self.target_x -= 5000
-            case "a" | "A":
-                self.target_y += 5000
-            case "d" | "D":
-                self.target_y -= 5000
-            case "q" | "Q":
-                self.target_z -= 5000
-            case "e" | "E":
-                self.target_z += 5000
-            case "i" | "I":
-                self.target_pitch += 5000
-            case "k" | "K":
-                self.target_pitch -= 5000
-            case "j" | "J":
-                self.target_yaw += 5000
-            case "l" | "L":
-                self.target_yaw -= 5000
-            case "u" | "U":
-                self.target_roll -= 5000
-            case "o" | "O":
-                self.target_roll += 5000
-            case "f" | "F":
-                self.target_gripper += 5000
-            case "h" | "H":
-                self.target_gripper -= 5000
-
-        text = f"{self.target_x:>8} {self.target_y:>8} {self.target_z:>8}"
-        self.draw_text(4, 22, text)
-
-        text = f"{self.target_pitch:>8} {self.target_roll:>8} {self.target_yaw:>8}"
-        self.draw_text(5, 22, text)
-
-        self.draw_text(8, 22, f"{self.target_gripper:>8}")
-        self.draw_text(9, 22, f"{self.current_gripper:>8}")
+    def on_key(self, key: int) -> None:
+        if key == ESC:
+            self.exit()
+            return
+
+        jog = JOG_KEYS.get(chr(key).lower()) if key != -1 else None
+        if jog is not None:
+            self.jog.press(*jog)
+
+    def on_render(self) -> None:
+        # Read each shared value once, so the frame is drawn from complete updates.
+        x, y, z, pitch, roll, yaw, gripper = self.jog.positions
+        self.draw_cell(4, 22, f"{x:>8} {y:>8} {z:>8}")
+        self.draw_cell(5, 22, f"{pitch:>8} {roll:>8} {yaw:>8}")
+        self.draw_cell(8, 22, f"{gripper:>8}")
+        self.draw_cell(9, 22, f"{self.tracker.state.gripper:>8}")
+
+
+def send_end_pose_targets(piper: Piper, targets: tuple[int, ...]) -> None:
+    piper.set_motion_control_b("end_pose", 100)
+    piper.set_end_pose_control(*targets[0:6])
+    piper.set_gripper_control(targets[6], 1000)
 
 
 def on_command(args: argparse.Namespace) -> None:
-    with Piper(args.can_interface) as piper, TeleopEndPoseApp() as app:
-        while app.is_running():
-            match piper.read_message():
-                case GripperFeedbackMessage() as msg:
-                    app.current_gripper = msg.position
-
-                    piper.set_motion_control_b("end_pose", 20)
-                    piper.set_end_pose_control(
-                        app.target_x,
-                        app.target_y,
-                        app.target_z,
-                        app.target_pitch,
-                        app.target_roll,
-                        app.target_yaw,
-                    )
-
-                    piper.set_gripper_control(app.target_gripper, 1000)
-
-
-def register_end_pose_command(subparsers: argparse.ArgumentParser) -> None:
-    parser = subparsers.add_parser(
-        "end_pose", help="teleop the end-effector pose of PiPER arm"
-    )
-    parser.set_defaults(func=on_command)
-    parser.add_argument(
-        "can_interface", nargs="?", default="can0", help="CAN interface to use"
+    jog = JogController(
+        (50000, 0, 260000, -90000, 0, -90000, 0),
+        JOG_VELOCITY,
+        JOG_ACCELERATION,
+        limits=JOG_LIMITS,
     )
+    with (
+        Piper(args.can_interface) as piper,
+        TeleopEndPoseApp(jog, ArmStateTracker(piper), fps=args.fps) as app,
+        JogThread(app, jog, partial(send_end_pose_targets, piper), args.rate),
+    ):
+        while app.is_running():
+            piper.read_message(timeout=READ_TIMEOUT)
 
 
-__all__ = ["register_end_pose_command"]
+__all__ = ["on_command"]
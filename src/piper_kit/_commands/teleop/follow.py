@@ -1,22 +1,52 @@
 import argparse
+import sys
+import time
+from urllib.parse import urlsplit
 
-from cursers import Thread, ThreadedApp
+from cursers import Thread
 
 from piper_kit import Piper
+from piper_kit._commands._app import CachedApp
+from piper_kit._commands.teleop._jog import READ_TIMEOUT
+from piper_kit._commands.teleop.joint import send_joint_targets
 from piper_kit.messages import (
     GripperFeedbackMessage,
     JointFeedback12Message,
     JointFeedback34Message,
     JointFeedback56Message,
 )
+from piper_kit.remote import StateReceiver, StateSender
+from piper_kit.state import ArmState, ArmStateTracker
 
+ESC = 0x1B
+
+
+class RemoteLeader:
+    def __init__(self, receiver: StateReceiver) -> None:
+        self.receiver = receiver
+        self.state = ArmState()
+
+    def sample(self) -> tuple[int, ...] | None:
+        positions = self.receiver.sample()
+        if positions is not None:
+            self.state = self.state.replace(joints=positions[0:6], gripper=positions[6])
+        return positions
 
-class TeleopFollowApp(ThreadedApp):
-    def __init__(self) -> None:
-        super().__init__()
 
-        self.leader_pos = [0, 0, 0, 0, 0, 0, 0]
-        self.follower_pos = [0, 0, 0, 0, 0, 0, 0]
+class TeleopFollowApp(CachedApp):
+    def __init__(
+        self,
+        leader: ArmStateTracker | RemoteLeader,
+        follower: ArmStateTracker | None,
+        *,
+        fps: int,
+        link: StateReceiver | StateSender | None = None,
+    ) -> None:
+        super().__init__(fps=fps)
+
+        self.leader = leader
+        self.follower = follower
+        self.link = link
 
     def on_enter(self) -> None:
         title = "PiPER Leader-Follower Teleoperation"
@@ -38,18 +68,39 @@ class TeleopFollowApp(ThreadedApp):
         self.draw_text(13, 2, "Keyboard Controls:", bold=True)
         self.draw_text(14, 4, "ESC - Exit teleoperation", bold=True)
 
-    def on_update(self, key: int) -> None:
-        match chr(key) if key != -1 else None:
-            case "\x1b":  # ESC
-                self.exit()
-                return
-
-        for i in range(6):
-            diff = self.leader_pos[i] - self.follower_pos[i]
-            info = f"{self.leader_pos[i]:<12} {self.follower_pos[i]:<12} {diff:<10}"
-            self.draw_text(5 + i, 18, info)
-
-        self.draw_text(11, 18, info)
+    def on_key(self, key: int) -> None:
+        if key == ESC:
+            self.exit()
+
+    def on_render(self) -> None:
+        # Both snapshots are immutable, so every row of this frame is drawn from the
+        # same cycle of each arm even while the CAN threads publish new ones.
+        leader_state = self.leader.state
+        leaders = (*leader_state.joints, leader_state.gripper)
+        if self.follower is None:
+            for i, leader in enumerate(leaders):
+                self.draw_cell(5 + i, 18, f"{leader:<12} {'remote':<12} {'':<10}")
+        else:
+            follower_state = self.follower.state
+            followers = (*follower_state.joints, follower_state.gripper)
+            for i, (leader, follower) in enumerate(
+                zip(leaders, followers, strict=True)
+            ):
+                self.draw_cell(
+                    5 + i, 18, f"{leader:<12} {follower:<12} {leader - follower:<10}"
+                )
+
+        if isinstance(self.link, StateReceiver):
+            buffer = self.link.buffer
+            self.draw_cell(
+                12,
+                2,
+                f"Latency: {self.link.latency.mean * 1000:>7.1f} ms  "
+                f"Buffer: {buffer.delay * 1000:>6.1f} ms  "
+                f"Lost: {buffer.lost:<6} Late: {buffer.late:<6}",
+            )
+        elif isinstance(self.link, StateSender):
+            self.draw_cell(12, 2, f"Sent: {self.link.sequence} packets")
 
 
 class FollowerThread(Thread):
@@ -60,68 +111,135 @@ class FollowerThread(Thread):
 
     def run(self) -> None:
         while self._app.is_running():
-            match self._follower.read_message():
-                case JointFeedback12Message() as msg:
-                    self._app.follower_pos[0] = msg.joint_1
-                    self._app.follower_pos[1] = msg.joint_2
+            self._follower.read_message()
 
-                case JointFeedback34Message() as msg:
-                    self._app.follower_pos[2] = msg.joint_3
-                    self._app.follower_pos[3] = msg.joint_4
 
-                case JointFeedback56Message() as msg:
-                    self._app.follower_pos[4] = msg.joint_5
-                    self._app.follower_pos[5] = msg.joint_6
+def subscribe_leader_follow(leader: Piper, follower: Piper) -> None:
+    def on_joints_12(msg: JointFeedback12Message) -> None:
+        follower.set_motion_control_b("joint", 100)
+        follower.set_joint_control_12(msg.joint_1, msg.joint_2)
 
-                case GripperFeedbackMessage() as msg:
-                    self._app.follower_pos[6] = msg.position
+    def on_joints_34(msg: JointFeedback34Message) -> None:
+        follower.set_joint_control_34(msg.joint_3, msg.joint_4)
 
+    def on_joints_56(msg: JointFeedback56Message) -> None:
+        follower.set_joint_control_56(msg.joint_5, msg.joint_6)
 
-def on_command(args: argparse.Namespace) -> None:
+    def on_gripper(msg: GripperFeedbackMessage) -> None:
+        follower.set_gripper_control(msg.position, 1000)
+
+    leader.on(JointFeedback12Message, on_joints_12)
+    leader.on(JointFeedback34Message, on_joints_34)
+    leader.on(JointFeedback56Message, on_joints_56)
+    leader.on(GripperFeedbackMessage, on_gripper)
+
+
+class RemoteFollowerThread(Thread):
+    def __init__(
+        self, leader: RemoteLeader, follower: Piper, app: TeleopFollowApp, rate: float
+    ) -> None:
+        super().__init__()
+        self._leader = leader
+        self._follower = follower
+        self._app = app
+        self._rate = rate
+
+    def run(self) -> None:
+        # Packets are read as they arrive, so the jitter buffer sees their true
+        # arrival times, while setpoints are played back at a fixed rate.
+        start = time.monotonic()
+        tick = 0
+        while self._app.is_running():
+            deadline = start + tick / self._rate
+            self._leader.receiver.poll(max(deadline - time.monotonic(), 0))
+            if time.monotonic() < deadline:
+                continue
+
+            positions = self._leader.sample()
+            if positions is not None:
+                send_joint_targets(self._follower, positions)
+            tick += 1
+
+
+def parse_remote_address(uri: str) -> tuple[str, int] | None:
+    parts = urlsplit(uri)
+    if parts.scheme != "udp":
+        return None
+    return parts.hostname or "0.0.0.0", parts.port  # noqa: S104
+
+
+def write_link_report(receiver: StateReceiver) -> None:
+    latency, buffer = receiver.latency, receiver.buffer
+    expected = buffer.received + buffer.lost
+    loss = buffer.lost / expected if expected > 0 else 0.0
+    sys.stdout.write(
+        f"latency over {latency.count} packets: "
+        f"mean {latency.mean * 1000:.3f} ms, std {latency.std * 1000:.3f} ms, "
+        f"max {max(latency.max, 0) * 1000:.3f} ms\n"
+        f"packets: {buffer.received} received, {buffer.lost} lost "
+        f"({loss:.2%}), {buffer.late} late, {receiver.invalid} invalid\n"
+    )
+
+
+def run_remote_leader(args: argparse.Namespace, address: tuple[str, int]) -> None:
     with (
         Piper(args.leader_can) as leader,
-        Piper(args.follower_can) as follower,
-        TeleopFollowApp() as app,
-        FollowerThread(follower, app),
+        StateSender(address) as sender,
     ):
-        while app.is_running():
-            match leader.read_message():
-                case JointFeedback12Message() as msg:
-                    app.leader_pos[0] = msg.joint_1
-                    app.leader_pos[1] = msg.joint_2
+        tracker = ArmStateTracker(leader)
 
-                    follower.set_motion_control_b("joint", 100)
-                    follower.set_joint_control_12(msg.joint_1, msg.joint_2)
+        # Subscribed after the tracker, so it sends the cycle just published.
+        def on_joints_56(_: JointFeedback56Message) -> None:
+            state = tracker.state
+            sender.send((*state.joints, state.gripper))
 
-                case JointFeedback34Message() as msg:
-                    app.leader_pos[2] = msg.joint_3
-                    app.leader_pos[3] = msg.joint_4
+        leader.on(JointFeedback56Message, on_joints_56)
+        with TeleopFollowApp(tracker, None, fps=args.fps, link=sender) as app:
+            while app.is_running():
+                leader.read_message(timeout=READ_TIMEOUT)
 
-                    follower.set_joint_control_34(msg.joint_3, msg.joint_4)
 
-                case JointFeedback56Message() as msg:
-                    app.leader_pos[4] = msg.joint_5
-                    app.leader_pos[5] = msg.joint_6
+def run_remote_follower(args: argparse.Namespace, address: tuple[str, int]) -> None:
+    with (
+        Piper(args.follower_can) as follower,
+        StateReceiver(address) as receiver,
+    ):
+        leader = RemoteLeader(receiver)
+        with (
+            TeleopFollowApp(
+                leader, ArmStateTracker(follower), fps=args.fps, link=receiver
+            ) as app,
+            RemoteFollowerThread(leader, follower, app, args.rate),
+        ):
+            while app.is_running():
+                follower.read_message(timeout=READ_TIMEOUT)
 
-                    follower.set_joint_control_56(msg.joint_5, msg.joint_6)
+        write_link_report(receiver)
 
-                case GripperFeedbackMessage() as msg:
-                    app.leader_pos[6] = msg.position
-                    follower.set_gripper_control(msg.position, 1000)
 
+def on_command(args: argparse.Namespace) -> None:
+    if args.remote:
+        leader_address = parse_remote_address(args.leader_can)
+        follower_address = parse_remote_address(args.follower_can)
+        if leader_address is not None and follower_address is None:
+            run_remote_follower(args, leader_address)
+        elif follower_address is not None and leader_address is None:
+            run_remote_leader(args, follower_address)
+        else:
+            sys.exit("--remote requires exactly one arm at a udp://HOST:PORT address")
+        return
 
-def register_follow_command(subparsers: argparse.ArgumentParser) -> None:
-    parser = subparsers.add_parser(
-        "follow", help="teleop the follower PiPER arm using the leader PiPER arm"
-    )
-    parser.set_defaults(func=on_command)
-    parser.add_argument("leader_can", help="CAN interface of the leader to use")
-    parser.add_argument(
-        "follower_can",
-        nargs="?",
-        default="can0",
-        help="CAN interface of the follower to use",
-    )
+    with (
+        Piper(args.leader_can) as leader,
+        Piper(args.follower_can) as follower,
+        TeleopFollowApp(
+            ArmStateTracker(leader), ArmStateTracker(follower), fps=args.fps
+        ) as app,
+    ):
+        subscribe_leader_follow(leader, follower)
+        with FollowerThread(follower, app):
+            while app.is_running():
+                leader.read_message()
 
 
-__all__ = ["register_follow_command"]
+__all__ = ["on_command"]
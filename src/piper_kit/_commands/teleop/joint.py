@@ -1,22 +1,48 @@
 import argparse
-
-from cursers import ThreadedApp
+from functools import partial
 
 from piper_kit import Piper
-from piper_kit.messages import (
-    GripperFeedbackMessage,
-    JointFeedback12Message,
-    JointFeedback34Message,
-    JointFeedback56Message,
-)
-
-
-class TeleopJointApp(ThreadedApp):
-    def __init__(self) -> None:
-        super().__init__()
-
-        self.current_pos = [0, 0, 0, 0, 0, 0, 0]
-        self.target_pos = [0, 0, 0, 0, 0, 0, 45000]
+from piper_kit._commands._app import CachedApp
+from piper_kit._commands.teleop._jog import READ_TIMEOUT, JogThread
+from piper_kit.jog import JogController
+from piper_kit.safety import JOINT_LIMITS
+from piper_kit.state import ArmStateTracker
+
+ESC = 0x1B
+
+# Keys mapped to the index of the target they move and the direction to move it in.
+JOG_KEYS = {
+    "a": (0, 1),
+    "d": (0, -1),
+    "w": (1, 1),
+    "s": (1, -1),
+    "i": (2, -1),
+    "k": (2, 1),
+    "j": (3, -1),
+    "l": (3, 1),
+    "q": (4, 1),
+    "e": (4, -1),
+    "u": (5, -1),
+    "o": (5, 1),
+    "f": (6, 1),
+    "h": (6, -1),
+}
+
+# Maximum velocity and acceleration of the joints in 0.001 degrees, and of the
+# gripper in 0.001 mm, per second.
+JOG_VELOCITY = (30000,) * 6 + (20000,)
+JOG_ACCELERATION = (60000,) * 6 + (40000,)
+JOG_LIMITS = (*JOINT_LIMITS, (0, 70000))
+
+
+class TeleopJointApp(CachedApp):
+    def __init__(
+        self, jog: JogController, tracker: ArmStateTracker, *, fps: int
+    ) -> None:
+        super().__init__(fps=fps)
+
+        self.jog = jog
+        self.tracker = tracker
 
     def on_enter(self) -> None:
         title = "PiPER Joint Teleoperation"
@@ -45,84 +71,43 @@ class TeleopJointApp(ThreadedApp):
         self.draw_text(20, 4, "Gripper:       F/H - Open/close")
         self.draw_text(22, 4, "ESC - Exit teleoperation", bold=True)
 
-    def on_update(self, key: int) -> None:  # noqa: C901, PLR0912
-        match chr(key) if key != -1 else None:
-            case "\x1b":  # ESC
-                self.exit()
-                return
-            case "w" | "W":
-                self.target_pos[1] += 5000
-            case "s" | "S":
-                self.target_pos[1] -= 5000
-            case "a" | "A":
-                self.target_pos[0] += 5000
-            case "d" | "D":
-                self.target_pos[0] -= 5000
-            case "q" | "Q":
-                self.target_pos[4] += 5000
-            case "e" | "E":
-                self.target_pos[4] -= 5000
-            case "i" | "I":
-                self.target_pos[2] -= 5000
-            case "k" | "K":
-                self.target_pos[2] += 5000
-            case "j" | "J":
-                self.target_pos[3] -= 5000
-            case "l" | "L":
-                self.target_pos[3] += 5000
-            case "u" | "U":
-                self.target_pos[5] -= 5000
-            case "o" | "O":
-                self.target_pos[5] += 5000
-            case "f" | "F":
-                self.target_pos[6] += 5000
-            case "h" | "H":
-                self.target_pos[6] -= 5000
-
-        for i in range(7):
-            diff = self.target_pos[i] - self.current_pos[i]
-            info = f"{self.target_pos[i]:<12} {self.current_pos[i]:<12} {diff:<10}"
-            self.draw_text(5 + i, 18, info)
-
-        self.draw_text(11, 18, info)
+    def on_key(self, key: int) -> None:
+        if key == ESC:
+            self.exit()
+            return
 
+        jog = JOG_KEYS.get(chr(key).lower()) if key != -1 else None
+        if jog is not None:
+            self.jog.press(*jog)
 
-def on_command(args: argparse.Namespace) -> None:
-    with Piper(args.can_interface) as piper, TeleopJointApp() as app:
-        while app.is_running():
-            match piper.read_message():
-                case JointFeedback12Message() as msg:
-                    app.current_pos[0] = msg.joint_1
-                    app.current_pos[1] = msg.joint_2
-
-                    piper.set_motion_control_b("joint", 20)
-                    piper.set_joint_control_12(*app.target_pos[0:2])
+    def on_render(self) -> None:
+        # Both are replaced rather than modified, so every row of this frame is drawn
+        # from complete updates even while the other threads publish new ones.
+        targets, state = self.jog.positions, self.tracker.state
+        currents = (*state.joints, state.gripper)
+        for i, (target, current) in enumerate(zip(targets, currents, strict=True)):
+            self.draw_cell(
+                5 + i, 18, f"{target:<12} {current:<12} {target - current:<10}"
+            )
 
-                case JointFeedback34Message() as msg:
-                    app.current_pos[2] = msg.joint_3
-                    app.current_pos[3] = msg.joint_4
 
-                    piper.set_joint_control_34(*app.target_pos[2:4])
+def send_joint_targets(piper: Piper, targets: tuple[int, ...]) -> None:
+    piper.set_motion_control_b("joint", 100)
+    piper.set_joint_control(*targets[0:6])
+    piper.set_gripper_control(targets[6], 1000)
 
-                case JointFeedback56Message() as msg:
-                    app.current_pos[4] = msg.joint_5
-                    app.current_pos[5] = msg.joint_6
 
-                    piper.set_joint_control_56(*app.target_pos[4:6])
-
-                case GripperFeedbackMessage() as msg:
-                    app.current_pos[6] = msg.position
-                    piper.set_gripper_control(app.target_pos[6], 1000)
-
-
-def register_joint_command(subparsers: argparse.ArgumentParser) -> None:
-    parser = subparsers.add_parser(
-        "joint", help="teleop the joint positions of PiPER arm"
-    )
-    parser.set_defaults(func=on_command)
-    parser.add_argument(
-        "can_interface", nargs="?", default="can0", help="CAN interface to use"
+def on_command(args: argparse.Namespace) -> None:
+    jog = JogController(
+        (0, 0, 0, 0, 0, 0, 45000), JOG_VELOCITY, JOG_ACCELERATION, limits=JOG_LIMITS
     )
+    with (
+        Piper(args.can_interface) as piper,
+        TeleopJointApp(jog, ArmStateTracker(piper), fps=args.fps) as app,
+        JogThread(app, jog, partial(send_joint_targets, piper), args.rate),
+    ):
+        while app.is_running():
+            piper.read_message(timeout=READ_TIMEOUT)
 
 
-__all__ = ["register_joint_command"]
+__all__ = ["on_command"]
@@ -0,0 +1,29 @@
+import argparse
+
+from piper_kit._commands._lazy import lazy_command
+
+
+def register_simplify_command(subparsers: argparse.ArgumentParser) -> None:
+    parser = subparsers.add_parser(
+        "simplify", help="remove waypoints that interpolation can reproduce"
+    )
+    parser.set_defaults(func=lazy_command(f"{__name__}.simplify"))
+    parser.add_argument("input_file", help="CSV file containing trajectory data")
+    parser.add_argument("output_file", help="CSV file to write the result to")
+    parser.add_argument(
+        "-t",
+        "--tolerance",
+        type=float,
+        default=100,
+        help="maximum deviation of any joint or gripper position",
+    )
+
+
+def register_trajectory_commands(subparsers: argparse.ArgumentParser) -> None:
+    parser = subparsers.add_parser("trajectory", help="process trajectory files")
+    subparsers = parser.add_subparsers(required=True)
+
+    register_simplify_command(subparsers)
+
+
+__all__ = ["register_trajectory_commands"]
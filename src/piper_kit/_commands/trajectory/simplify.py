@@ -0,0 +1,19 @@
+import argparse
+import sys
+from pathlib import Path
+
+from piper_kit.trajectory import TrajectoryStream, format_waypoint, simplify_waypoints
+
+
+def on_command(args: argparse.Namespace) -> None:
+    with TrajectoryStream(args.input_file) as stream:
+        waypoints = list(stream)
+
+    simplified = simplify_waypoints(waypoints, args.tolerance)
+    with Path(args.output_file).open("w") as output_file:
+        output_file.writelines(f"{format_waypoint(w)}\n" for w in simplified)
+
+    sys.stdout.write(f"kept {len(simplified)} of {len(waypoints)} waypoints\n")
+
+
+__all__ = ["on_command"]
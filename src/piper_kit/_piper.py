@@ -0,0 +1,709 @@
+"""Implementation of the Piper interface for the AgileX PiPER robotic arm."""
+
+import time
+from collections.abc import Callable
+from types import TracebackType
+from typing import Self
+
+from .dispatch import Dispatcher, Subscription
+from .errors import FeedbackTimeoutError
+from .messages import (
+    RECEIVE_MESSAGE_TYPES,
+    EnableJointMessage,
+    EndPoseControlRyMessage,
+    EndPoseControlXyMessage,
+    EndPoseControlZpMessage,
+    EndPoseFeedbackRyMessage,
+    EndPoseFeedbackXyMessage,
+    EndPoseFeedbackZpMessage,
+    Frame,
+    GripperControlMessage,
+    GripperFeedbackMessage,
+    JointConfigMessage,
+    JointControl12Message,
+    JointControl34Message,
+    JointControl56Message,
+    JointFeedback12Message,
+    JointFeedback34Message,
+    JointFeedback56Message,
+    MotionControlBMessage,
+    MotorInfoBMessage,
+    ReceiveMessage,
+    TransmitMessage,
+    UnknownMessage,
+)
+from .metrics import MetricsHook
+from .motion import MoveResult
+from .safety import SafetyEnvelope
+from .transports import Transport, open_transport
+from .watchdog import FeedbackWatchdog
+
+# Feedback message types of each move target, mapped to the index of their first
+# axis in the target and the attribute names of their axes.
+_JOINT_FEEDBACKS = {
+    JointFeedback12Message: (0, ("joint_1", "joint_2")),
+    JointFeedback34Message: (2, ("joint_3", "joint_4")),
+    JointFeedback56Message: (4, ("joint_5", "joint_6")),
+}
+_END_POSE_FEEDBACKS = {
+    EndPoseFeedbackXyMessage: (0, ("x", "y")),
+    EndPoseFeedbackZpMessage: (2, ("z", "pitch")),
+    EndPoseFeedbackRyMessage: (4, ("roll", "yaw")),
+}
+
+# Indices of the end-effector pose axes that are angles in 0.001 degrees, whose
+# errors wrap around at half a turn.
+_END_POSE_ANGULAR_AXES = frozenset({3, 4, 5})
+_HALF_TURN = 180000
+
+
+def _axis_errors(
+    targets: list[int], current: list[int | None], angular_axes: frozenset[int]
+) -> list[int | None]:
+    errors = []
+    for i, (t, c) in enumerate(zip(targets, current, strict=True)):
+        if c is None:
+            errors.append(None)
+        elif i in angular_axes:
+            # Wrap the error into (-180, 180] degrees.
+            errors.append(_HALF_TURN - (_HALF_TURN - (t - c)) % (2 * _HALF_TURN))
+        else:
+            errors.append(t - c)
+    return errors
+
+
+class Piper:
+    """Interface for controlling the AgileX PiPER robotic arm via CAN bus.
+
+    This class provides methods for controlling joint positions, enabling/disabling
+    joints, and reading feedback from the robotic arm through the CAN bus interface.
+
+    Args:
+        transport: CAN interface name (e.g., 'can0'), transport URI (e.g.,
+            'virtual://arm', see `piper_kit.transports.open_transport`), or an
+            already opened transport
+        safety: Safety envelope that joint, end-effector pose, and gripper
+            commands are checked against before they are sent, or None to send
+            them unchecked
+        watchdog: Watchdog fed by the messages read, which runs its action when
+            watched feedback stops arriving, or None to not watch feedback
+        metrics: Hook that frames sent and received are reported to, or None to
+            not instrument them
+
+    """
+
+    def __init__(
+        self,
+        transport: str | Transport,
+        *,
+        safety: SafetyEnvelope | None = None,
+        watchdog: FeedbackWatchdog | None = None,
+        metrics: MetricsHook | None = None,
+    ) -> None:
+        """Initialize Piper with a CAN interface or transport."""
+        if isinstance(transport, str):
+            transport = open_transport(transport)
+
+        self.transport = transport
+        self.safety = safety
+        self.watchdog = watchdog
+        self.metrics = metrics
+
+        self.dispatcher = Dispatcher()
+        """Dispatcher of the messages read to the callbacks subscribed with `on`."""
+
+    def __enter__(self) -> Self:
+        """Enter context manager."""
+        return self
+
+    def __exit__(
+        self,
+        _exc_type: type[BaseException] | None,
+        _exc_val: BaseException | None,
+        _exc_tb: TracebackType | None,
+    ) -> None:
+        """Exit context manager and close the transport."""
+        self.transport.close()
+
+    def set_motion_control_b(
+        self,
+        move_mode: MotionControlBMessage.MoveMode,
+        move_speed_rate: int,
+        *,
+        control_mode: MotionControlBMessage.ControlMode = "can",
+    ) -> None:
+        """Set motion control parameters for the robotic arm.
+
+        Args:
+            move_mode: Motion control mode ('joint' or other modes)
+            move_speed_rate: Speed rate for movement (0-100)
+            control_mode: Control mode ('can' by default)
+
+        """
+        self._send(MotionControlBMessage(control_mode, move_mode, move_speed_rate))
+
+    def set_end_pose_control_xy(self, x: int, y: int) -> None:
+        """Set X and Y positions control of end-effector pose.
+
+        Args:
+            x: Target X position in 0.001 mm.
+            y: Target Y position in 0.001 mm.
+
+        """
+        if self.watchdog is not None:
+            self._check_watchdog()
+        if self.safety is not None:
+            self.safety.check_positions(0, (x, y))
+
+        self._send(EndPoseControlXyMessage(x, y))
+        if self.safety is not None:
+            self.safety.record_positions(0, (x, y))
+
+    def set_end_pose_control_zp(self, z: int, pitch: int) -> None:
+        """Set Z position and pitch rotation control of end-effector pose.
+
+        Args:
+            z: Target Z position in 0.001 mm.
+            pitch: Target pitch rotation in 0.001 degrees.
+
+        """
+        if self.watchdog is not None:
+            self._check_watchdog()
+        if self.safety is not None:
+            self.safety.check_positions(2, (z,))
+
+        self._send(EndPoseControlZpMessage(z, pitch))
+        if self.safety is not None:
+            self.safety.record_positions(2, (z,))
+
+    def set_end_pose_control_ry(self, roll: int, yaw: int) -> None:
+        """Set roll and yaw rotations control of end-effector pose.
+
+        Args:
+            roll: Target roll rotation in 0.001 degrees.
+            yaw: Target yaw rotation in 0.001 degrees.
+
+        """
+        if self.watchdog is not None:
+            self._check_watchdog()
+
+        self._send(EndPoseControlRyMessage(roll, yaw))
+
+    def set_end_pose_control(  # noqa: PLR0913
+        self,
+        x: int,
+        y: int,
+        z: int,
+        pitch: int,
+        roll: int,
+        yaw: int,
+    ) -> None:
+        """Set position and rotation control of end-effector pose.
+
+        Args:
+            x: Target X position in 0.001 mm.
+            y: Target Y position in 0.001 mm.
+            z: Target Z position in 0.001 mm.
+            pitch: Target pitch rotation in 0.001 degrees.
+            roll: Target roll rotation in 0.001 degrees.
+            yaw: Target yaw rotation in 0.001 degrees.
+
+        """
+        # Check the whole pose first so that a violation sends none of it.
+        if self.safety is not None:
+            self.safety.check_positions(0, (x, y, z))
+
+        self.set_end_pose_control_xy(x, y)
+        self.set_end_pose_control_zp(z, pitch)
+        self.set_end_pose_control_ry(roll, yaw)
+
+    def set_joint_control_12(self, joint_1: int, joint_2: int) -> None:
+        """Set position control for joints 1 and 2.
+
+        Args:
+            joint_1: Target position for joint 1
+            joint_2: Target position for joint 2
+
+        """
+        if self.watchdog is not None:
+            self._check_watchdog()
+        if self.safety is not None:
+            self.safety.check_joints(0, (joint_1, joint_2))
+
+        self._send(JointControl12Message(joint_1, joint_2))
+        if self.safety is not None:
+            self.safety.record_joints(0, (joint_1, joint_2))
+
+    def set_joint_control_34(self, joint_3: int, joint_4: int) -> None:
+        """Set position control for joints 3 and 4.
+
+        Args:
+            joint_3: Target position for joint 3
+            joint_4: Target position for joint 4
+
+        """
+        if self.watchdog is not None:
+            self._check_watchdog()
+        if self.safety is not None:
+            self.safety.check_joints(2, (joint_3, joint_4))
+
+        self._send(JointControl34Message(joint_3, joint_4))
+        if self.safety is not None:
+            self.safety.record_joints(2, (joint_3, joint_4))
+
+    def set_joint_control_56(self, joint_5: int, joint_6: int) -> None:
+        """Set position control for joints 5 and 6.
+
+        Args:
+            joint_5: Target position for joint 5
+            joint_6: Target position for joint 6
+
+        """
+        if self.watchdog is not None:
+            self._check_watchdog()
+        if self.safety is not None:
+            self.safety.check_joints(4, (joint_5, joint_6))
+
+        self._send(JointControl56Message(joint_5, joint_6))
+        if self.safety is not None:
+            self.safety.record_joints(4, (joint_5, joint_6))
+
+    def set_joint_control(  # noqa: PLR0913
+        self,
+        joint_1: int,
+        joint_2: int,
+        joint_3: int,
+        joint_4: int,
+        joint_5: int,
+        joint_6: int,
+    ) -> None:
+        """Set position control for all 6 joints simultaneously.
+
+        Args:
+            joint_1: Target position for joint 1
+            joint_2: Target position for joint 2
+            joint_3: Target position for joint 3
+            joint_4: Target position for joint 4
+            joint_5: Target position for joint 5
+            joint_6: Target position for joint 6
+
+        """
+        # Check every joint first so that a violation sends none of them.
+        if self.safety is not None:
+            self.safety.check_joints(
+                0, (joint_1, joint_2, joint_3, joint_4, joint_5, joint_6)
+            )
+
+        self.set_joint_control_12(joint_1, joint_2)
+        self.set_joint_control_34(joint_3, joint_4)
+        self.set_joint_control_56(joint_5, joint_6)
+
+    def set_gripper_control(
+        self,
+        position: int,
+        effort: int,
+        *,
+        enable: bool = True,
+        clear_error: bool = False,
+        set_zero: bool = False,
+    ) -> None:
+        """Control gripper position and effort.
+
+        Args:
+            position: Target gripper position
+            effort: Effort/force to apply
+            enable: Enable gripper control
+            clear_error: Clear any error state
+            set_zero: Set current position as zero reference
+
+        """
+        if self.watchdog is not None and enable:
+            self._check_watchdog()
+        if self.safety is not None and enable:
+            self.safety.check_gripper(position)
+
+        self._send(
+            GripperControlMessage(
+                position,
+                effort,
+                enable=enable,
+                clear_error=clear_error,
+                set_zero=set_zero,
+            )
+        )
+
+    def enable_gripper(self, *, enable: bool = True) -> None:
+        """Enable or disable gripper control.
+
+        Args:
+            enable: True to enable, False to disable
+
+        """
+        self.set_gripper_control(0, 0, enable=enable)
+
+    def disable_gripper(self) -> None:
+        """Disable gripper control."""
+        self.enable_gripper(enable=False)
+
+    def enable_joint(
+        self, joint_id: EnableJointMessage.JointId, *, enable: bool = True
+    ) -> None:
+        """Enable or disable a specific joint.
+
+        Args:
+            joint_id: Joint ID (1-6) or 7 for all joints
+            enable: True to enable, False to disable
+
+        """
+        self._send(EnableJointMessage(joint_id, enable=enable))
+
+    def disable_joint(self, joint_id: EnableJointMessage.JointId) -> None:
+        """Disable a specific joint.
+
+        Args:
+            joint_id: Joint ID (1-6) or 7 for all joints
+
+        """
+        self.enable_joint(joint_id, enable=False)
+
+    def enable_all_joints(self, *, enable: bool = True) -> None:
+        """Enable or disable all joints simultaneously.
+
+        Args:
+            enable: True to enable, False to disable
+
+        """
+        self.enable_joint(7, enable=enable)
+
+    def disable_all_joints(self) -> None:
+        """Disable all joints simultaneously."""
+        self.enable_all_joints(enable=False)
+
+    def set_joint_config(
+        self,
+        joint_id: JointConfigMessage.JointId,
+        *,
+        set_zero: bool = False,
+        clear_error: bool = False,
+    ) -> None:
+        """Set the configuration of a specific joint.
+
+        Args:
+            joint_id: Joint ID (1-6 for individual joints, 7 for all joints)
+            set_zero: Whether to set the current joint position as the zero position
+            clear_error: Whether to clear the current joint error codes
+
+        """
+        self._send(
+            JointConfigMessage(joint_id, set_zero=set_zero, clear_error=clear_error)
+        )
+
+    def set_all_joint_configs(
+        self, *, set_zero: bool = False, clear_error: bool = False
+    ) -> None:
+        """Set the configuration of all joints.
+
+        Args:
+            set_zero: Whether to set the current joint position as the zero position
+            clear_error: Whether to clear the current joint error codes
+
+        """
+        self.set_joint_config(7, set_zero=set_zero, clear_error=clear_error)
+
+    def move_joints_to(
+        self,
+        targets: list[int],
+        *,
+        tolerance: int = 1000,
+        timeout: float | None = None,
+    ) -> MoveResult:
+        """Move all 6 joints to target positions and wait until they settle.
+
+        Sends the joint control setpoint once, then blocks on incoming joint
+        feedback, checking the tolerance each time a feedback frame arrives.
+
+        Args:
+            targets: Target positions [joint1, ..., joint6] in 0.001 degrees
+            tolerance: Maximum absolute error of each joint to be considered settled
+            timeout: Maximum time in seconds to wait, or None to wait forever
+
+        Returns:
+            Result containing whether the joints settled, the settle time, and the
+            final error of each joint
+
+        """
+        self.set_joint_control(*targets)
+        return self._wait_until_settled(
+            targets, tolerance, timeout, _JOINT_FEEDBACKS, frozenset()
+        )
+
+    def move_end_pose_to(
+        self,
+        pose: list[int],
+        *,
+        tolerance: int = 1000,
+        timeout: float | None = None,
+    ) -> MoveResult:
+        """Move the end-effector to a target pose and wait until it settles.
+
+        Sends the end-effector pose setpoint once, then blocks on incoming
+        end-effector pose feedback, checking the tolerance each time a feedback
+        frame arrives.
+
+        Args:
+            pose: Target pose [x, y, z, pitch, roll, yaw] in the same units as
+                `set_end_pose_control`
+            tolerance: Maximum absolute error of each axis to be considered settled
+            timeout: Maximum time in seconds to wait, or None to wait forever
+
+        Returns:
+            Result containing whether the end-effector settled, the settle time, and
+            the final error of each axis
+
+        """
+        self.set_end_pose_control(*pose)
+        return self._wait_until_settled(
+            pose, tolerance, timeout, _END_POSE_FEEDBACKS, _END_POSE_ANGULAR_AXES
+        )
+
+    def _wait_until_settled(
+        self,
+        targets: list[int],
+        tolerance: int,
+        timeout: float | None,
+        feedbacks: dict[type[ReceiveMessage], tuple[int, tuple[str, ...]]],
+        angular_axes: frozenset[int],
+    ) -> MoveResult:
+        start = time.monotonic()
+        deadline = None if timeout is None else start + timeout
+
+        current = [None] * len(targets)
+        settled = False
+        while not settled:
+            remaining = None
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+
+            msg = self.read_message(timeout=remaining)
+            feedback = feedbacks.get(type(msg))
+            if feedback is not None:
+                index, names = feedback
+                for i, name in enumerate(names, index):
+                    current[i] = getattr(msg, name)
+
+                errors = _axis_errors(targets, current, angular_axes)
+                settled = None not in errors and all(
+                    abs(e) <= tolerance for e in errors
+                )
+
+        return MoveResult(
+            settled=settled,
+            settle_time=time.monotonic() - start,
+            error=_axis_errors(targets, current, angular_axes),
+        )
+
+    def on[M: ReceiveMessage](
+        self, message_type: type[M], callback: Callable[[M], None], *, every: int = 1
+    ) -> Subscription:
+        """Subscribe a callback to a type of message read from the CAN bus.
+
+        Every message read by `read_message`, including those read while waiting
+        in other methods, is passed to the callbacks subscribed to its type, so
+        several components can share one arm without taking messages from each
+        other. Callbacks are called in the thread reading the message.
+
+        Args:
+            message_type: Type of the messages to pass to the callback
+            callback: Function called with each message of the type
+            every: Call the callback with only the first of every this many
+                messages, to downsample fast feedback for slow consumers
+
+        Returns:
+            The subscription, which can be cancelled
+
+        """
+        return self.dispatcher.on(message_type, callback, every=every)
+
+    def read_message(self, timeout: float | None = None) -> ReceiveMessage | None:
+        """Read a single message from the CAN bus.
+
+        The message is also passed to the callbacks subscribed to its type with
+        `on` before it is returned.
+
+        Args:
+            timeout: Maximum time in seconds to wait, or None to wait forever
+
+        Returns:
+            Parsed message object (JointFeedback, EndPoseFeedback, GripperFeedback,
+            MotorInfo, or Unknown), or None if the timeout expired
+
+        """
+        if self.watchdog is None:
+            msg = self.transport.recv(timeout)
+        else:
+            msg = self._recv_watched(timeout)
+        if msg is None:
+            return None
+
+        message_type = RECEIVE_MESSAGE_TYPES.get(msg.arbitration_id, UnknownMessage)
+        if self.metrics is None:
+            message = message_type(msg)
+        else:
+            start = time.perf_counter()
+            message = message_type(msg)
+            elapsed = time.perf_counter() - start
+            self.metrics.frame_received(msg.arbitration_id, elapsed)
+
+        self.dispatcher.dispatch(message)
+        return message
+
+    def _send(self, msg: TransmitMessage) -> None:
+        if self.metrics is None:
+            self.transport.send(msg)
+            return
+
+        try:
+            self.transport.send(msg)
+        except Exception as error:
+            self.metrics.send_failed(msg.arbitration_id, error)
+            raise
+        self.metrics.frame_sent(msg.arbitration_id)
+
+    def _recv_watched(self, timeout: float | None) -> Frame | None:
+        # Waits no longer than the earliest watchdog deadline at a time, so missed
+        # deadlines are noticed even while no frames arrive.
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = self.watchdog.remaining()
+            if deadline is not None:
+                remaining = max(deadline - time.monotonic(), 0.0)
+                wait = remaining if wait is None else min(wait, remaining)
+
+            msg = self.transport.recv(wait)
+            if msg is not None:
+                self.watchdog.feed(msg.arbitration_id)
+
+            self._check_watchdog()
+            if msg is not None or (
+                deadline is not None and time.monotonic() >= deadline
+            ):
+                return msg
+
+    def _check_watchdog(self) -> None:
+        arbitration_id = self.watchdog.check()
+        if arbitration_id is None:
+            return
+
+        action = self.watchdog.action
+        if callable(action):
+            action(arbitration_id)
+            return
+
+        if action == "disable":
+            self.disable_all_joints()
+        raise FeedbackTimeoutError(arbitration_id)
+
+    def read_all_motor_info_bs(self) -> list[MotorInfoBMessage]:
+        """Read motor information from all 6 joints.
+
+        Blocks until motor info is received from all joints.
+
+        Returns:
+            List of 6 MotorInfoBMessage objects containing status and diagnostic info
+
+        """
+        infos = [None] * 6
+        while any(i is None for i in infos):
+            match self.read_message():
+                case MotorInfoBMessage() as msg:
+                    infos[msg.motor_id - 1] = msg
+
+        return infos
+
+    def read_all_joint_feedbacks(self) -> list[int]:
+        """Read current position feedback from all 6 joints.
+
+        Blocks until feedback is received from all joints.
+
+        Returns:
+            List of 6 joint positions [joint1, joint2, joint3, joint4, joint5, joint6]
+
+        """
+        feedbacks = [None] * 6
+        while None in feedbacks:
+            msg = self.read_message()
+            feedback = _JOINT_FEEDBACKS.get(type(msg))
+            if feedback is not None:
+                index, names = feedback
+                for i, name in enumerate(names, index):
+                    feedbacks[i] = getattr(msg, name)
+
+        return feedbacks
+
+    def wait_all_joints_enabled(self, timeout: float | None = None) -> bool:
+        """Wait until the drivers of all 6 joints report that they are enabled.
+
+        Tracks the driver status of each motor as its motor information arrives,
+        instead of collecting a full set of motor information on every check.
+
+        Args:
+            timeout: Maximum time in seconds to wait, or None to wait forever
+
+        Returns:
+            True if all joints were enabled, or False if the timeout expired
+
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        enabled = [False] * 6
+        while not all(enabled):
+            remaining = None
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+
+            match self.read_message(timeout=remaining):
+                case MotorInfoBMessage() as msg:
+                    enabled[msg.motor_id - 1] = msg.driver_status.driver_enabled
+
+        return True
+
+    def read_end_pose(self) -> list[int]:
+        """Read the current end-effector pose of the arm.
+
+        Blocks until feedback is received from all joints, then computes the pose
+        with `piper_kit.kinematics.forward_kinematics`.
+
+        Returns:
+            End-effector pose [x, y, z, pitch, roll, yaw] in the same units as
+            `set_end_pose_control`
+
+        """
+        # Imported here so that NumPy is only loaded when kinematics are used.
+        from .kinematics import forward_kinematics
+
+        pose = forward_kinematics(self.read_all_joint_feedbacks())
+        return pose.round().astype(int).tolist()
+
+    def read_gripper_feedback(self) -> GripperFeedbackMessage:
+        """Read position feedback from the gripper.
+
+        Blocks until gripper feedback is received.
+
+        Returns:
+            A GripperFeedbackMessage containing the current gripper position.
+
+        """
+        feedback = None
+        while feedback is None:
+            match self.read_message():
+                case GripperFeedbackMessage() as msg:
+                    feedback = msg
+
+        return feedback
+
+
+__all__ = ["Piper"]
@@ -0,0 +1,304 @@
+"""On-disk cache of parsed trajectories, loaded by memory mapping.
+
+Parsing a long trajectory CSV file takes a while, so `TrajectoryCache` keeps the
+parsed and validated waypoints of each file as a ``.npy`` array, which later loads
+by memory mapping in milliseconds. `ArrayTrajectoryStream` plays such an array
+back with the interface of `piper_kit.trajectory.TrajectoryStream`.
+"""
+
+import hashlib
+import os
+from collections.abc import Sequence
+from pathlib import Path
+from types import TracebackType
+from typing import Self
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .trajectory import TrajectoryStream, Waypoint, parse_waypoint
+
+# Version of the layout of the cached arrays, which is part of the key of every
+# entry so that entries of another layout are never loaded.
+_FORMAT_VERSION = 1
+
+# Size in bytes of the header of an entry, which NumPy pads to 128 bytes for
+# two-dimensional arrays of any number of rows.
+_HEADER_SIZE = 128
+
+# Size in bytes of a row of an entry, holding eight doubles.
+_ROW_SIZE = 64
+
+# Number of rows parsed before they are copied into the arrays.
+_CHUNK_SIZE = 4096
+
+
+def _count_rows(path: Path) -> int:
+    with path.open() as file:
+        return sum(1 for line in file if line.strip())
+
+
+def _parse_rows(
+    path: Path, arms: Sequence[int | None], outputs: Sequence[NDArray[np.float64]]
+) -> None:
+    # Parses the rows of every arm in a single pass over the file, holding the
+    # lines of one chunk at a time, so memory use does not depend on its size.
+    def flush(start: int, lines: list[str]) -> None:
+        for arm, output in zip(arms, outputs, strict=True):
+            waypoints = (parse_waypoint(line, arm) for line in lines)
+            output[start : start + len(lines)] = [
+                (w.duration, *w.joints, w.gripper) for w in waypoints
+            ]
+
+    start = 0
+    lines = []
+    with path.open() as file:
+        for line in file:
+            if line.strip():
+                lines.append(line)
+                if len(lines) == _CHUNK_SIZE:
+                    flush(start, lines)
+                    start += len(lines)
+                    lines = []
+    if lines:
+        flush(start, lines)
+
+
+def parse_trajectory(path: str | Path, arm: int | None = None) -> NDArray[np.float64]:
+    """Parse every row of a trajectory CSV file into an array.
+
+    The rows are counted first and then parsed in chunks into the array, so only
+    the array itself grows with the size of the file.
+
+    Args:
+        path: Path to the trajectory CSV file
+        arm: Index of the arm to parse in a file with the positions of several
+            arms in each row, or None if the file contains a single arm
+
+    Returns:
+        An array with a row per waypoint holding its duration, six joint
+        positions, and gripper position
+
+    Raises:
+        InvalidTrajectoryRowError: If a row of the file is malformed
+
+    """
+    path = Path(path)
+    waypoints = np.empty((_count_rows(path), 8), dtype=np.float64)
+    _parse_rows(path, [arm], [waypoints])
+    return waypoints
+
+
+class ArrayTrajectoryStream:
+    """Waypoints of a trajectory held in an array, such as a cached one.
+
+    It has the interface of `piper_kit.trajectory.TrajectoryStream`, so the same
+    players can play it, but seeking searches the cumulative durations of the
+    waypoints instead of reading the file again.
+
+    Args:
+        waypoints: Array with a row per waypoint holding its duration, six joint
+            positions, and gripper position
+
+    """
+
+    def __init__(self, waypoints: NDArray[np.float64]) -> None:
+        """Initialize the stream at the start of the trajectory."""
+        self.waypoints = waypoints
+        """Waypoints of the trajectory, one per row."""
+
+        self.time = 0.0
+        """Time at which the next waypoint is reached, relative to the start."""
+
+        self._index = 0
+        self._ends: NDArray[np.float64] | None = None
+
+    def __enter__(self) -> Self:
+        """Enter the context manager."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Close the stream on exit."""
+        self.close()
+
+    def __iter__(self) -> Self:
+        """Return the stream itself as an iterator of waypoints."""
+        return self
+
+    def __next__(self) -> Waypoint:
+        """Return the next waypoint of the trajectory.
+
+        Raises:
+            StopIteration: If the end of the trajectory has been reached
+
+        """
+        if self._index >= len(self.waypoints):
+            raise StopIteration
+
+        duration, *joints, gripper = self.waypoints[self._index].tolist()
+        self._index += 1
+        self.time += duration
+        return Waypoint(duration, tuple(joints), gripper)
+
+    def seek(self, target: float) -> None:
+        """Move the stream so that the next waypoint is reached at or after a time.
+
+        Args:
+            target: Time in seconds relative to the start of the trajectory
+
+        """
+        if self._ends is None:
+            self._ends = np.cumsum(self.waypoints[:, 0])
+
+        self._index = int(np.searchsorted(self._ends, target))
+        self.time = float(self._ends[self._index - 1]) if self._index > 0 else 0.0
+
+    def close(self) -> None:
+        """Do nothing, since the array is released once no longer referenced."""
+
+
+class TrajectoryCache:
+    """Cache of parsed trajectory CSV files, stored as ``.npy`` arrays.
+
+    Entries are keyed by the resolved path of a file, its modification time, and
+    its size, so editing or replacing the file invalidates its entry. On a miss,
+    the entries of every requested arm are filled in a single pass over the file,
+    chunk by chunk into memory-mapped arrays, so memory use does not depend on
+    the size of the file. Loading an entry marks it as recently used, and adding
+    one evicts the least recently used entries until the total size of the cache
+    fits within its cap. Files whose entries alone exceed the cap are not cached.
+
+    Args:
+        directory: Directory of the entries, which is created when needed
+        max_size: Maximum total size of the entries in bytes
+
+    """
+
+    def __init__(self, directory: str | Path, *, max_size: int = 1 << 30) -> None:
+        """Initialize the cache without touching the directory."""
+        self.directory = Path(directory)
+        self.max_size = max_size
+
+    @property
+    def size(self) -> int:
+        """Total size of the entries in bytes."""
+        return sum(entry.stat().st_size for entry in self.directory.glob("*.npy"))
+
+    def load(
+        self, path: str | Path, arms: Sequence[int | None] = (None,)
+    ) -> list[NDArray[np.float64]] | None:
+        """Load the waypoints of the arms of a trajectory, parsing it on a miss.
+
+        Args:
+            path: Path to the trajectory CSV file
+            arms: Indices of the arms to load in a file with the positions of
+                several arms in each row, or only None if the file contains a
+                single arm
+
+        Returns:
+            A read-only and memory-mapped array per arm, with a row per waypoint
+            holding its duration, six joint positions, and gripper position, or
+            None if the arrays would not fit within the cap of the cache
+
+        Raises:
+            InvalidTrajectoryRowError: If a row of the file is malformed
+
+        """
+        path = Path(path)
+        entries = [self._entry(path, arm) for arm in arms]
+        try:
+            waypoints = [np.load(entry, mmap_mode="r") for entry in entries]
+        except FileNotFoundError:
+            pass
+        else:
+            for entry in entries:
+                os.utime(entry)
+            return waypoints
+
+        rows = _count_rows(path)
+        if len(entries) * (_HEADER_SIZE + rows * _ROW_SIZE) > self.max_size:
+            return None
+
+        self._store(path, arms, entries, rows)
+        return [np.load(entry, mmap_mode="r") for entry in entries]
+
+    def open(
+        self, path: str | Path, arms: Sequence[int | None] = (None,)
+    ) -> list[ArrayTrajectoryStream | TrajectoryStream]:
+        """Open a stream of the waypoints of each arm of a trajectory.
+
+        Args:
+            path: Path to the trajectory CSV file
+            arms: Indices of the arms to stream in a file with the positions of
+                several arms in each row, or only None if the file contains a
+                single arm
+
+        Returns:
+            The streams of the waypoints loaded with `load`, or streams that read
+            the file if it is too large to be cached
+
+        Raises:
+            InvalidTrajectoryRowError: If a row of the file is malformed
+
+        """
+        waypoints = self.load(path, arms)
+        if waypoints is None:
+            return [TrajectoryStream(path, arm=arm) for arm in arms]
+        return [ArrayTrajectoryStream(w) for w in waypoints]
+
+    def _entry(self, path: Path, arm: int | None) -> Path:
+        stat = path.stat()
+        key = f"{_FORMAT_VERSION}:{path.resolve()}:{stat.st_mtime_ns}:{stat.st_size}"
+        digest = hashlib.sha256(f"{key}:{arm}".encode()).hexdigest()
+        return self.directory / f"{digest[:32]}.npy"
+
+    def _store(
+        self, path: Path, arms: Sequence[int | None], entries: list[Path], rows: int
+    ) -> None:
+        # Written to temporary files first, so other processes never load a
+        # partially written entry.
+        self.directory.mkdir(parents=True, exist_ok=True)
+        temporaries = [
+            entry.with_name(f".{entry.stem}.{os.getpid()}.tmp") for entry in entries
+        ]
+        try:
+            outputs = [
+                np.lib.format.open_memmap(
+                    temporary, mode="w+", dtype=np.float64, shape=(rows, 8)
+                )
+                for temporary in temporaries
+            ]
+            _parse_rows(path, arms, outputs)
+            for output in outputs:
+                output.flush()
+        except BaseException:
+            for temporary in temporaries:
+                temporary.unlink(missing_ok=True)
+            raise
+        for temporary, entry in zip(temporaries, entries, strict=True):
+            temporary.replace(entry)
+
+        # Loading an entry touches it, so the oldest modification times belong to
+        # the least recently used entries. The new entries fit within the cap, so
+        # only the others are evicted.
+        total = 0
+        others = []
+        for entry in self.directory.glob("*.npy"):
+            stat = entry.stat()
+            total += stat.st_size
+            if entry not in entries:
+                others.append((stat.st_mtime_ns, stat.st_size, entry))
+        others.sort()
+        for _, size, entry in others:
+            if total <= self.max_size:
+                break
+            entry.unlink(missing_ok=True)
+            total -= size
+
+
+__all__ = ["ArrayTrajectoryStream", "TrajectoryCache", "parse_trajectory"]
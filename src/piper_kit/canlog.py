@@ -0,0 +1,214 @@
+"""Bulk decoding of recorded CAN logs of the PiPER arm into NumPy columns.
+
+Decoding a long log frame by frame into message objects takes minutes, so
+`read_log` reads the frames of a log into arrays, and `decode_log` decodes every
+frame of each message type at once by viewing the payloads through a structured
+dtype that mirrors the layout of the message. The result is a table of columns
+per message type, with the same names as the attributes of the messages:
+
+>>> from piper_kit.messages import JointFeedback12Message
+>>> tables = load_log("session.log")  # doctest: +SKIP
+>>> tables[JointFeedback12Message]["joint_1"]  # doctest: +SKIP
+array([1000, 1002, 1004, ...], dtype=int32)
+"""
+
+import binascii
+import re
+from array import array
+from pathlib import Path
+
+import can
+import numpy as np
+from numpy.typing import NDArray
+
+from .messages import (
+    RECEIVE_MESSAGE_TYPES,
+    EndPoseFeedbackRyMessage,
+    EndPoseFeedbackXyMessage,
+    EndPoseFeedbackZpMessage,
+    GripperFeedbackMessage,
+    JointFeedback12Message,
+    JointFeedback34Message,
+    JointFeedback56Message,
+    MotorInfoBMessage,
+    ReceiveMessage,
+)
+
+# Big-endian type and byte offset of every field in the payload of each message.
+_LAYOUTS: dict[type[ReceiveMessage], dict[str, tuple[str, int]]] = {
+    MotorInfoBMessage: {
+        "bus_voltage": (">u2", 0),
+        "driver_temp": (">i2", 2),
+        "motor_temp": ("i1", 4),
+        "driver_status": ("u1", 5),
+        "bus_current": (">u2", 6),
+    },
+    EndPoseFeedbackXyMessage: {"x": (">i4", 0), "y": (">i4", 4)},
+    EndPoseFeedbackZpMessage: {"z": (">i4", 0), "pitch": (">i4", 4)},
+    EndPoseFeedbackRyMessage: {"roll": (">i4", 0), "yaw": (">i4", 4)},
+    JointFeedback12Message: {"joint_1": (">i4", 0), "joint_2": (">i4", 4)},
+    JointFeedback34Message: {"joint_3": (">i4", 0), "joint_4": (">i4", 4)},
+    JointFeedback56Message: {"joint_5": (">i4", 0), "joint_6": (">i4", 4)},
+    GripperFeedbackMessage: {
+        "position": (">i4", 0),
+        "effort": (">u2", 4),
+        "status": ("u1", 6),
+    },
+}
+
+# A classic CAN frame in a candump log, capturing its timestamp, arbitration ID,
+# and payload, optionally followed by its direction. Other lines, such as those of
+# CAN FD or remote frames, are skipped.
+_CANDUMP_FRAME = re.compile(
+    rb"^\((\d+(?:\.\d*)?)\)[ \t]+\S+[ \t]+([0-9A-Fa-f]{3}|[0-9A-Fa-f]{8})"
+    rb"#((?:[0-9A-Fa-f]{2}){0,8})(?:[ \t]+[RT])?[ \t]*\r?$",
+    re.MULTILINE,
+)
+
+# Flag of the arbitration ID of error frames in candump logs, from <linux/can.h>.
+_CAN_ERR_FLAG = 0x20000000
+
+
+def _frame_columns(
+    timestamps: NDArray, arbitration_ids: NDArray, lengths: NDArray, data: bytes
+) -> dict[str, NDArray]:
+    return {
+        "timestamp": timestamps.astype(np.float64),
+        "arbitration_id": arbitration_ids.astype(np.uint32),
+        "length": lengths.astype(np.uint8),
+        "data": np.frombuffer(data, dtype=np.uint8).reshape(-1, 8),
+    }
+
+
+def _read_candump(path: Path) -> dict[str, NDArray]:
+    # Parses the whole text with one regular expression, and the timestamps,
+    # arbitration IDs, and payloads of every frame with one call each.
+    frames = _CANDUMP_FRAME.findall(path.read_bytes())
+    stamps, ids, payloads = zip(*frames, strict=True) if frames else ((), (), ())
+
+    arbitration_ids = np.frombuffer(
+        binascii.unhexlify(b"".join(i.rjust(8, b"0") for i in ids)), dtype=">u4"
+    )
+    columns = _frame_columns(
+        np.array(stamps, dtype=np.bytes_),
+        arbitration_ids,
+        np.fromiter(map(len, payloads), dtype=np.int64, count=len(payloads)) // 2,
+        binascii.unhexlify(b"".join(p.ljust(16, b"0") for p in payloads)),
+    )
+
+    valid = (columns["arbitration_id"] & _CAN_ERR_FLAG) == 0
+    return {name: column[valid] for name, column in columns.items()}
+
+
+def _read_frames(path: Path) -> dict[str, NDArray]:
+    # Only the fields of each frame are kept, in compact arrays, so memory use is
+    # a fraction of that of the frame objects of the reader.
+    timestamps = array("d")
+    arbitration_ids = array("I")
+    lengths = bytearray()
+    data = bytearray()
+    for msg in can.LogReader(path):
+        if msg.is_error_frame or msg.is_remote_frame or msg.dlc > 8:  # noqa: PLR2004
+            continue
+
+        payload = bytes(msg.data)
+        timestamps.append(msg.timestamp)
+        arbitration_ids.append(msg.arbitration_id)
+        lengths.append(len(payload))
+        data += payload.ljust(8, b"\0")
+
+    return _frame_columns(
+        np.frombuffer(timestamps, dtype=np.float64),
+        np.frombuffer(arbitration_ids, dtype=np.uint32),
+        np.frombuffer(bytes(lengths), dtype=np.uint8),
+        bytes(data),
+    )
+
+
+def read_log(path: str | Path) -> dict[str, NDArray]:
+    """Read the classic CAN frames of a log file into columns.
+
+    Any log format supported by ``can.LogReader`` can be read, such as candump
+    ``.log``, ``.asc``, or ``.blf`` files. Candump logs are parsed in bulk, without
+    creating an object per frame. Error, remote, and CAN FD frames are skipped.
+
+    Args:
+        path: Path to the log file
+
+    Returns:
+        The columns of the frames mapped by their names: ``timestamp`` in seconds,
+        ``arbitration_id``, ``length`` of the payload, and ``data`` with the
+        payload padded with zeros to shape (n, 8)
+
+    """
+    path = Path(path)
+    if path.suffix == ".log":
+        return _read_candump(path)
+
+    return _read_frames(path)
+
+
+def decode_log(
+    frames: dict[str, NDArray],
+) -> dict[type[ReceiveMessage], dict[str, NDArray]]:
+    """Decode the frames of a log into a table of columns per message type.
+
+    The payloads of all frames of a message type are decoded at once. Frames too
+    short for their message type are skipped.
+
+    Args:
+        frames: Columns of the frames, as returned by `read_log`
+
+    Returns:
+        Tables of columns mapped by the types of the messages found in the frames.
+        Each table maps ``timestamp`` and the names of the attributes of the
+        message to arrays with an element per message. The status attributes hold
+        the status codes, and `piper_kit.messages.MotorInfoBMessage` tables also
+        hold the ``motor_id`` of each message.
+
+    """
+    arbitration_ids = frames["arbitration_id"]
+    tables = {}
+    for message_type, layout in _LAYOUTS.items():
+        ids = [i for i, t in RECEIVE_MESSAGE_TYPES.items() if t is message_type]
+        size = max(np.dtype(kind).itemsize + offset for kind, offset in layout.values())
+        selected = np.isin(arbitration_ids, ids) & (frames["length"] >= size)
+        if not selected.any():
+            continue
+
+        dtype = np.dtype(
+            {
+                "names": list(layout),
+                "formats": [kind for kind, _ in layout.values()],
+                "offsets": [offset for _, offset in layout.values()],
+                "itemsize": 8,
+            }
+        )
+        fields = np.ascontiguousarray(frames["data"][selected]).view(dtype)[:, 0]
+
+        table = {"timestamp": frames["timestamp"][selected]}
+        if message_type is MotorInfoBMessage:
+            table["motor_id"] = (
+                arbitration_ids[selected] - MotorInfoBMessage.ID0
+            ).astype(np.uint8)
+        for name in layout:
+            table[name] = fields[name].astype(fields[name].dtype.newbyteorder("="))
+        tables[message_type] = table
+
+    return tables
+
+
+def load_log(path: str | Path) -> dict[type[ReceiveMessage], dict[str, NDArray]]:
+    """Read a log file and decode it into a table of columns per message type.
+
+    Args:
+        path: Path to the log file, in any format supported by `read_log`
+
+    Returns:
+        Tables of columns mapped by message type, as returned by `decode_log`
+
+    """
+    return decode_log(read_log(path))
+
+
+__all__ = ["decode_log", "load_log", "read_log"]
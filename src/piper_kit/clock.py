@@ -0,0 +1,83 @@
+"""Alignment of CAN bus timestamps with the monotonic clock of the host."""
+
+import time
+from collections import deque
+from collections.abc import Callable
+
+from .errors import UnalignedClockError
+
+
+class ClockAligner:
+    """Maps receive timestamps of a bus clock onto ``time.monotonic_ns``.
+
+    Each receive timestamp is paired with the monotonic time at which its message
+    was read. The difference between the two is the offset between the clocks plus
+    the delay from receiving to reading, which is never negative, so the smallest
+    difference over recent samples is the best estimate of the offset. Limiting it
+    to a window of samples lets the estimate follow drift between the clocks, and
+    the minimum is tracked with a monotonic queue at amortized constant cost.
+
+    Args:
+        window: Number of most recent samples the offset is estimated from
+        clock: Function that returns the monotonic time in nanoseconds
+
+    """
+
+    def __init__(
+        self, *, window: int = 1000, clock: Callable[[], int] = time.monotonic_ns
+    ) -> None:
+        """Initialize a clock aligner without samples."""
+        self.window = window
+        self.clock = clock
+
+        self._count = 0
+        self._offsets: deque[tuple[int, int]] = deque()
+
+    def update(self, timestamp: float, now: int | None = None) -> None:
+        """Add a sample pairing a receive timestamp with the time it was read.
+
+        Args:
+            timestamp: Receive timestamp of a message in seconds, in the bus clock
+            now: Monotonic time in nanoseconds at which the message was read, or
+                None to read the clock now
+
+        """
+        if now is None:
+            now = self.clock()
+
+        offset = now - round(timestamp * 1e9)
+        offsets = self._offsets
+        while offsets and offsets[-1][1] >= offset:
+            offsets.pop()
+
+        offsets.append((self._count, offset))
+        if offsets[0][0] <= self._count - self.window:
+            offsets.popleft()
+
+        self._count += 1
+
+    @property
+    def offset(self) -> int | None:
+        """Estimated nanoseconds to add to a bus timestamp, or None without samples."""
+        return self._offsets[0][1] if self._offsets else None
+
+    def to_monotonic_ns(self, timestamp: float) -> int:
+        """Map a receive timestamp onto the monotonic clock.
+
+        Args:
+            timestamp: Receive timestamp of a message in seconds, in the bus clock
+
+        Returns:
+            The estimated monotonic time of the receive in nanoseconds
+
+        Raises:
+            UnalignedClockError: If no samples have been added yet
+
+        """
+        if not self._offsets:
+            raise UnalignedClockError
+
+        return round(timestamp * 1e9) + self._offsets[0][1]
+
+
+__all__ = ["ClockAligner"]
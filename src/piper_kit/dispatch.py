@@ -0,0 +1,123 @@
+"""Dispatch of messages read from the PiPER arm to subscribed callbacks."""
+
+import threading
+from collections.abc import Callable
+
+from .messages import ReceiveMessage
+
+
+class Subscription:
+    """A callback subscribed to one type of message, returned by `Dispatcher.on`.
+
+    Args:
+        dispatcher: Dispatcher the callback is subscribed to
+        message_type: Type of the messages passed to the callback
+        callback: Function called with each dispatched message
+        every: Call the callback with only one of every this many messages
+
+    """
+
+    __slots__ = ("_count", "_dispatcher", "callback", "every", "message_type")
+
+    def __init__(
+        self,
+        dispatcher: "Dispatcher",
+        message_type: type[ReceiveMessage],
+        callback: Callable[[ReceiveMessage], None],
+        every: int,
+    ) -> None:
+        """Initialize the subscription without subscribing it."""
+        self.message_type = message_type
+        self.callback = callback
+        self.every = every
+        self._dispatcher = dispatcher
+        self._count = 0
+
+    def __call__(self, msg: ReceiveMessage) -> None:
+        """Pass a message to the callback, unless it is skipped to downsample.
+
+        Args:
+            msg: Message to pass
+
+        """
+        count = self._count
+        self._count = count + 1
+        if count % self.every == 0:
+            self.callback(msg)
+
+    def cancel(self) -> None:
+        """Stop calling the callback, which does nothing if already cancelled."""
+        self._dispatcher.cancel(self)
+
+
+class Dispatcher:
+    """Fans messages out to the callbacks subscribed to their types.
+
+    The subscriptions are kept in a table indexed by message type, so dispatching
+    a message costs one lookup, and nothing more for types without subscribers.
+    Messages only match subscriptions to their exact type, not to base classes.
+
+    The subscriptions of each type are replaced rather than modified, so callbacks
+    can subscribe and cancel subscriptions, from any thread, even while a message
+    is being dispatched.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the dispatcher without subscriptions."""
+        self._table: dict[type[ReceiveMessage], tuple[Subscription, ...]] = {}
+        self._lock = threading.Lock()
+
+    def on[M: ReceiveMessage](
+        self, message_type: type[M], callback: Callable[[M], None], *, every: int = 1
+    ) -> Subscription:
+        """Subscribe a callback to a type of message.
+
+        Args:
+            message_type: Type of the messages to pass to the callback
+            callback: Function called with each dispatched message of the type
+            every: Call the callback with only the first of every this many
+                messages, to downsample fast feedback for slow consumers
+
+        Returns:
+            The subscription, which can be cancelled
+
+        """
+        subscription = Subscription(self, message_type, callback, every)
+        with self._lock:
+            self._table[message_type] = (
+                *self._table.get(message_type, ()),
+                subscription,
+            )
+        return subscription
+
+    def cancel(self, subscription: Subscription) -> None:
+        """Cancel a subscription, which does nothing if already cancelled.
+
+        Args:
+            subscription: Subscription to cancel
+
+        """
+        with self._lock:
+            subscriptions = self._table.get(subscription.message_type, ())
+            remaining = tuple(s for s in subscriptions if s is not subscription)
+            if remaining:
+                self._table[subscription.message_type] = remaining
+            else:
+                self._table.pop(subscription.message_type, None)
+
+    def dispatch(self, msg: ReceiveMessage) -> None:
+        """Call the callbacks subscribed to the type of a message.
+
+        Args:
+            msg: Message to dispatch
+
+        """
+        subscriptions = self._table.get(type(msg))
+        if subscriptions is None:
+            return
+
+        for subscription in subscriptions:
+            subscription(msg)
+
+
+__all__ = ["Dispatcher", "Subscription"]
@@ -1,6 +1,27 @@
 """Exception classes for the PiPER Kit package."""
 
 
+class EndOfReplayError(EOFError):
+    """Raised when all frames of a replayed log file have been received."""
+
+    def __init__(self) -> None:
+        """Initialize end of replay error."""
+        super().__init__("End of replayed log file")
+
+
+class FeedbackTimeoutError(TimeoutError):
+    """Raised when watched feedback stops arriving from the arm."""
+
+    def __init__(self, arbitration_id: int) -> None:
+        """Initialize with the arbitration ID of the stale feedback.
+
+        Args:
+            arbitration_id: The arbitration ID of the feedback that stopped arriving
+
+        """
+        super().__init__(f"Feedback timed out: 0x{arbitration_id:X}")
+
+
 class InvalidControlModeError(ValueError):
     """Raised when an invalid control mode is provided."""
 
@@ -66,10 +87,119 @@ class InvalidMoveSpeedRateError(ValueError):
         super().__init__(f"Invalid move speed rate: {rate!r}")
 
 
+class InvalidPacketError(ValueError):
+    """Raised when a received packet of remote arm state is malformed."""
+
+    def __init__(self, packet: any) -> None:
+        """Initialize with malformed packet.
+
+        Args:
+            packet: The malformed packet that was received
+
+        """
+        super().__init__(f"Invalid state packet: {packet!r}")
+
+
+class InvalidTimestampingError(ValueError):
+    """Raised when an invalid receive timestamping mode is provided."""
+
+    def __init__(self, mode: any) -> None:
+        """Initialize with invalid timestamping mode.
+
+        Args:
+            mode: The invalid timestamping mode that was provided
+
+        """
+        super().__init__(f"Invalid timestamping mode: {mode!r}")
+
+
+class InvalidTrajectoryRowError(ValueError):
+    """Raised when a row of a trajectory file cannot be parsed."""
+
+    def __init__(self, row: any) -> None:
+        """Initialize with invalid trajectory row.
+
+        Args:
+            row: The invalid trajectory row that was read
+
+        """
+        super().__init__(f"Invalid trajectory row: {row!r}")
+
+
+class InvalidTransportUriError(ValueError):
+    """Raised when an unsupported transport URI is provided."""
+
+    def __init__(self, uri: any) -> None:
+        """Initialize with unsupported transport URI.
+
+        Args:
+            uri: The unsupported transport URI that was provided
+
+        """
+        super().__init__(f"Invalid transport URI: {uri!r}")
+
+
+class RecorderWriterError(RuntimeError):
+    """Raised when the writer process of an episode recorder exits unexpectedly."""
+
+    def __init__(self, exitcode: any) -> None:
+        """Initialize with the exit code of the writer process.
+
+        Args:
+            exitcode: The exit code of the writer process
+
+        """
+        super().__init__(f"Recorder writer exited with code {exitcode!r}")
+
+
+class SafetyViolationError(ValueError):
+    """Raised when a command would leave the safety envelope of the arm."""
+
+    def __init__(self, violation: any) -> None:
+        """Initialize with safety envelope violation.
+
+        Args:
+            violation: Description of the command that violated the envelope
+
+        """
+        super().__init__(f"Safety envelope violated: {violation}")
+
+
+class UnalignedClockError(RuntimeError):
+    """Raised when mapping a timestamp before any clock samples were added."""
+
+    def __init__(self) -> None:
+        """Initialize unaligned clock error."""
+        super().__init__("Clock has no samples to align with")
+
+
+class UnreachablePoseError(ValueError):
+    """Raised when no joint positions reach an end-effector pose."""
+
+    def __init__(self, pose: any) -> None:
+        """Initialize with unreachable end-effector pose.
+
+        Args:
+            pose: The end-effector pose that could not be reached
+
+        """
+        super().__init__(f"Unreachable end-effector pose: {pose!r}")
+
+
 __all__ = [
+    "EndOfReplayError",
+    "FeedbackTimeoutError",
     "InvalidControlModeError",
     "InvalidGripperEffortError",
     "InvalidJointIdError",
     "InvalidMoveModeError",
     "InvalidMoveSpeedRateError",
+    "InvalidPacketError",
+    "InvalidTimestampingError",
+    "InvalidTrajectoryRowError",
+    "InvalidTransportUriError",
+    "RecorderWriterError",
+    "SafetyViolationError",
+    "UnalignedClockError",
+    "UnreachablePoseError",
 ]
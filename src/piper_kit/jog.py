@@ -0,0 +1,130 @@
+"""Velocity jogging of the PiPER arm from held keys."""
+
+import math
+import time
+from collections.abc import Callable, Sequence
+
+
+class JogController:
+    """Turns held jog keys into smooth motion of several axes.
+
+    Each press of a key holds a direction on one axis for a while, and presses
+    repeated by the keyboard extend the hold, since terminals do not report when a
+    key is released. The first press is held long enough to bridge the delay
+    before the keyboard starts repeating.
+
+    Calling `step` at a fixed control rate moves the velocity of each axis toward
+    its maximum in the held direction, or toward zero without one, by no more than
+    the maximum acceleration, and integrates it into the position. Positions are
+    clamped to the limits of their axes, which also stops the axes there.
+
+    Args:
+        positions: Initial position of each axis
+        max_velocity: Maximum speed of each axis in units per second
+        max_acceleration: Maximum acceleration of each axis in units per second
+            squared
+        limits: Lower and upper position limits of each axis, or None for axes
+            without limits, or None to not limit any axis
+        first_hold: Seconds that the first press of a key is held for
+        repeat_hold: Seconds that a repeated press of a key is held for
+        clock: Function that returns the monotonic time in seconds
+
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        positions: Sequence[float],
+        max_velocity: Sequence[float],
+        max_acceleration: Sequence[float],
+        *,
+        limits: Sequence[tuple[float, float] | None] | None = None,
+        first_hold: float = 0.5,
+        repeat_hold: float = 0.1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the controller at rest."""
+        self.max_velocity = tuple(max_velocity)
+        self.max_acceleration = tuple(max_acceleration)
+        self.limits = tuple(limits) if limits is not None else (None,) * len(positions)
+        self.first_hold = first_hold
+        self.repeat_hold = repeat_hold
+        self.clock = clock
+
+        self.positions = tuple(round(p) for p in positions)
+        """Latest position of each axis, rounded and replaced as a whole by `step`."""
+
+        self._positions = [float(p) for p in positions]
+        self._velocities = [0.0] * len(positions)
+        self._holds = [(0, -math.inf)] * len(positions)
+        self._stepped = clock()
+
+    @property
+    def velocities(self) -> tuple[float, ...]:
+        """Current velocity of each axis in units per second."""
+        return tuple(self._velocities)
+
+    def press(self, axis: int, direction: int, now: float | None = None) -> None:
+        """Hold a direction on an axis, as when a key is pressed or repeated.
+
+        Args:
+            axis: Index of the axis
+            direction: 1 to move the axis forward, or -1 to move it backward
+            now: Monotonic time of the press in seconds, or None to read the clock
+
+        """
+        if now is None:
+            now = self.clock()
+
+        held_direction, until = self._holds[axis]
+        repeated = held_direction == direction and now < until
+        hold = self.repeat_hold if repeated else self.first_hold
+        self._holds[axis] = (direction, now + hold)
+
+    def stop(self) -> None:
+        """Release every held direction, so all axes slow down to a stop."""
+        self._holds = [(0, -math.inf)] * len(self._holds)
+
+    def step(self, now: float | None = None) -> tuple[int, ...]:
+        """Advance the motion of every axis to the given time.
+
+        Args:
+            now: Monotonic time in seconds, or None to read the clock
+
+        Returns:
+            The new position of each axis, rounded, which is also kept in
+            `positions`
+
+        """
+        if now is None:
+            now = self.clock()
+
+        dt = max(now - self._stepped, 0.0)
+        self._stepped = now
+        for axis in range(len(self._positions)):
+            self._step_axis(axis, now, dt)
+
+        self.positions = tuple(round(p) for p in self._positions)
+        return self.positions
+
+    def _step_axis(self, axis: int, now: float, dt: float) -> None:
+        direction, until = self._holds[axis]
+        target = direction * self.max_velocity[axis] if now < until else 0.0
+
+        change = self.max_acceleration[axis] * dt
+        velocity = self._velocities[axis]
+        velocity += min(max(target - velocity, -change), change)
+        position = self._positions[axis] + velocity * dt
+
+        limits = self.limits[axis]
+        if limits is not None:
+            low, high = limits
+            if position <= low:
+                position, velocity = low, max(velocity, 0.0)
+            elif position >= high:
+                position, velocity = high, min(velocity, 0.0)
+
+        self._positions[axis] = position
+        self._velocities[axis] = velocity
+
+
+__all__ = ["JogController"]
@@ -0,0 +1,403 @@
+"""Forward and inverse kinematics of the PiPER robotic arm.
+
+The kinematics follow the modified Denavit-Hartenberg model of the PiPER arm and
+operate on NumPy arrays, so a single joint vector and a whole recorded session of
+joint positions are converted the same way.
+
+Joint positions are in 0.001 degrees, as reported by
+`piper_kit.Piper.read_all_joint_feedbacks`. End-effector poses are
+``(x, y, z, pitch, roll, yaw)`` in the same units and order as
+`piper_kit.Piper.set_end_pose_control`, where x, y, and z are in 0.001 mm, and
+pitch, roll, and yaw are the rotations about the X, Y, and Z axes in 0.001
+degrees.
+
+Example:
+    Convert the joint positions of a recorded trajectory into end-effector poses:
+
+    >>> import numpy as np
+    >>> from piper_kit.kinematics import forward_kinematics
+    >>> rows = np.loadtxt("trajectory.csv", delimiter=",")
+    >>> poses = forward_kinematics(rows[:, 1:7])
+
+"""
+
+from collections import OrderedDict
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from . import safety
+from .errors import UnreachablePoseError
+
+DH_A = np.array([0.0, 0.0, 285.03, -21.98, 0.0, 0.0])
+"""Link lengths ``a(i-1)`` of the modified DH model in mm."""
+
+DH_ALPHA = np.radians([0.0, -90.0, 0.0, 90.0, -90.0, 90.0])
+"""Link twists ``alpha(i-1)`` of the modified DH model in radians."""
+
+DH_D = np.array([123.0, 0.0, 0.0, 250.75, 0.0, 91.0])
+"""Link offsets ``d(i)`` of the modified DH model in mm."""
+
+DH_THETA = np.radians([0.0, -172.22, -102.78, 0.0, 0.0, 0.0])
+"""Joint angle offsets ``theta(i)`` of the modified DH model in radians."""
+
+JOINT_LIMITS = np.array(safety.JOINT_LIMITS)
+"""Lower and upper position limits of each joint in 0.001 degrees."""
+
+_MILLIDEG_TO_RAD = np.pi / 180_000
+_RAD_TO_MILLIDEG = 180_000 / np.pi
+
+
+def joint_transforms(joints: ArrayLike) -> NDArray[np.float64]:
+    """Compute the homogeneous transforms of each joint frame.
+
+    Args:
+        joints: Joint positions in 0.001 degrees, with shape (6,) or (N, 6)
+
+    Returns:
+        Transforms of joint frames 1 to 6 relative to the base in mm, with shape
+        (6, 4, 4) or (N, 6, 4, 4)
+
+    """
+    theta = np.asarray(joints, dtype=np.float64) * _MILLIDEG_TO_RAD + DH_THETA
+    ct, st = np.cos(theta), np.sin(theta)
+    ca, sa = np.cos(DH_ALPHA), np.sin(DH_ALPHA)
+
+    links = np.zeros((*theta.shape, 4, 4))
+    links[..., 0, 0] = ct
+    links[..., 0, 1] = -st
+    links[..., 0, 3] = DH_A
+    links[..., 1, 0] = st * ca
+    links[..., 1, 1] = ct * ca
+    links[..., 1, 2] = -sa
+    links[..., 1, 3] = -sa * DH_D
+    links[..., 2, 0] = st * sa
+    links[..., 2, 1] = ct * sa
+    links[..., 2, 2] = ca
+    links[..., 2, 3] = ca * DH_D
+    links[..., 3, 3] = 1.0
+
+    transforms = np.empty_like(links)
+    transforms[..., 0, :, :] = links[..., 0, :, :]
+    for i in range(1, 6):
+        transforms[..., i, :, :] = transforms[..., i - 1, :, :] @ links[..., i, :, :]
+
+    return transforms
+
+
+def end_pose_from_transform(transforms: ArrayLike) -> NDArray[np.float64]:
+    """Convert homogeneous transforms into end-effector poses.
+
+    Args:
+        transforms: Transforms in mm, with shape (4, 4) or (N, 4, 4)
+
+    Returns:
+        End-effector poses, with shape (6,) or (N, 6)
+
+    """
+    t = np.asarray(transforms, dtype=np.float64)
+    sy = np.hypot(t[..., 0, 0], t[..., 1, 0])
+    singular = sy < 1e-9  # noqa: PLR2004
+
+    poses = np.empty((*t.shape[:-2], 6))
+    poses[..., 0:3] = t[..., 0:3, 3] * 1000
+    poses[..., 3] = np.where(
+        singular,
+        np.arctan2(-t[..., 1, 2], t[..., 1, 1]),
+        np.arctan2(t[..., 2, 1], t[..., 2, 2]),
+    )
+    poses[..., 4] = np.arctan2(-t[..., 2, 0], sy)
+    poses[..., 5] = np.where(singular, 0.0, np.arctan2(t[..., 1, 0], t[..., 0, 0]))
+    poses[..., 3:6] *= _RAD_TO_MILLIDEG
+
+    return poses
+
+
+def end_pose_to_transform(poses: ArrayLike) -> NDArray[np.float64]:
+    """Convert end-effector poses into homogeneous transforms.
+
+    Args:
+        poses: End-effector poses, with shape (6,) or (N, 6)
+
+    Returns:
+        Transforms in mm, with shape (4, 4) or (N, 4, 4)
+
+    """
+    p = np.asarray(poses, dtype=np.float64)
+    angles = p[..., 3:6] * _MILLIDEG_TO_RAD
+    cx, cy, cz = np.moveaxis(np.cos(angles), -1, 0)
+    sx, sy, sz = np.moveaxis(np.sin(angles), -1, 0)
+
+    transforms = np.zeros((*p.shape[:-1], 4, 4))
+    transforms[..., 0, 0] = cz * cy
+    transforms[..., 0, 1] = cz * sy * sx - sz * cx
+    transforms[..., 0, 2] = cz * sy * cx + sz * sx
+    transforms[..., 1, 0] = sz * cy
+    transforms[..., 1, 1] = sz * sy * sx + cz * cx
+    transforms[..., 1, 2] = sz * sy * cx - cz * sx
+    transforms[..., 2, 0] = -sy
+    transforms[..., 2, 1] = cy * sx
+    transforms[..., 2, 2] = cy * cx
+    transforms[..., 0:3, 3] = p[..., 0:3] / 1000
+    transforms[..., 3, 3] = 1.0
+
+    return transforms
+
+
+def forward_kinematics(joints: ArrayLike) -> NDArray[np.float64]:
+    """Compute end-effector poses from joint positions.
+
+    Args:
+        joints: Joint positions in 0.001 degrees, with shape (6,) or (N, 6)
+
+    Returns:
+        End-effector poses, with shape (6,) or (N, 6)
+
+    """
+    return end_pose_from_transform(joint_transforms(joints)[..., 5, :, :])
+
+
+class InverseKinematics:
+    """Numeric inverse kinematics solver for the PiPER arm.
+
+    Solves with damped least squares on the geometric Jacobian of the arm, keeping
+    joints within `JOINT_LIMITS`. Each solve is warm-started from the previous
+    solution, so tracking a smoothly moving target converges in a few iterations,
+    and solutions of recently requested targets are served from a cache.
+
+    Args:
+        position_tolerance: Maximum position error of a solution in 0.001 mm
+        rotation_tolerance: Maximum rotation error of a solution in 0.001 degrees
+        max_iterations: Maximum number of iterations per solve
+        cache_size: Maximum number of cached solutions, or 0 to disable the cache
+
+    """
+
+    ROTATION_WEIGHT = 200.0
+    """Weight in mm per radian that balances rotation against position errors."""
+
+    DAMPING = 5.0
+    """Damping factor of the least squares steps in mm."""
+
+    MAX_STEP = 0.5
+    """Maximum joint change in radians of a single iteration."""
+
+    RESTART_SEEDS = np.random.default_rng(0).uniform(
+        JOINT_LIMITS[:, 0], JOINT_LIMITS[:, 1], (32, 6)
+    )
+    """Seeds tried together when a solve from the warm start does not converge."""
+
+    JUMP_THRESHOLD = 30_000
+    """Joint change in 0.001 degrees between path points that forces a re-solve."""
+
+    def __init__(
+        self,
+        *,
+        position_tolerance: float = 100,
+        rotation_tolerance: float = 100,
+        max_iterations: int = 100,
+        cache_size: int = 1024,
+    ) -> None:
+        """Initialize the solver."""
+        self._position_tolerance = position_tolerance / 1000
+        self._rotation_tolerance = rotation_tolerance * _MILLIDEG_TO_RAD
+        self._max_iterations = max_iterations
+
+        self._cache = OrderedDict()
+        self._cache_size = cache_size
+
+        self.last_solution = np.zeros(6)
+        """Joint positions of the most recent solution, used as the warm start."""
+
+    def solve(
+        self, pose: ArrayLike, seed: ArrayLike | None = None
+    ) -> NDArray[np.float64]:
+        """Solve joint positions that reach an end-effector pose.
+
+        Args:
+            pose: Target end-effector pose, with shape (6,)
+            seed: Initial joint positions in 0.001 degrees, or None to start from
+                `last_solution`
+
+        Returns:
+            Joint positions in 0.001 degrees, with shape (6,)
+
+        Raises:
+            UnreachablePoseError: If no solution within tolerance was found
+
+        """
+        key = tuple(np.rint(pose).astype(int).tolist())
+        solution = self._cache.get(key)
+        if solution is not None and seed is None:
+            self._cache.move_to_end(key)
+        else:
+            seed = self.last_solution if seed is None else np.asarray(seed, float)
+            solution = self._solve_restarts(end_pose_to_transform(pose), seed)
+            if solution is None:
+                raise UnreachablePoseError(pose)
+
+            self._store(key, solution)
+
+        self.last_solution = solution
+        return solution.copy()
+
+    def solve_path(
+        self, poses: ArrayLike, seed: ArrayLike | None = None
+    ) -> NDArray[np.float64]:
+        """Solve joint positions that follow a path of end-effector poses.
+
+        All poses are first solved together in one vectorized pass from the same
+        seed. Poses that did not converge, or whose solution jumps away from the
+        previous one, are then solved again warm-started from the previous pose.
+
+        Args:
+            poses: Target end-effector poses, with shape (N, 6)
+            seed: Initial joint positions in 0.001 degrees, or None to start from
+                `last_solution`
+
+        Returns:
+            Joint positions in 0.001 degrees, with shape (N, 6)
+
+        Raises:
+            UnreachablePoseError: If no solution within tolerance was found for
+                any of the poses
+
+        """
+        poses = np.asarray(poses, dtype=np.float64)
+        transforms = end_pose_to_transform(poses)
+        seed = self.last_solution if seed is None else np.asarray(seed, dtype=float)
+
+        solutions, converged = self._solve(transforms, np.tile(seed, (len(poses), 1)))
+
+        previous = seed
+        for i in range(len(poses)):
+            jump = np.max(np.abs(solutions[i] - previous))
+            if not converged[i] or jump > self.JUMP_THRESHOLD:
+                solution = self._solve_restarts(transforms[i], previous)
+                if solution is None:
+                    raise UnreachablePoseError(poses[i])
+
+                solutions[i] = solution
+            previous = solutions[i]
+
+        if len(poses) > 0:
+            self.last_solution = solutions[-1].copy()
+
+        return solutions
+
+    def _store(self, key: tuple[int, ...], solution: NDArray[np.float64]) -> None:
+        if self._cache_size > 0:
+            self._cache[key] = solution
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+
+    def _solve_restarts(
+        self, target: NDArray[np.float64], seed: NDArray[np.float64]
+    ) -> NDArray[np.float64] | None:
+        solutions, converged = self._solve(target[np.newaxis], seed[np.newaxis])
+        if converged[0]:
+            return solutions[0]
+
+        # Fall back to solving from several seeds at once, and pick the converged
+        # solution closest to the original seed.
+        seeds = self.RESTART_SEEDS
+        solutions, converged = self._solve(np.tile(target, (len(seeds), 1, 1)), seeds)
+        if not converged.any():
+            return None
+
+        solutions = solutions[converged]
+        return solutions[np.argmin(np.abs(solutions - seed).max(axis=-1))]
+
+    def _solve(
+        self, targets: NDArray[np.float64], joints: NDArray[np.float64]
+    ) -> tuple[NDArray[np.float64], NDArray[np.bool_]]:
+        lower, upper = JOINT_LIMITS[:, 0], JOINT_LIMITS[:, 1]
+        joints = np.clip(joints, lower, upper)
+        weights = np.array([1, 1, 1, *[self.ROTATION_WEIGHT] * 3])
+        damping = np.eye(6) * self.DAMPING**2
+
+        converged = np.zeros(len(joints), dtype=bool)
+        for _ in range(self._max_iterations):
+            transforms = joint_transforms(joints)
+            end = transforms[:, 5]
+
+            position_error = targets[:, 0:3, 3] - end[:, 0:3, 3]
+            rotation_error = _rotation_error(targets[:, 0:3, 0:3], end[:, 0:3, 0:3])
+            converged = (
+                np.linalg.norm(position_error, axis=-1) <= self._position_tolerance
+            ) & (np.linalg.norm(rotation_error, axis=-1) <= self._rotation_tolerance)
+            if converged.all():
+                break
+
+            axes = transforms[:, :, 0:3, 2]
+            origins = transforms[:, :, 0:3, 3]
+            jacobian = (
+                np.concatenate(
+                    [np.cross(axes, end[:, np.newaxis, 0:3, 3] - origins), axes],
+                    axis=-1,
+                ).swapaxes(-1, -2)
+                * weights[:, np.newaxis]
+            )
+
+            error = np.concatenate([position_error, rotation_error], axis=-1) * weights
+            step = jacobian.swapaxes(-1, -2) @ np.linalg.solve(
+                jacobian @ jacobian.swapaxes(-1, -2) + damping, error[..., np.newaxis]
+            )
+
+            step = step[..., 0]
+            scale = np.max(np.abs(step), axis=-1, keepdims=True) / self.MAX_STEP
+            step = step / np.maximum(scale, 1.0) * _RAD_TO_MILLIDEG
+            step[converged] = 0
+            joints = np.clip(joints + step, lower, upper)
+
+        return joints, converged
+
+
+def _rotation_error(
+    target: NDArray[np.float64], current: NDArray[np.float64]
+) -> NDArray[np.float64]:
+    # Rotation vector that rotates the current orientation onto the target.
+    r = target @ current.swapaxes(-1, -2)
+    v = (
+        np.stack(
+            [
+                r[..., 2, 1] - r[..., 1, 2],
+                r[..., 0, 2] - r[..., 2, 0],
+                r[..., 1, 0] - r[..., 0, 1],
+            ],
+            axis=-1,
+        )
+        / 2
+    )
+    sin = np.linalg.norm(v, axis=-1)
+    cos = (np.trace(r, axis1=-2, axis2=-1) - 1) / 2
+    angle = np.arctan2(sin, cos)
+    scale = np.where(sin > 1e-12, angle / np.maximum(sin, 1e-12), 1.0)  # noqa: PLR2004
+
+    # Near half a turn, the skew-symmetric part vanishes, so the axis is taken from
+    # the column of (r + I) / 2 = axis * axis^T with the largest diagonal instead.
+    outer = (r + np.eye(3)) / 2
+    diagonal = np.diagonal(outer, axis1=-2, axis2=-1)
+    largest = np.argmax(diagonal, axis=-1)[..., np.newaxis]
+    axis = np.take_along_axis(outer, largest[..., np.newaxis], axis=-1)[..., 0]
+    axis /= np.sqrt(np.take_along_axis(diagonal, largest, axis=-1))
+    flipped = (cos < 0) & (sin < 1e-6)  # noqa: PLR2004
+    return np.where(
+        flipped[..., np.newaxis],
+        axis * angle[..., np.newaxis],
+        v * scale[..., np.newaxis],
+    )
+
+
+__all__ = [
+    "DH_A",
+    "DH_ALPHA",
+    "DH_D",
+    "DH_THETA",
+    "JOINT_LIMITS",
+    "InverseKinematics",
+    "end_pose_from_transform",
+    "end_pose_to_transform",
+    "forward_kinematics",
+    "joint_transforms",
+]
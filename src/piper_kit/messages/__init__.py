@@ -5,6 +5,11 @@ Messages are organized into transmit (commands sent to arm) and receive (feedbac
 """
 
 from .receive import (
+    RECEIVE_MESSAGE_TYPES,
+    EndPoseFeedbackRyMessage,
+    EndPoseFeedbackXyMessage,
+    EndPoseFeedbackZpMessage,
+    Frame,
     GripperFeedbackMessage,
     JointFeedback12Message,
     JointFeedback34Message,
@@ -28,10 +33,15 @@ from .transmit import (
 )
 
 __all__ = [
+    "RECEIVE_MESSAGE_TYPES",
     "EnableJointMessage",
     "EndPoseControlRyMessage",
     "EndPoseControlXyMessage",
     "EndPoseControlZpMessage",
+    "EndPoseFeedbackRyMessage",
+    "EndPoseFeedbackXyMessage",
+    "EndPoseFeedbackZpMessage",
+    "Frame",
     "GripperControlMessage",
     "GripperFeedbackMessage",
     "JointConfigMessage",
@@ -1,24 +1,51 @@
 """Receive message classes for reading feedback from the PiPER arm."""
 
-import can
+from typing import Protocol
+
+
+class Frame(Protocol):
+    """A CAN frame received from a bus, such as a ``can.Message``."""
+
+    arbitration_id: int
+    """CAN arbitration ID of the frame."""
+
+    data: bytes | bytearray | memoryview
+    """Payload bytes of the frame."""
+
+    timestamp: float
+    """Receive time of the frame in seconds."""
 
 
 class ReceiveMessage:
     """Base class for CAN messages received from the PiPER robotic arm."""
 
+    def __init__(self, msg: Frame) -> None:
+        """Store the receive timestamp of a CAN message.
+
+        Args:
+            msg: Received CAN message
+
+        """
+        self.timestamp = msg.timestamp
+        """Receive time of the message in seconds, in the clock of the transport.
+
+        Use `piper_kit.clock.ClockAligner` to map it onto the monotonic clock.
+        """
+
 
 class UnknownMessage(ReceiveMessage):
     """Container for unrecognized CAN messages."""
 
-    def __init__(self, msg: can.Message) -> None:
+    def __init__(self, msg: Frame) -> None:
         """Store unknown CAN message data.
 
         Args:
             msg: Unrecognized CAN message
 
         """
+        super().__init__(msg)
         self.arbitration_id = msg.arbitration_id
-        self.data = msg.data
+        self.data = bytearray(msg.data)
 
 
 class MotorInfoBMessage(ReceiveMessage):
@@ -52,13 +79,14 @@ class MotorInfoBMessage(ReceiveMessage):
             self.driver_enabled = bool(code & 64)
             self.stalling_triggered = bool(code & 128)
 
-    def __init__(self, msg: can.Message) -> None:
+    def __init__(self, msg: Frame) -> None:
         """Parse motor information from CAN message.
 
         Args:
             msg: CAN message containing motor diagnostic data
 
         """
+        super().__init__(msg)
         self.motor_id = msg.arbitration_id - MotorInfoBMessage.ID0
         self.bus_voltage = int.from_bytes(msg.data[0:2])
         self.driver_temp = int.from_bytes(msg.data[2:4], signed=True)
@@ -67,18 +95,70 @@ class MotorInfoBMessage(ReceiveMessage):
         self.bus_current = int.from_bytes(msg.data[6:8])
 
 
+class EndPoseFeedbackXyMessage(ReceiveMessage):
+    """End-effector pose feedback message for X and Y positions."""
+
+    ID = 0x2A2
+
+    def __init__(self, msg: Frame) -> None:
+        """Parse end-effector pose feedback message for X and Y positions.
+
+        Args:
+            msg: CAN message containing end-effector pose data
+
+        """
+        super().__init__(msg)
+        self.x = int.from_bytes(msg.data[0:4], signed=True)
+        self.y = int.from_bytes(msg.data[4:8], signed=True)
+
+
+class EndPoseFeedbackZpMessage(ReceiveMessage):
+    """End-effector pose feedback message for Z position and pitch rotation."""
+
+    ID = 0x2A3
+
+    def __init__(self, msg: Frame) -> None:
+        """Parse end-effector pose feedback message for Z position and pitch rotation.
+
+        Args:
+            msg: CAN message containing end-effector pose data
+
+        """
+        super().__init__(msg)
+        self.z = int.from_bytes(msg.data[0:4], signed=True)
+        self.pitch = int.from_bytes(msg.data[4:8], signed=True)
+
+
+class EndPoseFeedbackRyMessage(ReceiveMessage):
+    """End-effector pose feedback message for roll and yaw rotations."""
+
+    ID = 0x2A4
+
+    def __init__(self, msg: Frame) -> None:
+        """Parse end-effector pose feedback message for roll and yaw rotations.
+
+        Args:
+            msg: CAN message containing end-effector pose data
+
+        """
+        super().__init__(msg)
+        self.roll = int.from_bytes(msg.data[0:4], signed=True)
+        self.yaw = int.from_bytes(msg.data[4:8], signed=True)
+
+
 class JointFeedback12Message(ReceiveMessage):
     """Joint feedback message for joints 1 and 2."""
 
     ID = 0x2A5
 
-    def __init__(self, msg: can.Message) -> None:
+    def __init__(self, msg: Frame) -> None:
         """Parse joint feedback message for joints 1 and 2.
 
         Args:
             msg: CAN message containing joint position data
 
         """
+        super().__init__(msg)
         self.joint_1 = int.from_bytes(msg.data[0:4], signed=True)
         self.joint_2 = int.from_bytes(msg.data[4:8], signed=True)
 
@@ -88,13 +168,14 @@ class JointFeedback34Message(ReceiveMessage):
 
     ID = 0x2A6
 
-    def __init__(self, msg: can.Message) -> None:
+    def __init__(self, msg: Frame) -> None:
         """Parse joint feedback message for joints 3 and 4.
 
         Args:
             msg: CAN message containing joint position data
 
         """
+        super().__init__(msg)
         self.joint_3 = int.from_bytes(msg.data[0:4], signed=True)
         self.joint_4 = int.from_bytes(msg.data[4:8], signed=True)
 
@@ -104,13 +185,14 @@ class JointFeedback56Message(ReceiveMessage):
 
     ID = 0x2A7
 
-    def __init__(self, msg: can.Message) -> None:
+    def __init__(self, msg: Frame) -> None:
         """Parse joint feedback message for joints 5 and 6.
 
         Args:
             msg: CAN message containing joint position data
 
         """
+        super().__init__(msg)
         self.joint_5 = int.from_bytes(msg.data[0:4], signed=True)
         self.joint_6 = int.from_bytes(msg.data[4:8], signed=True)
 
@@ -140,19 +222,40 @@ class GripperFeedbackMessage(ReceiveMessage):
             self.driver_enabled = bool(code & 64)
             self.is_zeroed = bool(code & 128)
 
-    def __init__(self, msg: can.Message) -> None:
+    def __init__(self, msg: Frame) -> None:
         """Parse gripper feedback from CAN message.
 
         Args:
             msg: CAN message containing gripper feedback data
 
         """
+        super().__init__(msg)
         self.position = int.from_bytes(msg.data[0:4], signed=True)
         self.effort = int.from_bytes(msg.data[4:6])
         self.status = self.GripperStatus(msg.data[6])
 
 
+RECEIVE_MESSAGE_TYPES: dict[int, type[ReceiveMessage]] = {
+    **dict.fromkeys(
+        range(MotorInfoBMessage.ID1, MotorInfoBMessage.ID6 + 1), MotorInfoBMessage
+    ),
+    EndPoseFeedbackXyMessage.ID: EndPoseFeedbackXyMessage,
+    EndPoseFeedbackZpMessage.ID: EndPoseFeedbackZpMessage,
+    EndPoseFeedbackRyMessage.ID: EndPoseFeedbackRyMessage,
+    JointFeedback12Message.ID: JointFeedback12Message,
+    JointFeedback34Message.ID: JointFeedback34Message,
+    JointFeedback56Message.ID: JointFeedback56Message,
+    GripperFeedbackMessage.ID: GripperFeedbackMessage,
+}
+"""Receive message types mapped by the arbitration IDs the arm sends them with."""
+
+
 __all__ = [
+    "RECEIVE_MESSAGE_TYPES",
+    "EndPoseFeedbackRyMessage",
+    "EndPoseFeedbackXyMessage",
+    "EndPoseFeedbackZpMessage",
+    "Frame",
     "GripperFeedbackMessage",
     "JointFeedback12Message",
     "JointFeedback34Message",
@@ -1,5 +1,7 @@
 """Transmit message classes for sending commands to the PiPER arm."""
 
+import socket
+import struct
 from typing import Literal
 
 import can
@@ -12,6 +14,8 @@ from piper_kit.errors import (
     InvalidMoveSpeedRateError,
 )
 
+_CAN_FRAME = struct.Struct("=IB3x8s")
+
 
 class TransmitMessage(can.Message):
     """Base class for CAN messages sent to the PiPER robotic arm."""
@@ -48,6 +52,29 @@ class TransmitMessage(can.Message):
             is_extended_id=False,
         )
 
+    @property
+    def frame(self) -> bytes:
+        """Encoded SocketCAN ``struct can_frame`` bytes of this message."""
+        frame = bytearray(_CAN_FRAME.size)
+        self.pack_frame_into(frame)
+        return bytes(frame)
+
+    def pack_frame_into(self, buffer: bytearray | memoryview) -> None:
+        """Encode this message as a SocketCAN ``struct can_frame`` into a buffer.
+
+        Packing into a preallocated buffer lets a transport send every message
+        without allocating a new bytes object for its frame.
+
+        Args:
+            buffer: Writable buffer of at least 16 bytes
+
+        """
+        can_id = self.arbitration_id
+        if self.is_extended_id:
+            can_id |= socket.CAN_EFF_FLAG
+
+        _CAN_FRAME.pack_into(buffer, 0, can_id, self.dlc, self.data)
+
 
 class MotionControlBMessage(TransmitMessage):
     """Message to configure motion control parameters for the robotic arm."""
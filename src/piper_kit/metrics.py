@@ -0,0 +1,255 @@
+"""Instrumentation of the frames exchanged with the PiPER arm.
+
+`piper_kit.Piper`, `piper_kit.transports.QueuedTransport`, and fixed-rate loops
+report what they do to a `MetricsHook`, which does nothing by default. Without a
+hook they skip the instrumentation entirely, so it costs nothing unless enabled.
+`Metrics` collects the reported events, and `PrometheusExporter` writes them as
+Prometheus text-format snapshots, such as for the textfile collector of the node
+exporter.
+"""
+
+import threading
+from collections import Counter
+from collections.abc import Mapping
+from pathlib import Path
+
+from .stats import RunningStats
+
+
+class MetricsHook:
+    """Receiver of instrumentation events, whose methods do nothing by default.
+
+    Override the methods of the events to handle. They may be called from several
+    threads, and are called in the thread doing the work, so they should be fast.
+    """
+
+    def frame_sent(self, arbitration_id: int) -> None:
+        """Handle a frame handed to the transport.
+
+        Args:
+            arbitration_id: Arbitration ID of the frame
+
+        """
+
+    def send_failed(self, arbitration_id: int, error: Exception) -> None:
+        """Handle a frame that failed to be sent.
+
+        Args:
+            arbitration_id: Arbitration ID of the frame
+            error: Error raised when sending the frame
+
+        """
+
+    def frame_received(self, arbitration_id: int, decode_time: float) -> None:
+        """Handle a frame received and decoded into a message.
+
+        Args:
+            arbitration_id: Arbitration ID of the frame
+            decode_time: Time in seconds taken to decode the frame
+
+        """
+
+    def queue_depth_changed(self, queue: str, depth: int) -> None:
+        """Handle a change in the number of items waiting in a queue.
+
+        Args:
+            queue: Name of the queue
+            depth: Number of items in the queue
+
+        """
+
+    def loop_overrun(self, loop: str, lateness: float) -> None:
+        """Handle an iteration of a fixed-rate loop that finished after its deadline.
+
+        Args:
+            loop: Name of the loop
+            lateness: Time in seconds by which the deadline was missed
+
+        """
+
+
+class Metrics(MetricsHook):
+    """Hook that collects the events into counters, gauges, and statistics."""
+
+    def __init__(self) -> None:
+        """Initialize empty metrics."""
+        self.frames_sent: Counter[int] = Counter()
+        """Number of frames sent, by arbitration ID."""
+
+        self.send_failures: Counter[int] = Counter()
+        """Number of frames that failed to be sent, by arbitration ID."""
+
+        self.frames_received: Counter[int] = Counter()
+        """Number of frames received, by arbitration ID."""
+
+        self.decode_time = RunningStats()
+        """Statistics of the time in seconds taken to decode each frame."""
+
+        self.queue_depths: dict[str, int] = {}
+        """Latest number of items waiting in each queue, by name."""
+
+        self.loop_overruns: Counter[str] = Counter()
+        """Number of iterations that missed their deadline, by loop name."""
+
+        self.overrun_time: Counter[str] = Counter()
+        """Total time in seconds by which deadlines were missed, by loop name."""
+
+        self.lock = threading.Lock()
+        """Lock held while the metrics are updated, to read them consistently."""
+
+    def frame_sent(self, arbitration_id: int) -> None:
+        """Count a frame sent."""
+        with self.lock:
+            self.frames_sent[arbitration_id] += 1
+
+    def send_failed(self, arbitration_id: int, error: Exception) -> None:  # noqa: ARG002
+        """Count a frame that failed to be sent."""
+        with self.lock:
+            self.send_failures[arbitration_id] += 1
+
+    def frame_received(self, arbitration_id: int, decode_time: float) -> None:
+        """Count a frame received and its decode time."""
+        with self.lock:
+            self.frames_received[arbitration_id] += 1
+            self.decode_time.update(decode_time)
+
+    def queue_depth_changed(self, queue: str, depth: int) -> None:
+        """Record the latest depth of a queue."""
+        with self.lock:
+            self.queue_depths[queue] = depth
+
+    def loop_overrun(self, loop: str, lateness: float) -> None:
+        """Count an overrun of a loop and its lateness."""
+        with self.lock:
+            self.loop_overruns[loop] += 1
+            self.overrun_time[loop] += lateness
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Mapping[str, str]) -> str:
+    if not labels:
+        return ""
+
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items())
+    return f"{{{pairs}}}"
+
+
+def _by_id(counts: Counter[int]) -> dict[str, int]:
+    return {f"0x{arbitration_id:03X}": n for arbitration_id, n in counts.items()}
+
+
+class PrometheusExporter:
+    """Writes snapshots of metrics to a file in the Prometheus text format.
+
+    Each snapshot is written to a temporary file that then replaces the output
+    file, so a scraper never reads a partially written snapshot.
+
+    Args:
+        metrics: Metrics to export
+        path: Path of the output file, which should end with ``.prom`` for the
+            textfile collector of the node exporter
+        labels: Labels added to every sample, such as the name of the arm
+        prefix: Prefix of the names of the metrics
+
+    """
+
+    def __init__(
+        self,
+        metrics: Metrics,
+        path: str | Path,
+        *,
+        labels: Mapping[str, str] | None = None,
+        prefix: str = "piper",
+    ) -> None:
+        """Initialize the exporter without writing anything."""
+        self.metrics = metrics
+        self.path = Path(path)
+        self.labels = dict(labels or {})
+        self.prefix = prefix
+
+    def render(self) -> str:
+        """Render a snapshot of the metrics.
+
+        Returns:
+            The metrics in the Prometheus text format
+
+        """
+        metrics = self.metrics
+        with metrics.lock:
+            families = [
+                (
+                    "frames_sent_total",
+                    "counter",
+                    "Frames sent.",
+                    "id",
+                    _by_id(metrics.frames_sent),
+                ),
+                (
+                    "send_failures_total",
+                    "counter",
+                    "Frames that failed to be sent.",
+                    "id",
+                    _by_id(metrics.send_failures),
+                ),
+                (
+                    "frames_received_total",
+                    "counter",
+                    "Frames received.",
+                    "id",
+                    _by_id(metrics.frames_received),
+                ),
+                (
+                    "queue_depth",
+                    "gauge",
+                    "Items waiting in a queue.",
+                    "queue",
+                    dict(metrics.queue_depths),
+                ),
+                (
+                    "loop_overruns_total",
+                    "counter",
+                    "Missed loop deadlines.",
+                    "loop",
+                    dict(metrics.loop_overruns),
+                ),
+                (
+                    "loop_overrun_seconds_total",
+                    "counter",
+                    "Total lateness of missed loop deadlines.",
+                    "loop",
+                    dict(metrics.overrun_time),
+                ),
+            ]
+            decode_count = metrics.decode_time.count
+            decode_sum = metrics.decode_time.mean * decode_count
+
+        lines = []
+        for name, kind, help_text, label, samples in families:
+            family = f"{self.prefix}_{name}"
+            lines += (f"# HELP {family} {help_text}", f"# TYPE {family} {kind}")
+            lines.extend(
+                f"{family}{_format_labels(self.labels | {label: key})} {value}"
+                for key, value in sorted(samples.items())
+            )
+
+        family = f"{self.prefix}_decode_seconds"
+        labels = _format_labels(self.labels)
+        lines += (
+            f"# HELP {family} Time spent decoding received frames.",
+            f"# TYPE {family} summary",
+            f"{family}_sum{labels} {decode_sum}",
+            f"{family}_count{labels} {decode_count}",
+        )
+        return "\n".join(lines) + "\n"
+
+    def write(self) -> None:
+        """Write a snapshot of the metrics to the output file."""
+        temporary = self.path.with_name(f".{self.path.name}.tmp")
+        temporary.write_text(self.render())
+        temporary.replace(self.path)
+
+
+__all__ = ["Metrics", "MetricsHook", "PrometheusExporter"]
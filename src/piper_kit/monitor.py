@@ -0,0 +1,220 @@
+"""Incremental statistics of the CAN traffic on a PiPER bus."""
+
+import math
+from collections import deque
+from collections.abc import Collection
+
+from .messages import Frame
+
+# Largest arbitration ID of a standard (11-bit) CAN frame.
+_MAX_STANDARD_ID = 0x7FF
+
+
+def frame_bits(data_length: int, *, extended: bool = False) -> int:
+    """Estimate the number of bits a CAN frame occupies on the bus.
+
+    The estimate includes the frame overhead, the interframe space, and the
+    worst-case bit stuffing.
+
+    Args:
+        data_length: Number of payload bytes in the frame
+        extended: Whether the frame uses a 29-bit arbitration ID
+
+    Returns:
+        The number of bits occupied by the frame
+
+    """
+    # Bits subject to stuffing, followed by the fixed-form delimiters, the end of
+    # frame, and the interframe space.
+    stuffed = (54 if extended else 34) + 8 * data_length
+    return stuffed + 13 + (stuffed - 1) // 4
+
+
+class FrameStats:
+    """Sliding-window statistics of the frames of a single arbitration ID.
+
+    Each update costs amortized constant time, as the running sums are adjusted
+    only for the frames that enter and leave the window.
+
+    Args:
+        window: Length of the sliding window in seconds
+        gap_factor: Ratio to the mean interval above which an interval counts as
+            a gap
+
+    """
+
+    def __init__(self, *, window: float = 1.0, gap_factor: float = 2.5) -> None:
+        """Initialize empty frame statistics."""
+        self.window = window
+        self.gap_factor = gap_factor
+
+        self.count = 0
+        """Total number of frames received."""
+
+        self.gaps = 0
+        """Total number of intervals longer than expected."""
+
+        self.last_timestamp: float | None = None
+        """Timestamp of the most recent frame."""
+
+        self._timestamps: deque[float] = deque()
+        self._interval_sum = 0.0
+        self._interval_square_sum = 0.0
+        self._mean_interval: float | None = None
+
+    def update(self, timestamp: float) -> None:
+        """Add a frame received at the given time.
+
+        Args:
+            timestamp: Receive time of the frame in seconds
+
+        """
+        if self.last_timestamp is not None:
+            # Compare against the last known mean, which survives the window
+            # emptying, so dropouts longer than the window still count as gaps.
+            interval = timestamp - self.last_timestamp
+            if (
+                self._mean_interval is not None
+                and interval > self.gap_factor * self._mean_interval
+            ):
+                self.gaps += 1
+
+            if self._timestamps:
+                self._interval_sum += interval
+                self._interval_square_sum += interval * interval
+
+        self._timestamps.append(timestamp)
+        self.count += 1
+        self.last_timestamp = timestamp
+        self.expire(timestamp)
+
+        intervals = len(self._timestamps) - 1
+        if intervals > 0:
+            self._mean_interval = self._interval_sum / intervals
+
+    def expire(self, now: float) -> None:
+        """Drop frames that are older than the window.
+
+        Args:
+            now: Current time in seconds, in the same clock as the timestamps
+
+        """
+        timestamps = self._timestamps
+        while timestamps and timestamps[0] < now - self.window:
+            oldest = timestamps.popleft()
+            if timestamps:
+                interval = timestamps[0] - oldest
+                self._interval_sum -= interval
+                self._interval_square_sum -= interval * interval
+
+        if len(timestamps) < 2:  # noqa: PLR2004
+            # Reset to avoid accumulating floating-point drift.
+            self._interval_sum = 0.0
+            self._interval_square_sum = 0.0
+
+    @property
+    def rate(self) -> float:
+        """Frame rate in hertz over the window."""
+        intervals = len(self._timestamps) - 1
+        if intervals < 1 or self._interval_sum <= 0:
+            return 0.0
+
+        return intervals / self._interval_sum
+
+    @property
+    def jitter(self) -> float:
+        """Standard deviation of the intervals between frames in seconds."""
+        intervals = len(self._timestamps) - 1
+        if intervals < 1:
+            return 0.0
+
+        mean = self._interval_sum / intervals
+        variance = self._interval_square_sum / intervals - mean * mean
+        return math.sqrt(max(variance, 0.0))
+
+
+class BusMonitor:
+    """Sliding-window statistics of all frames on a CAN bus.
+
+    Args:
+        window: Length of the sliding window in seconds
+        bitrate: Bitrate of the bus in bits per second
+        known_ids: Arbitration IDs that are expected on the bus, used to count
+            unknown frames
+        gap_factor: Ratio to the mean interval above which an interval counts as
+            a gap
+
+    """
+
+    def __init__(
+        self,
+        *,
+        window: float = 1.0,
+        bitrate: int = 1_000_000,
+        known_ids: Collection[int] = (),
+        gap_factor: float = 2.5,
+    ) -> None:
+        """Initialize an empty bus monitor."""
+        self.window = window
+        self.bitrate = bitrate
+        self.known_ids = frozenset(known_ids)
+        self.gap_factor = gap_factor
+
+        self.stats: dict[int, FrameStats] = {}
+        """Statistics of each arbitration ID seen on the bus."""
+
+        self.unknown_count = 0
+        """Total number of frames with an arbitration ID that is not known."""
+
+        self._bits: deque[tuple[float, int]] = deque()
+        self._bit_sum = 0
+
+    def update(self, frame: Frame) -> None:
+        """Add a frame received from the bus.
+
+        Args:
+            frame: Received CAN frame
+
+        """
+        arbitration_id = frame.arbitration_id
+        stats = self.stats.get(arbitration_id)
+        if stats is None:
+            stats = FrameStats(window=self.window, gap_factor=self.gap_factor)
+            self.stats[arbitration_id] = stats
+
+        if arbitration_id not in self.known_ids:
+            self.unknown_count += 1
+
+        stats.update(frame.timestamp)
+
+        bits = frame_bits(len(frame.data), extended=arbitration_id > _MAX_STANDARD_ID)
+        self._bits.append((frame.timestamp, bits))
+        self._bit_sum += bits
+        self._expire_bits(frame.timestamp)
+
+    def expire(self, now: float) -> None:
+        """Drop frames that are older than the window from every statistic.
+
+        Call this periodically while the bus is idle so the statistics decay.
+
+        Args:
+            now: Current time in seconds, in the same clock as the timestamps
+
+        """
+        for stats in self.stats.values():
+            stats.expire(now)
+
+        self._expire_bits(now)
+
+    @property
+    def load(self) -> float:
+        """Estimated fraction of the bus bandwidth used over the window."""
+        return self._bit_sum / (self.window * self.bitrate)
+
+    def _expire_bits(self, now: float) -> None:
+        bits = self._bits
+        while bits and bits[0][0] < now - self.window:
+            self._bit_sum -= bits.popleft()[1]
+
+
+__all__ = ["BusMonitor", "FrameStats", "frame_bits"]
@@ -0,0 +1,33 @@
+"""Results of blocking motion commands of the PiPER arm."""
+
+
+class MoveResult:
+    """Outcome of a blocking move of the arm towards a target.
+
+    Args:
+        settled: Whether every axis came within tolerance before the timeout
+        settle_time: Seconds from sending the target until the arm settled, or
+            until the timeout expired
+        error: Final error of each axis (target minus feedback) in the units of
+            the target, or None for axes that never received feedback
+
+    """
+
+    def __init__(
+        self, *, settled: bool, settle_time: float, error: list[int | None]
+    ) -> None:
+        """Initialize the move result."""
+        self.settled = settled
+        self.settle_time = settle_time
+        self.error = error
+
+    @property
+    def max_error(self) -> int | None:
+        """Largest absolute error over all axes, or None if any axis is missing."""
+        if None in self.error:
+            return None
+
+        return max(abs(e) for e in self.error)
+
+
+__all__ = ["MoveResult"]
@@ -0,0 +1,315 @@
+"""Recording of feedback from several PiPER arms into chunked columnar episodes.
+
+An episode is a directory with one entry per chunk of rows. Each row samples the
+latest feedback of every arm at one instant of the monotonic clock, so the arms
+share a common timeline. The chunks are written by a background process, either
+as compressed ``.npz`` archives or as directories of ``.npy`` files that can be
+memory-mapped. Every chunk holds these columns:
+
+- ``time``: Monotonic time of each row in nanoseconds, with shape (n,).
+- ``positions``: Six joint positions and the gripper position of each arm, with
+  shape (n, arms, 7).
+- ``stamps``: Receive time of the latest feedback of each arm, mapped onto the
+  monotonic clock in nanoseconds, or -1 before any feedback, with shape (n, arms).
+"""
+
+import json
+import multiprocessing
+import queue
+import signal
+import time
+from collections.abc import Callable, Iterator, Sequence
+from multiprocessing.queues import Queue
+from pathlib import Path
+from types import TracebackType
+from typing import Self
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .clock import ClockAligner
+from .errors import RecorderWriterError
+from .messages import (
+    GripperFeedbackMessage,
+    JointFeedback12Message,
+    JointFeedback34Message,
+    JointFeedback56Message,
+    ReceiveMessage,
+)
+
+COLUMNS = ("time", "positions", "stamps")
+"""Names of the columns in every chunk of an episode."""
+
+# Feedback message types mapped to the index of their first position in the state
+# of an arm and the attribute names of their positions.
+_POSITION_FEEDBACKS = {
+    JointFeedback12Message: (0, ("joint_1", "joint_2")),
+    JointFeedback34Message: (2, ("joint_3", "joint_4")),
+    JointFeedback56Message: (4, ("joint_5", "joint_6")),
+    GripperFeedbackMessage: (6, ("position",)),
+}
+
+# Seconds between checks that the writer is alive while waiting to queue a chunk.
+_PUT_INTERVAL = 0.1
+
+
+def _chunk_name(index: int) -> str:
+    return f"chunk-{index:06d}"
+
+
+def _empty_columns(rows: int, arms: int) -> dict[str, NDArray]:
+    return {
+        "time": np.empty(rows, dtype=np.int64),
+        "positions": np.empty((rows, arms, 7), dtype=np.int32),
+        "stamps": np.empty((rows, arms), dtype=np.int64),
+    }
+
+
+def _write_chunks(chunks: Queue, path: Path, *, compress: bool) -> None:
+    # A Ctrl+C in the terminal also reaches the writer, which must keep writing
+    # until the recorder is closed so no chunks are lost.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    while (item := chunks.get()) is not None:
+        index, columns = item
+        if compress:
+            np.savez_compressed(path / f"{_chunk_name(index)}.npz", **columns)
+        else:
+            directory = path / _chunk_name(index)
+            directory.mkdir()
+            for name, values in columns.items():
+                np.save(directory / f"{name}.npy", values)
+
+
+class EpisodeRecorder:
+    """Records the feedback of several arms into an episode on disk.
+
+    Feed the messages read from each arm to `update`, from any thread, and call
+    `sample` at the rate the episode should be recorded at. Full chunks are handed
+    to a background writer process, and sampling blocks while too many chunks are
+    waiting to be written, so the memory used stays bounded however long the
+    episode is.
+
+    Args:
+        path: Directory to write the episode into, which is created if missing
+        arms: Names of the recorded arms, in the order of their columns
+        chunk_size: Number of rows in each chunk
+        max_pending: Maximum number of full chunks waiting to be written
+        compress: Whether to write compressed ``.npz`` chunks instead of ``.npy``
+            files that can be memory-mapped
+        clock: Function that returns the monotonic time in nanoseconds
+
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        path: str | Path,
+        arms: Sequence[str],
+        *,
+        chunk_size: int = 1024,
+        max_pending: int = 4,
+        compress: bool = True,
+        clock: Callable[[], int] = time.monotonic_ns,
+    ) -> None:
+        """Create the episode directory and start the writer process."""
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.arms = tuple(arms)
+        self.chunk_size = chunk_size
+        self.compress = compress
+        self.clock = clock
+
+        self.rows = 0
+        """Number of rows sampled so far."""
+
+        # Each state is replaced rather than modified, so a sample never sees the
+        # positions of one message with the stamp of another.
+        self._states = [((0,) * 7, -1)] * len(self.arms)
+        self._aligners = [ClockAligner(clock=clock) for _ in self.arms]
+
+        self._chunk = _empty_columns(self.chunk_size, len(self.arms))
+        self._chunk_rows = 0
+        self._chunk_count = 0
+
+        # Spawned rather than forked, since the arms are usually read from threads.
+        context = multiprocessing.get_context("spawn")
+        self._chunks = context.Queue(maxsize=max_pending)
+        self._writer = context.Process(
+            target=_write_chunks,
+            args=(self._chunks, self.path),
+            kwargs={"compress": compress},
+            daemon=True,
+        )
+        self._writer.start()
+
+    def __enter__(self) -> Self:
+        """Enter context manager."""
+        return self
+
+    def __exit__(
+        self,
+        _exc_type: type[BaseException] | None,
+        _exc_val: BaseException | None,
+        _exc_tb: TracebackType | None,
+    ) -> None:
+        """Exit context manager and finish the episode."""
+        self.close()
+
+    def update(self, arm: int, msg: ReceiveMessage) -> None:
+        """Update the latest state of an arm from a message read from it.
+
+        Messages other than joint and gripper feedback are ignored.
+
+        Args:
+            arm: Index of the arm in `arms`
+            msg: Message read from the arm
+
+        """
+        feedback = _POSITION_FEEDBACKS.get(type(msg))
+        if feedback is None:
+            return
+
+        aligner = self._aligners[arm]
+        aligner.update(msg.timestamp)
+
+        index, names = feedback
+        positions = list(self._states[arm][0])
+        for i, name in enumerate(names, index):
+            positions[i] = getattr(msg, name)
+
+        self._states[arm] = (tuple(positions), aligner.to_monotonic_ns(msg.timestamp))
+
+    def sample(self, now: int | None = None) -> None:
+        """Append a row with the latest state of every arm.
+
+        Args:
+            now: Monotonic time of the row in nanoseconds, or None to read the clock
+
+        Raises:
+            RecorderWriterError: If the writer process exited unexpectedly
+
+        """
+        row = self._chunk_rows
+        chunk = self._chunk
+        chunk["time"][row] = self.clock() if now is None else now
+        for arm, (positions, stamp) in enumerate(self._states):
+            chunk["positions"][row, arm] = positions
+            chunk["stamps"][row, arm] = stamp
+
+        self._chunk_rows += 1
+        self.rows += 1
+        if self._chunk_rows == self.chunk_size:
+            self._flush()
+
+    def close(self) -> None:
+        """Write the remaining rows and the episode metadata, and stop the writer.
+
+        Raises:
+            RecorderWriterError: If the writer process exited unexpectedly
+
+        """
+        if self._chunks is None:
+            return
+
+        self._flush()
+        self._put(None)
+        self._writer.join()
+        self._chunks.close()
+        self._chunks = None
+        if self._writer.exitcode != 0:
+            raise RecorderWriterError(self._writer.exitcode)
+
+        metadata = {
+            "arms": self.arms,
+            "rows": self.rows,
+            "chunks": self._chunk_count,
+            "compressed": self.compress,
+        }
+        (self.path / "episode.json").write_text(json.dumps(metadata))
+
+    def _flush(self) -> None:
+        if self._chunk_rows == 0:
+            return
+
+        # The queue pickles the chunk in the background, so it is not reused.
+        rows = self._chunk_rows
+        self._put((self._chunk_count, {k: v[:rows] for k, v in self._chunk.items()}))
+        self._chunk = _empty_columns(self.chunk_size, len(self.arms))
+        self._chunk_rows = 0
+        self._chunk_count += 1
+
+    def _put(self, item: tuple[int, dict[str, NDArray]] | None) -> None:
+        while True:
+            try:
+                self._chunks.put(item, timeout=_PUT_INTERVAL)
+            except queue.Full:
+                if not self._writer.is_alive():
+                    raise RecorderWriterError(self._writer.exitcode) from None
+            else:
+                return
+
+
+class Episode:
+    """An episode recorded by `EpisodeRecorder`, opened for reading.
+
+    Args:
+        path: Directory the episode was recorded into
+        mmap_mode: Mode to memory-map uncompressed chunks with, such as 'r', or
+            None to read them into memory
+
+    """
+
+    def __init__(self, path: str | Path, *, mmap_mode: str | None = None) -> None:
+        """Read the metadata of the episode."""
+        self.path = Path(path)
+        self.mmap_mode = mmap_mode
+
+        metadata = json.loads((self.path / "episode.json").read_text())
+        self.arms: tuple[str, ...] = tuple(metadata["arms"])
+        """Names of the recorded arms, in the order of their columns."""
+
+        self.rows: int = metadata["rows"]
+        """Total number of rows in the episode."""
+
+        self.compressed: bool = metadata["compressed"]
+        """Whether the chunks are compressed ``.npz`` archives."""
+
+        self._chunk_count = metadata["chunks"]
+
+    def chunks(self) -> Iterator[dict[str, NDArray]]:
+        """Iterate over the columns of each chunk in order.
+
+        Yields:
+            The columns of a chunk mapped by their names
+
+        """
+        for index in range(self._chunk_count):
+            name = _chunk_name(index)
+            if self.compressed:
+                with np.load(self.path / f"{name}.npz") as archive:
+                    yield dict(archive)
+            else:
+                yield {
+                    column: np.load(
+                        self.path / name / f"{column}.npy", mmap_mode=self.mmap_mode
+                    )
+                    for column in COLUMNS
+                }
+
+    def load(self) -> dict[str, NDArray]:
+        """Load every column of the episode, joined across chunks.
+
+        Returns:
+            The columns of the episode mapped by their names
+
+        """
+        chunks = list(self.chunks())
+        if not chunks:
+            return _empty_columns(0, len(self.arms))
+
+        return {
+            column: np.concatenate([chunk[column] for chunk in chunks])
+            for column in COLUMNS
+        }
+
+
+__all__ = ["COLUMNS", "Episode", "EpisodeRecorder"]
@@ -0,0 +1,380 @@
+"""Streaming of the state of a leader arm to a remote follower over UDP.
+
+`StateSender` sends the joint and gripper positions of the leader in compact
+packets numbered in sequence and stamped with the time they were sent.
+`StateReceiver` reads them on the follower side into a `JitterBuffer`, which
+plays them back after an adaptive delay, interpolating between packets, so that
+the follower moves smoothly despite varying network delays.
+"""
+
+import select
+import socket
+import struct
+import time
+from collections import deque
+from collections.abc import Callable, Sequence
+from types import TracebackType
+from typing import Self
+
+from .clock import ClockAligner
+from .errors import InvalidPacketError
+from .stats import RunningStats
+
+# Magic bytes, version, padding, sequence number, send time in nanoseconds, and the
+# positions of the 6 joints and the gripper.
+_PACKET = struct.Struct("<2sBxIq7i")
+_MAGIC = b"PK"
+_VERSION = 1
+
+# Sequence numbers wrap around, so a packet is newer than another if it is less
+# than half of the sequence space ahead of it.
+_SEQUENCE_SPACE = 1 << 32
+
+
+def encode_state(sequence: int, sent: int, positions: Sequence[int]) -> bytes:
+    """Encode the state of an arm into a packet.
+
+    Args:
+        sequence: Sequence number of the packet, wrapping around at 2**32
+        sent: Time the packet is sent in nanoseconds, such as from ``time.time_ns``
+        positions: Positions of the 6 joints in 0.001 degrees followed by the
+            position of the gripper in 0.001 mm
+
+    Returns:
+        The encoded packet
+
+    """
+    return _PACKET.pack(_MAGIC, _VERSION, sequence, sent, *positions)
+
+
+def decode_state(packet: bytes) -> tuple[int, int, tuple[int, ...]]:
+    """Decode the state of an arm from a packet.
+
+    Args:
+        packet: Packet encoded by `encode_state`
+
+    Returns:
+        The sequence number, send time in nanoseconds, and positions of the packet
+
+    Raises:
+        InvalidPacketError: If the packet is not a state packet of this version
+
+    """
+    if len(packet) != _PACKET.size:
+        raise InvalidPacketError(packet)
+
+    magic, version, sequence, sent, *positions = _PACKET.unpack(packet)
+    if magic != _MAGIC or version != _VERSION:
+        raise InvalidPacketError(packet)
+
+    return sequence, sent, tuple(positions)
+
+
+class JitterBuffer:
+    """Plays back received positions after an adaptive delay.
+
+    The send times of the packets are mapped onto the monotonic clock of the
+    receiver with a `piper_kit.clock.ClockAligner`, which removes the offset
+    between the clocks and the smallest network delay. The variation of the delay
+    is estimated as the interarrival jitter of RFC 3550, and positions are played
+    back that many times later, bounded by a minimum and maximum delay, so
+    packets delayed by the network usually arrive before they are needed.
+
+    Packets that are not newer than the newest packet received, or that arrive
+    after their time was played back, are dropped as late. Gaps in the sequence
+    numbers are counted as lost packets, so a reordered packet counts as both lost
+    and late.
+
+    Args:
+        min_delay: Minimum playback delay in seconds
+        max_delay: Maximum playback delay in seconds
+        jitter_factor: Multiple of the estimated jitter that playback is delayed by
+        window: Number of most recent packets the clock offset is estimated from
+        clock: Function that returns the monotonic time in nanoseconds
+
+    """
+
+    def __init__(
+        self,
+        *,
+        min_delay: float = 0.005,
+        max_delay: float = 0.2,
+        jitter_factor: float = 3.0,
+        window: int = 1000,
+        clock: Callable[[], int] = time.monotonic_ns,
+    ) -> None:
+        """Initialize an empty buffer."""
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.jitter_factor = jitter_factor
+        self.clock = clock
+
+        self.jitter = 0.0
+        """Estimated interarrival jitter in seconds."""
+
+        self.received = 0
+        """Number of packets received, including late ones."""
+
+        self.lost = 0
+        """Number of packets missing from the sequence."""
+
+        self.late = 0
+        """Number of packets dropped as late."""
+
+        self._aligner = ClockAligner(window=window, clock=clock)
+        self._packets: deque[tuple[int, tuple[int, ...]]] = deque()
+        self._sequence: int | None = None
+        self._transit: int | None = None
+        self._played = -1 << 63
+
+    @property
+    def delay(self) -> float:
+        """Current playback delay in seconds."""
+        delay = self.jitter_factor * self.jitter
+        return min(max(delay, self.min_delay), self.max_delay)
+
+    def push(
+        self,
+        sequence: int,
+        sent: int,
+        positions: tuple[int, ...],
+        now: int | None = None,
+    ) -> bool:
+        """Add a received packet.
+
+        Args:
+            sequence: Sequence number of the packet
+            sent: Time the packet was sent in nanoseconds, in the clock of the sender
+            positions: Positions in the packet
+            now: Monotonic time in nanoseconds at which the packet was received, or
+                None to read the clock now
+
+        Returns:
+            True if the packet was added, or False if it was dropped as late
+
+        """
+        if now is None:
+            now = self.clock()
+
+        self.received += 1
+        if self._sequence is not None:
+            gap = (sequence - self._sequence) % _SEQUENCE_SPACE
+            if gap == 0 or gap >= _SEQUENCE_SPACE // 2:
+                self.late += 1
+                return False
+            self.lost += gap - 1
+        self._sequence = sequence
+
+        transit = now - sent
+        if self._transit is not None:
+            variation = abs(transit - self._transit) / 1e9
+            self.jitter += (variation - self.jitter) / 16
+        self._transit = transit
+
+        self._aligner.update(sent / 1e9, now)
+        playback = self._aligner.to_monotonic_ns(sent / 1e9)
+        if playback <= self._played:
+            self.late += 1
+            return False
+
+        self._packets.append((playback, positions))
+        return True
+
+    def sample(self, now: int | None = None) -> tuple[int, ...] | None:
+        """Play back the positions at a time, delayed by the playback delay.
+
+        Positions between two packets are linearly interpolated. Before the first
+        packet and after the last one, the positions of that packet are held.
+
+        Args:
+            now: Monotonic time in nanoseconds, or None to read the clock now
+
+        Returns:
+            The rounded positions, or None if no packets were received yet
+
+        """
+        if now is None:
+            now = self.clock()
+
+        played = max(now - round(self.delay * 1e9), self._played)
+        self._played = played
+
+        packets = self._packets
+        while len(packets) > 1 and packets[1][0] <= played:
+            packets.popleft()
+
+        if not packets:
+            return None
+
+        start, positions = packets[0]
+        if played <= start or len(packets) == 1:
+            return positions
+
+        end, next_positions = packets[1]
+        fraction = (played - start) / (end - start)
+        return tuple(
+            round(a + (b - a) * fraction)
+            for a, b in zip(positions, next_positions, strict=True)
+        )
+
+
+class StateSender:
+    """Sends the state of an arm to a `StateReceiver` over UDP.
+
+    Args:
+        address: Host and port of the receiver
+        clock: Function that returns the time in nanoseconds that packets are
+            stamped with, which should be synchronized with the clock of the
+            receiver to measure latency
+
+    """
+
+    def __init__(
+        self, address: tuple[str, int], *, clock: Callable[[], int] = time.time_ns
+    ) -> None:
+        """Open a UDP socket to send from."""
+        self.address = address
+        self.clock = clock
+
+        self.sequence = 0
+        """Sequence number of the next packet."""
+
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+    def __enter__(self) -> Self:
+        """Enter context manager."""
+        return self
+
+    def __exit__(
+        self,
+        _exc_type: type[BaseException] | None,
+        _exc_val: BaseException | None,
+        _exc_tb: TracebackType | None,
+    ) -> None:
+        """Exit context manager and close the socket."""
+        self.close()
+
+    def send(self, positions: Sequence[int]) -> None:
+        """Send the state of an arm.
+
+        Args:
+            positions: Positions of the 6 joints in 0.001 degrees followed by the
+                position of the gripper in 0.001 mm
+
+        """
+        packet = encode_state(self.sequence, self.clock(), positions)
+        self._socket.sendto(packet, self.address)
+        self.sequence = (self.sequence + 1) % _SEQUENCE_SPACE
+
+    def close(self) -> None:
+        """Close the socket."""
+        self._socket.close()
+
+
+class StateReceiver:
+    """Receives the state of an arm from a `StateSender` into a jitter buffer.
+
+    Args:
+        address: Host and port to listen on, where port 0 picks a free port
+        buffer: Jitter buffer to add the packets to, or None to use a default one
+        clock: Function that returns the time in nanoseconds, in the same clock as
+            the sender, that latency is measured with
+
+    """
+
+    def __init__(
+        self,
+        address: tuple[str, int],
+        *,
+        buffer: JitterBuffer | None = None,
+        clock: Callable[[], int] = time.time_ns,
+    ) -> None:
+        """Open a UDP socket listening on the address."""
+        self.buffer = buffer if buffer is not None else JitterBuffer()
+        self.clock = clock
+
+        self.latency = RunningStats()
+        """Statistics of the time in seconds from sending a packet to playing it
+        back, which is only accurate if the clocks of both sides are synchronized.
+        """
+
+        self.invalid = 0
+        """Number of malformed packets received."""
+
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._socket.bind(address)
+        self._socket.setblocking(False)  # noqa: FBT003
+
+    def __enter__(self) -> Self:
+        """Enter context manager."""
+        return self
+
+    def __exit__(
+        self,
+        _exc_type: type[BaseException] | None,
+        _exc_val: BaseException | None,
+        _exc_tb: TracebackType | None,
+    ) -> None:
+        """Exit context manager and close the socket."""
+        self.close()
+
+    @property
+    def address(self) -> tuple[str, int]:
+        """Host and port that the receiver listens on."""
+        return self._socket.getsockname()
+
+    def fileno(self) -> int:
+        """Return the file descriptor of the socket."""
+        return self._socket.fileno()
+
+    def poll(self, timeout: float | None = 0.0) -> int:
+        """Read every packet waiting in the socket into the jitter buffer.
+
+        Args:
+            timeout: Maximum time in seconds to wait for the first packet, or None
+                to wait forever
+
+        Returns:
+            The number of packets added to the jitter buffer
+
+        """
+        select.select([self._socket], [], [], timeout)
+        count = 0
+        while True:
+            try:
+                packet = self._socket.recv(_PACKET.size + 1)
+            except BlockingIOError:
+                return count
+
+            try:
+                sequence, sent, positions = decode_state(packet)
+            except InvalidPacketError:
+                self.invalid += 1
+                continue
+
+            if self.buffer.push(sequence, sent, positions):
+                latency = (self.clock() - sent) / 1e9 + self.buffer.delay
+                self.latency.update(latency)
+                count += 1
+
+    def sample(self) -> tuple[int, ...] | None:
+        """Play back the positions at the current time from the jitter buffer.
+
+        Returns:
+            The rounded positions, or None if no packets were received yet
+
+        """
+        return self.buffer.sample()
+
+    def close(self) -> None:
+        """Close the socket."""
+        self._socket.close()
+
+
+__all__ = [
+    "JitterBuffer",
+    "StateReceiver",
+    "StateSender",
+    "decode_state",
+    "encode_state",
+]
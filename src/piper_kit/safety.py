@@ -0,0 +1,208 @@
+"""Safety envelope that validates commands before they are sent to the PiPER arm."""
+
+from collections.abc import Sequence
+
+from .errors import SafetyViolationError
+
+JOINT_LIMITS = (
+    (-150_000, 150_000),
+    (0, 180_000),
+    (-170_000, 0),
+    (-100_000, 100_000),
+    (-70_000, 70_000),
+    (-120_000, 120_000),
+)
+"""Lower and upper position limits of each joint in 0.001 degrees."""
+
+
+class SafetyEnvelope:
+    """Bounds that joint, end-effector pose, and gripper commands must stay within.
+
+    The bounds are unpacked into flat tuples when the envelope is created, so
+    checking a command costs a few comparisons per value. Checking never changes
+    the envelope; step limits compare each value against the last one recorded as
+    sent, and are skipped for values that have not been recorded yet.
+
+    Args:
+        joint_limits: Lower and upper position limits of each joint in 0.001
+            degrees
+        max_joint_step: Maximum change of a joint position between two commands
+            in 0.001 degrees, or None to not limit it
+        workspace: Lower and upper limits of the X, Y, and Z positions of the
+            end-effector in 0.001 mm, or None to not limit them
+        max_position_step: Maximum change of the X, Y, or Z position of the
+            end-effector between two commands in 0.001 mm, or None to not limit it
+        gripper_range: Lower and upper limits of the gripper position in 0.001
+            mm, or None to not limit it
+
+    """
+
+    def __init__(
+        self,
+        *,
+        joint_limits: Sequence[tuple[int, int]] = JOINT_LIMITS,
+        max_joint_step: int | None = None,
+        workspace: Sequence[tuple[int, int]] | None = None,
+        max_position_step: int | None = None,
+        gripper_range: tuple[int, int] | None = None,
+    ) -> None:
+        """Initialize the envelope and precompute its bounds."""
+        self.joint_limits = tuple(tuple(limits) for limits in joint_limits)
+        self.max_joint_step = max_joint_step
+        self.workspace = None if workspace is None else tuple(map(tuple, workspace))
+        self.max_position_step = max_position_step
+        self.gripper_range = gripper_range
+
+        self._joint_lows = tuple(low for low, _ in self.joint_limits)
+        self._joint_highs = tuple(high for _, high in self.joint_limits)
+        self._position_lows = (
+            None if self.workspace is None else tuple(lo for lo, _ in self.workspace)
+        )
+        self._position_highs = (
+            None if self.workspace is None else tuple(hi for _, hi in self.workspace)
+        )
+
+        self._last_joints: list[int | None] = [None] * 6
+        self._last_positions: list[int | None] = [None] * 3
+
+    def reset(self) -> None:
+        """Forget the last commanded values, so the next steps are not limited."""
+        self._last_joints = [None] * 6
+        self._last_positions = [None] * 3
+
+    def check_joints(self, index: int, positions: Sequence[int]) -> None:
+        """Check joint positions against the joint limits and the step limit.
+
+        Args:
+            index: Index of the first joint, from 0 for joint 1
+            positions: Consecutive joint positions starting at that joint
+
+        Raises:
+            SafetyViolationError: If any position is outside the envelope
+
+        """
+        lows, highs, last = self._joint_lows, self._joint_highs, self._last_joints
+        step = self.max_joint_step
+        for i, position in enumerate(positions, index):
+            if not lows[i] <= position <= highs[i]:
+                msg = f"joint {i + 1} position {position} outside {lows[i]}..{highs[i]}"
+                raise SafetyViolationError(msg)
+
+            previous = last[i]
+            if (
+                step is not None
+                and previous is not None
+                and abs(position - previous) > step
+            ):
+                msg = f"joint {i + 1} step {position - previous} exceeds {step}"
+                raise SafetyViolationError(msg)
+
+    def record_joints(self, index: int, positions: Sequence[int]) -> None:
+        """Record joint positions as sent, as the base of the next step limits.
+
+        Args:
+            index: Index of the first joint, from 0 for joint 1
+            positions: Consecutive joint positions starting at that joint
+
+        """
+        self._last_joints[index : index + len(positions)] = positions
+
+    def check_positions(self, index: int, positions: Sequence[int]) -> None:
+        """Check end-effector positions against the workspace and the step limit.
+
+        Args:
+            index: Index of the first axis, from 0 for X
+            positions: Consecutive X, Y, or Z positions starting at that axis
+
+        Raises:
+            SafetyViolationError: If any position is outside the envelope
+
+        """
+        lows, highs, last = (
+            self._position_lows,
+            self._position_highs,
+            self._last_positions,
+        )
+        step = self.max_position_step
+        for i, position in enumerate(positions, index):
+            if lows is not None and not lows[i] <= position <= highs[i]:
+                msg = f"{'xyz'[i]} position {position} outside {lows[i]}..{highs[i]}"
+                raise SafetyViolationError(msg)
+
+            previous = last[i]
+            if (
+                step is not None
+                and previous is not None
+                and abs(position - previous) > step
+            ):
+                msg = f"{'xyz'[i]} step {position - previous} exceeds {step}"
+                raise SafetyViolationError(msg)
+
+    def record_positions(self, index: int, positions: Sequence[int]) -> None:
+        """Record end-effector positions as sent, as the base of the next steps.
+
+        Args:
+            index: Index of the first axis, from 0 for X
+            positions: Consecutive X, Y, or Z positions starting at that axis
+
+        """
+        self._last_positions[index : index + len(positions)] = positions
+
+    def check_gripper(self, position: int) -> None:
+        """Check a gripper position against the gripper range.
+
+        Args:
+            position: Gripper position in 0.001 mm
+
+        Raises:
+            SafetyViolationError: If the position is outside the range
+
+        """
+        if self.gripper_range is not None:
+            low, high = self.gripper_range
+            if not low <= position <= high:
+                msg = f"gripper position {position} outside {low}..{high}"
+                raise SafetyViolationError(msg)
+
+    def validate_joint_trajectory(
+        self,
+        joints: Sequence[Sequence[int]],
+        grippers: Sequence[int] | None = None,
+    ) -> None:
+        """Check a whole trajectory of joint commands at once.
+
+        The checks are vectorized over all rows, so a long trajectory can be
+        validated up front instead of failing partway through playback. This does
+        not change the last commanded values used by the step limits.
+
+        Args:
+            joints: Array of shape (n, 6) with the joint positions of each row
+            grippers: Array of shape (n,) with the gripper position of each row, or
+                None to skip the gripper checks
+
+        Raises:
+            SafetyViolationError: If any row is outside the envelope, naming the
+                first such row
+
+        """
+        # Imported here so that NumPy is only loaded when trajectories are checked.
+        import numpy as np
+
+        joints = np.asarray(joints)
+        bad = (joints < self._joint_lows) | (joints > self._joint_highs)
+        if self.max_joint_step is not None:
+            steps = np.abs(np.diff(joints, axis=0)) > self.max_joint_step
+            bad[1:] |= steps
+
+        if grippers is not None and self.gripper_range is not None:
+            grippers = np.asarray(grippers)
+            low, high = self.gripper_range
+            bad |= ((grippers < low) | (grippers > high))[:, np.newaxis]
+
+        rows = np.flatnonzero(bad.any(axis=1))
+        if len(rows) > 0:
+            msg = f"trajectory row {rows[0]} outside the envelope"
+            raise SafetyViolationError(msg)
+
+
+__all__ = ["JOINT_LIMITS", "SafetyEnvelope"]
@@ -0,0 +1,159 @@
+"""Immutable snapshots of the state of the PiPER arm, shared between threads."""
+
+from typing import TYPE_CHECKING, NoReturn, Self
+
+from .messages import (
+    GripperFeedbackMessage,
+    JointFeedback12Message,
+    JointFeedback34Message,
+    JointFeedback56Message,
+    MotorInfoBMessage,
+)
+
+if TYPE_CHECKING:
+    from ._piper import Piper
+
+
+class ArmState:
+    """Immutable snapshot of the joint, gripper, and driver state of an arm.
+
+    A snapshot never changes once created, so a thread holding one always sees
+    values that belong together, without locks or copying. Newer state is
+    published by replacing the reference to the snapshot instead.
+
+    Args:
+        joints: Positions of the 6 joints in 0.001 degrees
+        gripper: Position of the gripper in 0.001 mm
+        status: Driver status codes of the 6 joints followed by the status code of
+            the gripper
+        timestamp: Receive time in seconds of the latest message in the snapshot
+        sequence: Number of snapshots published before this one
+
+    """
+
+    __slots__ = ("gripper", "joints", "sequence", "status", "timestamp")
+
+    joints: tuple[int, ...]
+    gripper: int
+    status: tuple[int, ...]
+    timestamp: float
+    sequence: int
+
+    def __init__(
+        self,
+        joints: tuple[int, ...] = (0,) * 6,
+        gripper: int = 0,
+        status: tuple[int, ...] = (0,) * 7,
+        timestamp: float = 0.0,
+        sequence: int = 0,
+    ) -> None:
+        """Initialize the snapshot, which cannot be modified afterwards."""
+        object.__setattr__(self, "joints", joints)
+        object.__setattr__(self, "gripper", gripper)
+        object.__setattr__(self, "status", status)
+        object.__setattr__(self, "timestamp", timestamp)
+        object.__setattr__(self, "sequence", sequence)
+
+    def __setattr__(self, name: str, value: object) -> NoReturn:
+        """Reject modifications, since snapshots are immutable."""
+        msg = f"cannot assign to field {name!r} of an immutable ArmState"
+        raise AttributeError(msg)
+
+    def __delattr__(self, name: str) -> NoReturn:
+        """Reject deletions, since snapshots are immutable."""
+        msg = f"cannot delete field {name!r} of an immutable ArmState"
+        raise AttributeError(msg)
+
+    def __repr__(self) -> str:
+        """Return the fields of the snapshot."""
+        return (
+            f"ArmState(joints={self.joints}, gripper={self.gripper}, "
+            f"status={self.status}, timestamp={self.timestamp}, "
+            f"sequence={self.sequence})"
+        )
+
+    def replace(self, **changes: object) -> Self:
+        """Return the next snapshot, with some fields replaced.
+
+        Args:
+            **changes: New values of the fields to replace, other than sequence
+
+        Returns:
+            A new snapshot with the next sequence number
+
+        """
+        fields = {name: getattr(self, name) for name in self.__slots__}
+        fields.update(changes, sequence=self.sequence + 1)
+        return type(self)(**fields)
+
+    @property
+    def end_pose(self) -> list[int]:
+        """End-effector pose [x, y, z, pitch, roll, yaw] at the joint positions.
+
+        Computed with `piper_kit.kinematics.forward_kinematics`, in the same units
+        as `piper_kit.Piper.set_end_pose_control`.
+        """
+        # Imported here so that NumPy is only loaded when kinematics are used.
+        from .kinematics import forward_kinematics
+
+        return forward_kinematics(list(self.joints)).round().astype(int).tolist()
+
+
+class ArmStateTracker:
+    """Publishes the state of an arm from the messages read from it.
+
+    The joint feedback of the arm arrives in three messages per cycle. They are
+    collected into a back buffer, and published together once the last of them
+    arrives, so every snapshot holds joint positions from a single cycle. Gripper
+    feedback and motor information are published as they arrive.
+
+    Args:
+        piper: Arm whose messages are tracked, through subscriptions to it
+
+    """
+
+    def __init__(self, piper: "Piper") -> None:
+        """Subscribe to the feedback of the arm, starting from an empty state."""
+        self.state = ArmState()
+        """Latest published snapshot, replaced as a whole on every update."""
+
+        self._joints = [0] * 6
+        self._subscriptions = [
+            piper.on(JointFeedback12Message, self._on_joints_12),
+            piper.on(JointFeedback34Message, self._on_joints_34),
+            piper.on(JointFeedback56Message, self._on_joints_56),
+            piper.on(GripperFeedbackMessage, self._on_gripper),
+            piper.on(MotorInfoBMessage, self._on_motor_info),
+        ]
+
+    def close(self) -> None:
+        """Stop tracking the arm, keeping the latest published state."""
+        for subscription in self._subscriptions:
+            subscription.cancel()
+
+    def _on_joints_12(self, msg: JointFeedback12Message) -> None:
+        self._joints[0:2] = msg.joint_1, msg.joint_2
+
+    def _on_joints_34(self, msg: JointFeedback34Message) -> None:
+        self._joints[2:4] = msg.joint_3, msg.joint_4
+
+    def _on_joints_56(self, msg: JointFeedback56Message) -> None:
+        self._joints[4:6] = msg.joint_5, msg.joint_6
+        self.state = self.state.replace(
+            joints=tuple(self._joints), timestamp=msg.timestamp
+        )
+
+    def _on_gripper(self, msg: GripperFeedbackMessage) -> None:
+        status = (*self.state.status[:6], msg.status.code)
+        self.state = self.state.replace(
+            gripper=msg.position, status=status, timestamp=msg.timestamp
+        )
+
+    def _on_motor_info(self, msg: MotorInfoBMessage) -> None:
+        index = msg.motor_id - 1
+        status = list(self.state.status)
+        status[index] = msg.driver_status.code
+        self.state = self.state.replace(status=tuple(status), timestamp=msg.timestamp)
+
+
+__all__ = ["ArmState", "ArmStateTracker"]
@@ -0,0 +1,52 @@
+"""Running statistics of streams of measurements."""
+
+import math
+
+
+class RunningStats:
+    """Count, mean, standard deviation, and extremes of a stream of values.
+
+    Each update costs constant time and memory, using Welford's algorithm so the
+    variance stays accurate over long streams.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty statistics."""
+        self.count = 0
+        """Number of values added."""
+
+        self.mean = 0.0
+        """Mean of the values added, or 0 without values."""
+
+        self.min = math.inf
+        """Smallest value added, or infinity without values."""
+
+        self.max = -math.inf
+        """Largest value added, or negative infinity without values."""
+
+        self._square_sum = 0.0
+
+    def update(self, value: float) -> None:
+        """Add a value.
+
+        Args:
+            value: Value to add
+
+        """
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._square_sum += delta * (value - self.mean)
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    @property
+    def std(self) -> float:
+        """Population standard deviation of the values added, or 0 without values."""
+        if self.count == 0:
+            return 0.0
+
+        return math.sqrt(self._square_sum / self.count)
+
+
+__all__ = ["RunningStats"]
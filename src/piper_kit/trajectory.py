@@ -0,0 +1,679 @@
+"""Streaming playback of recorded trajectories of the PiPER arm."""
+
+import bisect
+import queue
+import threading
+import time
+from collections.abc import Callable, Iterator, Sequence
+from pathlib import Path
+from types import TracebackType
+from typing import Self
+
+from .errors import InvalidTrajectoryRowError
+from .stats import RunningStats
+
+# Number of values of each arm in a trajectory row: six joints and the gripper.
+_ARM_LENGTH = 7
+
+
+class Waypoint:
+    """A single row of a trajectory.
+
+    Args:
+        duration: Seconds to move from the previous waypoint to this one
+        joints: Positions of the six joints in 0.001 degrees
+        gripper: Position of the gripper in 0.001 mm
+
+    """
+
+    __slots__ = ("duration", "gripper", "joints")
+
+    def __init__(
+        self, duration: float, joints: tuple[float, ...], gripper: float
+    ) -> None:
+        """Initialize the waypoint."""
+        self.duration = duration
+        self.joints = joints
+        self.gripper = gripper
+
+
+def parse_waypoint(line: str, arm: int | None = None) -> Waypoint:
+    """Parse a comma-separated trajectory row.
+
+    Args:
+        line: Row containing the duration, followed by six joint positions and the
+            gripper position of each arm
+        arm: Index of the arm to parse the positions of, or None if the row must
+            contain a single arm
+
+    Returns:
+        The parsed waypoint
+
+    Raises:
+        InvalidTrajectoryRowError: If the row does not contain the positions of
+            the arm, or any of its values is not a number
+
+    """
+    values = line.split(",")
+    start = 1 + _ARM_LENGTH * (arm or 0)
+    if arm is None:
+        valid = len(values) == 1 + _ARM_LENGTH
+    else:
+        valid = (len(values) - 1) % _ARM_LENGTH == 0 and start < len(values)
+    if not valid:
+        raise InvalidTrajectoryRowError(line.strip())
+
+    try:
+        duration = float(values[0])
+        *joints, gripper = (float(v) for v in values[start : start + _ARM_LENGTH])
+    except ValueError:
+        raise InvalidTrajectoryRowError(line.strip()) from None
+
+    return Waypoint(duration, tuple(joints), gripper)
+
+
+def format_waypoint(waypoint: Waypoint) -> str:
+    """Format a waypoint as a comma-separated trajectory row.
+
+    Args:
+        waypoint: Waypoint to format
+
+    Returns:
+        The row without a trailing newline, which `parse_waypoint` parses back
+        into the same waypoint
+
+    """
+    values = (waypoint.duration, *waypoint.joints, waypoint.gripper)
+    return ",".join(str(int(v)) if float(v).is_integer() else str(v) for v in values)
+
+
+def simplify_waypoints(
+    waypoints: Sequence[Waypoint], tolerance: float
+) -> list[Waypoint]:
+    """Remove waypoints that playback can reproduce by interpolation.
+
+    This is a time-parameterized variant of the Ramer-Douglas-Peucker algorithm.
+    Each pass splits, at once, every segment whose interpolation deviates from a
+    removed waypoint by more than the tolerance, so the work of each pass is a
+    few vectorized operations over the whole trajectory. Since playback
+    interpolates linearly in time, the simplified trajectory stays within the
+    tolerance of the original at every instant, not only at the waypoints.
+
+    Args:
+        waypoints: Waypoints of the trajectory
+        tolerance: Maximum deviation of any joint or gripper position, in the
+            units of the waypoints
+
+    Returns:
+        The retained waypoints, with durations adjusted to keep their timing
+
+    """
+    # Imported here so that NumPy is only loaded when trajectories are simplified.
+    import numpy as np
+
+    if len(waypoints) <= 2:  # noqa: PLR2004
+        return list(waypoints)
+
+    times = np.cumsum([w.duration for w in waypoints])
+    positions = np.array([(*w.joints, w.gripper) for w in waypoints])
+    points = np.arange(len(waypoints))
+
+    keep = np.zeros(len(waypoints), dtype=bool)
+    keep[[0, -1]] = True
+    while True:
+        kept = np.flatnonzero(keep)
+
+        # Interpolate every waypoint between the retained waypoints around it.
+        segments = np.minimum(
+            np.searchsorted(kept, points, side="right") - 1, len(kept) - 2
+        )
+        left, right = kept[segments], kept[segments + 1]
+        spans = times[right] - times[left]
+        # Segments without duration are steps, which playback completes at once.
+        ratios = np.divide(
+            times - times[left], spans, out=np.ones_like(times), where=spans > 0
+        )
+        interpolated = (
+            positions[left]
+            + (positions[right] - positions[left]) * (ratios[:, np.newaxis])
+        )
+        errors = np.abs(interpolated - positions).max(axis=1)
+
+        # Split each segment at its waypoint with the largest error.
+        maxima = np.maximum.reduceat(errors, kept[:-1])
+        splits = (errors > tolerance) & (errors == maxima[segments]) & ~keep
+        if not splits.any():
+            break
+
+        _, first = np.unique(segments[splits], return_index=True)
+        keep[np.flatnonzero(splits)[first]] = True
+
+    durations = np.diff(times[kept], prepend=0.0)
+    return [
+        Waypoint(duration, waypoints[i].joints, waypoints[i].gripper)
+        for i, duration in zip(kept.tolist(), durations.tolist(), strict=True)
+    ]
+
+
+class TrajectoryStream:
+    """Lazily streamed waypoints of a trajectory CSV file.
+
+    Rows are parsed in chunks by a background thread that stays a bounded number
+    of chunks ahead of the consumer, so memory use does not depend on the size of
+    the file. While reading, the stream records the byte offset of every
+    ``index_interval``-th row in a sparse index, which lets `seek` resume reading
+    near any previously reached time without rescanning the file.
+
+    Args:
+        path: Path to the trajectory CSV file
+        arm: Index of the arm to stream in a file with the positions of several
+            arms in each row, or None if the file contains a single arm
+        chunk_size: Number of rows parsed per chunk
+        prefetch: Maximum number of parsed chunks buffered ahead of the consumer
+        index_interval: Number of rows between entries of the seek index
+
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        arm: int | None = None,
+        chunk_size: int = 256,
+        prefetch: int = 4,
+        index_interval: int = 1024,
+    ) -> None:
+        """Open the trajectory and start reading ahead from its beginning."""
+        self._path = Path(path)
+        self._arm = arm
+        self._chunk_size = chunk_size
+        self._prefetch = prefetch
+        self._index_interval = index_interval
+
+        # Start time and byte offset of every indexed row.
+        self._index_times = [0.0]
+        self._index_offsets = [0]
+
+        self._queue: queue.Queue | None = None
+        self._stop: threading.Event | None = None
+        self._thread: threading.Thread | None = None
+        self._chunk: list[Waypoint] = []
+        self._chunk_index = 0
+        self._done = False
+
+        self.time = 0.0
+        """Time at which the next waypoint is reached, relative to the start."""
+
+        self._start(0)
+
+    def __enter__(self) -> Self:
+        """Enter the context manager."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Stop reading ahead on exit."""
+        self.close()
+
+    def __iter__(self) -> Iterator[Waypoint]:
+        """Return the stream itself as an iterator of waypoints."""
+        return self
+
+    def __next__(self) -> Waypoint:
+        """Return the next waypoint of the trajectory.
+
+        Raises:
+            StopIteration: If the end of the trajectory has been reached
+            InvalidTrajectoryRowError: If a row of the file is malformed
+
+        """
+        while self._chunk_index >= len(self._chunk):
+            if not self._next_chunk():
+                raise StopIteration
+
+        waypoint = self._chunk[self._chunk_index]
+        self._chunk_index += 1
+        self.time += waypoint.duration
+        return waypoint
+
+    def seek(self, target: float) -> None:
+        """Move the stream so that the next waypoint is reached at or after a time.
+
+        Args:
+            target: Time in seconds relative to the start of the trajectory
+
+        """
+        # Resume from the last indexed row that starts at or before the target.
+        entry = max(bisect.bisect_right(self._index_times, target) - 1, 0)
+        self._start(entry)
+
+        # Skip the rows between the indexed row and the target.
+        while True:
+            if self._chunk_index >= len(self._chunk) and not self._next_chunk():
+                return
+
+            duration = self._chunk[self._chunk_index].duration
+            if self.time + duration >= target:
+                return
+
+            self.time += duration
+            self._chunk_index += 1
+
+    def close(self) -> None:
+        """Stop the read-ahead thread."""
+        if self._thread is not None:
+            self._stop.set()
+            # Unblock the thread if it is waiting for space in the queue.
+            while self._thread.is_alive():
+                try:
+                    self._queue.get_nowait()
+                except queue.Empty:
+                    self._thread.join(0.01)
+            self._thread = None
+
+    def _next_chunk(self) -> bool:
+        if self._done:
+            return False
+
+        item = self._queue.get()
+        if isinstance(item, BaseException):
+            self._done = True
+            raise item
+        if item is None:
+            self._done = True
+            return False
+
+        self._chunk = item
+        self._chunk_index = 0
+        return True
+
+    def _start(self, entry: int) -> None:
+        self.close()
+
+        self._queue = queue.Queue(self._prefetch)
+        self._stop = threading.Event()
+        self._chunk = []
+        self._chunk_index = 0
+        self._done = False
+        self.time = self._index_times[entry]
+
+        self._thread = threading.Thread(
+            target=self._read,
+            args=(entry, self._queue, self._stop),
+            daemon=True,
+        )
+        self._thread.start()
+        self._next_chunk()
+
+    def _read(self, entry: int, out: queue.Queue, stop: threading.Event) -> None:
+        row = entry * self._index_interval
+        start_time = self._index_times[entry]
+        try:
+            with self._path.open("rb") as file:
+                file.seek(self._index_offsets[entry])
+                while not stop.is_set():
+                    chunk = []
+                    while len(chunk) < self._chunk_size:
+                        offset = file.tell()
+                        line = file.readline()
+                        if not line:
+                            break
+                        if not line.strip():
+                            continue
+
+                        # Append the offset first, since `seek` looks up the
+                        # index by time from another thread.
+                        if row == len(self._index_times) * self._index_interval:
+                            self._index_offsets.append(offset)
+                            self._index_times.append(start_time)
+
+                        waypoint = parse_waypoint(line.decode(), self._arm)
+                        start_time += waypoint.duration
+                        chunk.append(waypoint)
+                        row += 1
+
+                    if chunk:
+                        out.put(chunk)
+                    if len(chunk) < self._chunk_size:
+                        out.put(None)
+                        return
+        except (OSError, InvalidTrajectoryRowError) as e:
+            out.put(e)
+
+
+class TrajectoryPlayer:
+    """Time-scaled playback of a streamed trajectory.
+
+    The player keeps its own trajectory clock, which advances with real time
+    multiplied by `speed` and `scale`, and stops while paused. Each call to
+    `sample` returns the position interpolated between the waypoints around the
+    current time.
+
+    Args:
+        stream: Stream of the trajectory waypoints
+        joints: Joint positions to start interpolating from
+        gripper: Gripper position to start interpolating from
+        speed: Initial playback speed, where 1.0 is real time
+        loop: Whether to restart the trajectory after it ends
+        clock: Function returning the current time in seconds
+
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        stream: TrajectoryStream,
+        joints: list[float],
+        gripper: float,
+        *,
+        speed: float = 1.0,
+        loop: bool = False,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the player at the start of the stream."""
+        self.loop = loop
+        self._stream = stream
+        self._clock = clock
+        self._speed = speed
+        self._scale = 1.0
+        self._paused = False
+        self._wall_time = clock()
+        self._time = stream.time
+        self._segment_start = stream.time
+        self._start_joints = list(joints)
+        self._start_gripper = gripper
+        self._target: Waypoint | None = None
+        self._next_target()
+
+    @property
+    def speed(self) -> float:
+        """Playback speed, where 1.0 is real time and 0.5 is half speed."""
+        return self._speed
+
+    @speed.setter
+    def speed(self, speed: float) -> None:
+        self._advance()
+        self._speed = speed
+
+    @property
+    def scale(self) -> float:
+        """Factor applied on top of the speed, such as by a `TrackingGovernor`."""
+        return self._scale
+
+    @scale.setter
+    def scale(self, scale: float) -> None:
+        self._advance()
+        self._scale = scale
+
+    @property
+    def paused(self) -> bool:
+        """Whether the trajectory clock is stopped."""
+        return self._paused
+
+    @property
+    def time(self) -> float:
+        """Current time in seconds relative to the start of the trajectory."""
+        self._advance()
+        return self._time
+
+    def pause(self) -> None:
+        """Stop the trajectory clock."""
+        self._advance()
+        self._paused = True
+
+    def resume(self) -> None:
+        """Restart the trajectory clock."""
+        self._advance()
+        self._paused = False
+
+    def seek(self, target: float) -> None:
+        """Continue playback from a time in the trajectory.
+
+        The arm moves from its current position towards the waypoint that follows
+        the target time, so the commanded position stays continuous.
+
+        Args:
+            target: Time in seconds relative to the start of the trajectory
+
+        """
+        self._advance()
+        self._start_joints, self._start_gripper = self._interpolate()
+        self._stream.seek(target)
+        self._wall_time = self._clock()
+        self._time = target
+        self._segment_start = target
+        self._next_target()
+
+    @property
+    def finished(self) -> bool:
+        """Whether the last waypoint of the trajectory has been reached."""
+        return self._target is None
+
+    def sample(self) -> tuple[list[float], float]:
+        """Return the position at the current trajectory time.
+
+        Returns:
+            The joint positions and the gripper position, which stay at the last
+            waypoint once the trajectory has finished
+
+        """
+        self._advance()
+        while self._target is not None and self._time >= self._segment_end:
+            self._segment_start = self._segment_end
+            self._start_joints = list(self._target.joints)
+            self._start_gripper = self._target.gripper
+            self._next_target()
+
+        return self._interpolate()
+
+    def _advance(self) -> None:
+        now = self._clock()
+        if not self._paused:
+            self._time += (now - self._wall_time) * self._speed * self._scale
+        self._wall_time = now
+
+    def _next_target(self) -> None:
+        self._target = next(self._stream, None)
+        if self._target is None and self.loop and self._segment_start > 0:
+            # Wrap the clock around, moving from the last waypoint to the first.
+            self._stream.seek(0)
+            self._time -= self._segment_start
+            self._segment_start = 0.0
+            self._target = next(self._stream, None)
+
+        self._segment_end = self._stream.time
+
+    def _interpolate(self) -> tuple[list[float], float]:
+        if self._target is None:
+            return self._start_joints, self._start_gripper
+
+        length = self._segment_end - self._segment_start
+        ratio = 1.0 if length <= 0 else (self._time - self._segment_start) / length
+        ratio = min(max(ratio, 0.0), 1.0)
+
+        joints = [
+            start + (end - start) * ratio
+            for start, end in zip(self._start_joints, self._target.joints, strict=True)
+        ]
+        gripper = (
+            self._start_gripper + (self._target.gripper - self._start_gripper) * ratio
+        )
+        return joints, gripper
+
+
+class SyncPlayer:
+    """Playback of the trajectories of several arms on a single time base.
+
+    The clock is read once per `sample`, and every trajectory is interpolated at
+    that same time, so the positions of all arms belong to one instant. Changes to
+    the speed, pausing, and seeking apply to every trajectory at once.
+
+    Args:
+        streams: Stream of the trajectory waypoints of each arm
+        positions: Joint positions and gripper position of each arm to start
+            interpolating from
+        speed: Initial playback speed, where 1.0 is real time
+        loop: Whether to restart the trajectories after they end
+        clock: Function returning the current time in seconds
+
+    """
+
+    def __init__(
+        self,
+        streams: Sequence[TrajectoryStream],
+        positions: Sequence[tuple[list[float], float]],
+        *,
+        speed: float = 1.0,
+        loop: bool = False,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the players of every arm at the start of their streams."""
+        self._clock = clock
+        self._now = clock()
+        self.players = [
+            TrajectoryPlayer(
+                stream, joints, gripper, speed=speed, loop=loop, clock=self._tick_time
+            )
+            for stream, (joints, gripper) in zip(streams, positions, strict=True)
+        ]
+        """Player of the trajectory of each arm, all driven by this clock."""
+
+    @property
+    def speed(self) -> float:
+        """Playback speed, where 1.0 is real time and 0.5 is half speed."""
+        return self.players[0].speed
+
+    @speed.setter
+    def speed(self, speed: float) -> None:
+        self._tick()
+        for player in self.players:
+            player.speed = speed
+
+    @property
+    def scale(self) -> float:
+        """Factor applied on top of the speed, such as by a `TrackingGovernor`."""
+        return self.players[0].scale
+
+    @scale.setter
+    def scale(self, scale: float) -> None:
+        self._tick()
+        for player in self.players:
+            player.scale = scale
+
+    @property
+    def paused(self) -> bool:
+        """Whether the trajectory clock is stopped."""
+        return self.players[0].paused
+
+    @property
+    def time(self) -> float:
+        """Current time in seconds relative to the start of the trajectories."""
+        self._tick()
+        return self.players[0].time
+
+    def pause(self) -> None:
+        """Stop the trajectory clock."""
+        self._tick()
+        for player in self.players:
+            player.pause()
+
+    def resume(self) -> None:
+        """Restart the trajectory clock."""
+        self._tick()
+        for player in self.players:
+            player.resume()
+
+    def seek(self, target: float) -> None:
+        """Continue playback of every trajectory from a time.
+
+        Args:
+            target: Time in seconds relative to the start of the trajectories
+
+        """
+        self._tick()
+        for player in self.players:
+            player.seek(target)
+
+    @property
+    def finished(self) -> bool:
+        """Whether the last waypoints of all trajectories have been reached."""
+        return all(player.finished for player in self.players)
+
+    def sample(self) -> list[tuple[list[float], float]]:
+        """Return the position of every arm at the current trajectory time.
+
+        Returns:
+            The joint positions and the gripper position of each arm
+
+        """
+        self._tick()
+        return [player.sample() for player in self.players]
+
+    def _tick(self) -> None:
+        self._now = self._clock()
+
+    def _tick_time(self) -> float:
+        return self._now
+
+
+class TrackingGovernor:
+    """Slows playback down while an arm lags behind its setpoints.
+
+    Each update compares the setpoint the arm is tracking with its joint feedback
+    and returns a factor for `TrajectoryPlayer.scale`. The factor is 1 while every
+    joint is within the threshold, and shrinks in proportion to the largest error
+    above it, so fast segments play as fast as the arm can follow them.
+
+    Args:
+        threshold: Largest tracking error of any joint in 0.001 degrees at which
+            playback keeps its speed
+        min_scale: Smallest factor returned, which keeps playback moving
+
+    """
+
+    def __init__(self, threshold: float, *, min_scale: float = 0.1) -> None:
+        """Initialize the governor without tracking errors."""
+        self.threshold = threshold
+        self.min_scale = min_scale
+
+        self.errors = [RunningStats() for _ in range(6)]
+        """Statistics of the signed tracking error of each joint."""
+
+    def update(self, targets: Sequence[float], joints: Sequence[float | None]) -> float:
+        """Add the tracking errors of a tick and compute the speed factor.
+
+        Args:
+            targets: Joint positions the arm is tracking
+            joints: Joint positions from the feedback of the arm, or None for
+                joints without feedback yet
+
+        Returns:
+            The factor to scale the playback speed by
+
+        """
+        worst = 0.0
+        for stats, target, joint in zip(self.errors, targets, joints, strict=True):
+            if joint is not None:
+                error = target - joint
+                stats.update(error)
+                worst = max(worst, abs(error))
+
+        if worst <= self.threshold:
+            return 1.0
+
+        return max(self.threshold / worst, self.min_scale)
+
+
+__all__ = [
+    "SyncPlayer",
+    "TrackingGovernor",
+    "TrajectoryPlayer",
+    "TrajectoryStream",
+    "Waypoint",
+    "format_waypoint",
+    "parse_waypoint",
+    "simplify_waypoints",
+]
@@ -0,0 +1,23 @@
+"""Transports for carrying CAN frames between `piper_kit.Piper` and a bus.
+
+A transport can be backed by real hardware, a virtual bus for simulation, or a
+recorded log file, and is usually created from a URI with `open_transport`.
+"""
+
+from .base import Transport
+from .python_can import PythonCanTransport
+from .queued import QueuedTransport
+from .raw import RawCanFrame, RawCanTransport, Timestamping
+from .replay import ReplayTransport
+from .uri import open_transport
+
+__all__ = [
+    "PythonCanTransport",
+    "QueuedTransport",
+    "RawCanFrame",
+    "RawCanTransport",
+    "ReplayTransport",
+    "Timestamping",
+    "Transport",
+    "open_transport",
+]
@@ -0,0 +1,50 @@
+"""Base class for transports that carry CAN frames to and from the PiPER arm."""
+
+from abc import ABC, abstractmethod
+
+from piper_kit.messages import Frame, TransmitMessage
+
+
+class Transport(ABC):
+    """Interface for sending and receiving CAN frames.
+
+    A transport decouples `piper_kit.Piper` from the source of its frames, so the
+    same control code can run against hardware, a simulation, or recorded data.
+    """
+
+    @abstractmethod
+    def send(self, msg: TransmitMessage) -> None:
+        """Send a message to the bus.
+
+        Args:
+            msg: Message to send
+
+        """
+
+    @abstractmethod
+    def recv(self, timeout: float | None = None) -> Frame | None:
+        """Receive a single frame from the bus.
+
+        Args:
+            timeout: Maximum time in seconds to wait, or None to wait forever
+
+        Returns:
+            The received frame, or None if the timeout expired
+
+        """
+
+    @abstractmethod
+    def fileno(self) -> int:
+        """Return a file descriptor that becomes readable when frames arrive.
+
+        Returns:
+            The file descriptor, or -1 if the transport does not have one
+
+        """
+
+    @abstractmethod
+    def close(self) -> None:
+        """Close the transport and release its resources."""
+
+
+__all__ = ["Transport"]
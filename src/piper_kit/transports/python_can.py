@@ -0,0 +1,61 @@
+"""Transport that sends and receives frames through a python-can bus."""
+
+import can
+
+from piper_kit.messages import TransmitMessage
+
+from .base import Transport
+
+
+class PythonCanTransport(Transport):
+    """Transport backed by a python-can bus.
+
+    Args:
+        interface: python-can interface name (e.g., 'socketcan' or 'virtual')
+        channel: Channel of the interface (e.g., 'can0')
+
+    """
+
+    def __init__(self, interface: str, channel: str) -> None:
+        """Open the python-can bus."""
+        self.bus = can.Bus(channel=channel, interface=interface)
+
+    def send(self, msg: TransmitMessage) -> None:
+        """Send a message to the bus.
+
+        Args:
+            msg: Message to send
+
+        """
+        self.bus.send(msg)
+
+    def recv(self, timeout: float | None = None) -> can.Message | None:
+        """Receive a single frame from the bus.
+
+        Args:
+            timeout: Maximum time in seconds to wait, or None to wait forever
+
+        Returns:
+            The received frame, or None if the timeout expired
+
+        """
+        return self.bus.recv(timeout)
+
+    def fileno(self) -> int:
+        """Return the file descriptor of the bus.
+
+        Returns:
+            The file descriptor, or -1 if the bus interface does not provide one
+
+        """
+        try:
+            return self.bus.fileno()
+        except NotImplementedError:
+            return -1
+
+    def close(self) -> None:
+        """Shut down the python-can bus."""
+        self.bus.shutdown()
+
+
+__all__ = ["PythonCanTransport"]
@@ -0,0 +1,260 @@
+"""Transport that sends frames from a prioritized, rate-limited queue."""
+
+import errno
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Mapping
+from typing import Literal
+
+import can
+
+from piper_kit.messages import (
+    EnableJointMessage,
+    EndPoseControlRyMessage,
+    EndPoseControlXyMessage,
+    EndPoseControlZpMessage,
+    Frame,
+    GripperControlMessage,
+    JointControl12Message,
+    JointControl34Message,
+    JointControl56Message,
+    TransmitMessage,
+)
+from piper_kit.metrics import MetricsHook
+
+from .base import Transport
+
+Priority = Literal["safety", "config", "setpoint"]
+
+PRIORITIES: dict[int, Priority] = {
+    EnableJointMessage.ID: "safety",
+    EndPoseControlXyMessage.ID: "setpoint",
+    EndPoseControlZpMessage.ID: "setpoint",
+    EndPoseControlRyMessage.ID: "setpoint",
+    JointControl12Message.ID: "setpoint",
+    JointControl34Message.ID: "setpoint",
+    JointControl56Message.ID: "setpoint",
+    GripperControlMessage.ID: "setpoint",
+}
+"""Priorities of the transmit messages, where any other message is a config one."""
+
+# Bounds in seconds of the delay before retrying a send that found the transmit
+# buffer of the interface full, which doubles on every consecutive failure.
+_MIN_BACKOFF = 0.0005
+_MAX_BACKOFF = 0.02
+
+# Maximum time in seconds that closing waits for the queued frames to be sent.
+_CLOSE_TIMEOUT = 1.0
+
+
+def _is_buffer_full(error: Exception) -> bool:
+    if isinstance(error, OSError):
+        return error.errno == errno.ENOBUFS
+    return isinstance(error, can.CanError) and error.error_code == errno.ENOBUFS
+
+
+class QueuedTransport(Transport):
+    """Transport that sends frames to another transport from a background thread.
+
+    Sending only queues a frame, so it never blocks on a full transmit buffer. The
+    queued frames are sent in order of priority: safety frames, such as enabling
+    and disabling joints, first, then config frames, then setpoints. A setpoint
+    replaces any setpoint with the same arbitration ID that is still queued, since
+    only the latest one matters, so a backlog of stale setpoints never builds up.
+
+    Frames other than safety ones are limited to a rate per second, with bursts of
+    up to a number of frames, so they cannot flood the bus. When the interface
+    reports that its transmit buffer is full, sending is retried with an
+    exponential backoff, picking the frame with the highest priority again on
+    every attempt. Any other error when sending drops the frame, and is raised by
+    the next call to `send`.
+
+    Args:
+        transport: Transport to send the frames to and receive frames from
+        rate: Maximum number of frames other than safety ones sent per second, or
+            None to not limit the rate
+        burst: Maximum number of frames other than safety ones sent at once
+        priorities: Priorities of the transmit messages by arbitration ID, where
+            any other message is a config one
+        clock: Function that returns the monotonic time in seconds
+        metrics: Hook that the depth of the queue, as 'transmit', and frames that
+            failed to be sent are reported to, or None to not instrument them
+
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        transport: Transport,
+        *,
+        rate: float | None = None,
+        burst: int = 1,
+        priorities: Mapping[int, Priority] = PRIORITIES,
+        clock: Callable[[], float] = time.monotonic,
+        metrics: MetricsHook | None = None,
+    ) -> None:
+        """Start the thread that sends the queued frames."""
+        self.transport = transport
+        self.rate = rate
+        self.burst = burst
+        self.priorities = priorities
+        self.clock = clock
+        self.metrics = metrics
+
+        self._safety: deque[TransmitMessage] = deque()
+        self._config: deque[TransmitMessage] = deque()
+        self._setpoints: dict[int, TransmitMessage] = {}
+        self._condition = threading.Condition()
+        self._error: Exception | None = None
+        self._closing = False
+
+        self._tokens = float(burst)
+        self._refilled = clock()
+
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def send(self, msg: TransmitMessage) -> None:
+        """Queue a message to be sent.
+
+        Args:
+            msg: Message to send
+
+        Raises:
+            Exception: The error raised by the transport when it failed to send a
+                previous message
+
+        """
+        with self._condition:
+            if self._error is not None:
+                error, self._error = self._error, None
+                raise error
+
+            priority = self.priorities.get(msg.arbitration_id, "config")
+            if priority == "setpoint":
+                self._setpoints[msg.arbitration_id] = msg
+            elif priority == "safety":
+                self._safety.append(msg)
+            else:
+                self._config.append(msg)
+            self._condition.notify_all()
+
+            if self.metrics is not None:
+                self._report_depth()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until every queued frame is sent.
+
+        Args:
+            timeout: Maximum time in seconds to wait, or None to wait forever
+
+        Returns:
+            True if every queued frame was sent, or False if the timeout expired
+
+        """
+        with self._condition:
+            return self._condition.wait_for(self._is_empty, timeout)
+
+    def recv(self, timeout: float | None = None) -> Frame | None:
+        """Receive a single frame from the transport.
+
+        Args:
+            timeout: Maximum time in seconds to wait, or None to wait forever
+
+        Returns:
+            The received frame, or None if the timeout expired
+
+        """
+        return self.transport.recv(timeout)
+
+    def fileno(self) -> int:
+        """Return the file descriptor of the transport."""
+        return self.transport.fileno()
+
+    def close(self) -> None:
+        """Send the queued frames, waiting a bounded time, and close the transport."""
+        self.flush(_CLOSE_TIMEOUT)
+        with self._condition:
+            self._closing = True
+            self._condition.notify_all()
+        self._thread.join()
+        self.transport.close()
+
+    def _report_depth(self) -> None:
+        depth = len(self._safety) + len(self._config) + len(self._setpoints)
+        self.metrics.queue_depth_changed("transmit", depth)
+
+    def _is_empty(self) -> bool:
+        return not (self._safety or self._config or self._setpoints)
+
+    def _next(self) -> tuple[TransmitMessage | None, float | None]:
+        # Returns the frame to send next, or the time to wait before one may be
+        # sent, which is None to wait for more frames.
+        if self._safety:
+            return self._safety[0], None
+
+        if not (self._config or self._setpoints):
+            return None, None
+
+        if self.rate is not None:
+            now = self.clock()
+            elapsed = now - self._refilled
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+            self._refilled = now
+            if self._tokens < 1:
+                return None, (1 - self._tokens) / self.rate
+
+        if self._config:
+            return self._config[0], None
+
+        return next(iter(self._setpoints.values())), None
+
+    def _remove(self, msg: TransmitMessage) -> None:
+        if self._safety and self._safety[0] is msg:
+            self._safety.popleft()
+        else:
+            self._tokens -= 1
+            if self._config and self._config[0] is msg:
+                self._config.popleft()
+            elif self._setpoints.get(msg.arbitration_id) is msg:
+                # Otherwise the setpoint was replaced while it was being sent.
+                del self._setpoints[msg.arbitration_id]
+
+        if self.metrics is not None:
+            self._report_depth()
+
+    def _run(self) -> None:
+        backoff = 0.0
+        while True:
+            with self._condition:
+                while True:
+                    if self._closing:
+                        return
+                    msg, wait = self._next()
+                    if msg is not None:
+                        break
+                    self._condition.wait(wait)
+
+            try:
+                self.transport.send(msg)
+            except Exception as error:  # noqa: BLE001
+                with self._condition:
+                    if _is_buffer_full(error):
+                        backoff = min(max(2 * backoff, _MIN_BACKOFF), _MAX_BACKOFF)
+                        self._condition.wait(backoff)
+                        continue
+
+                    self._error = error
+                    if self.metrics is not None:
+                        self.metrics.send_failed(msg.arbitration_id, error)
+                    self._remove(msg)
+                    self._condition.notify_all()
+                    continue
+
+            backoff = 0.0
+            with self._condition:
+                self._remove(msg)
+                self._condition.notify_all()
+
+
+__all__ = ["PRIORITIES", "Priority", "QueuedTransport"]
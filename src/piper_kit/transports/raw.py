@@ -0,0 +1,191 @@
+"""Native SocketCAN transport that bypasses python-can message objects.
+
+This module talks to the kernel through Python's built-in ``socket.AF_CAN`` support.
+Frames are received into a preallocated buffer and exposed as memory views, and
+transmit messages are encoded into another preallocated buffer before sending.
+"""
+
+import socket
+import struct
+import sys
+import threading
+import time
+from typing import Literal
+
+from piper_kit.errors import InvalidTimestampingError
+from piper_kit.messages import TransmitMessage
+
+from .base import Transport
+
+Timestamping = Literal["user", "kernel", "hardware"]
+
+# Socket options and flags from <linux/net_tstamp.h>, which the socket module does
+# not define. The control messages use the same values as the options.
+_SO_TIMESTAMPNS = 35
+_SO_TIMESTAMPING = 37
+_SOF_TIMESTAMPING_RX_HARDWARE = 1 << 2
+_SOF_TIMESTAMPING_RX_SOFTWARE = 1 << 3
+_SOF_TIMESTAMPING_SOFTWARE = 1 << 4
+_SOF_TIMESTAMPING_RAW_HARDWARE = 1 << 6
+
+# A struct timespec, and the offset of the raw hardware timestamp among the three
+# timespecs of a SO_TIMESTAMPING control message.
+_TIMESPEC = struct.Struct("@ll")
+_RAW_HARDWARE_OFFSET = 2 * _TIMESPEC.size
+
+
+class RawCanFrame:
+    """A CAN frame received from a raw SocketCAN socket.
+
+    The frame is reused by the transport that produced it, and its data is a view
+    into the transport receive buffer. Both are only valid until the next call to
+    `RawCanTransport.recv`, so copy the data if it must outlive that call.
+    """
+
+    __slots__ = ("arbitration_id", "data", "timestamp")
+
+    def __init__(self) -> None:
+        """Initialize an empty frame."""
+        self.arbitration_id = 0
+        self.data = memoryview(b"")
+        self.timestamp = 0.0
+
+
+class RawCanTransport(Transport):
+    """Transport backed by a native ``AF_CAN`` raw socket.
+
+    Unlike `piper_kit.transports.PythonCanTransport`, it does not allocate a
+    ``can.Message`` for every received frame.
+
+    Receive timestamps are read from the host clock after each frame is received
+    by default. With kernel timestamping, the kernel stamps each frame when the
+    driver receives it, in the same clock as ``time.time``. With hardware
+    timestamping, the frames are stamped by the clock of the CAN controller, or by
+    the kernel for controllers without one. Hardware timestamps are only produced
+    once they are enabled on the interface, and are not in the clock of the host,
+    so map them with `piper_kit.clock.ClockAligner`.
+
+    Args:
+        channel: CAN interface name (e.g., 'can0')
+        timestamping: Source of receive timestamps, either 'user', 'kernel', or
+            'hardware'
+
+    Raises:
+        InvalidTimestampingError: If the timestamping mode is not supported
+
+    """
+
+    FRAME_SIZE = 16
+    """Size in bytes of a classic SocketCAN ``struct can_frame``."""
+
+    def __init__(self, channel: str, *, timestamping: Timestamping = "user") -> None:
+        """Open and bind a raw CAN socket to the given interface."""
+        if timestamping not in ("user", "kernel", "hardware"):
+            raise InvalidTimestampingError(timestamping)
+
+        self._sock = socket.socket(socket.AF_CAN, socket.SOCK_RAW, socket.CAN_RAW)
+        self._sock.bind((channel,))
+        self._timeout = None
+
+        self.timestamping = timestamping
+        if timestamping == "kernel":
+            self._sock.setsockopt(socket.SOL_SOCKET, _SO_TIMESTAMPNS, 1)
+            self._ancillary_size = socket.CMSG_SPACE(_TIMESPEC.size)
+        elif timestamping == "hardware":
+            self._sock.setsockopt(
+                socket.SOL_SOCKET,
+                _SO_TIMESTAMPING,
+                _SOF_TIMESTAMPING_RX_HARDWARE
+                | _SOF_TIMESTAMPING_RX_SOFTWARE
+                | _SOF_TIMESTAMPING_SOFTWARE
+                | _SOF_TIMESTAMPING_RAW_HARDWARE,
+            )
+            self._ancillary_size = socket.CMSG_SPACE(3 * _TIMESPEC.size)
+
+        self._buffer = bytearray(self.FRAME_SIZE)
+        self._view = memoryview(self._buffer)
+        self._send_buffer = bytearray(self.FRAME_SIZE)
+        self._send_lock = threading.Lock()
+        self._frame = RawCanFrame()
+
+    def fileno(self) -> int:
+        """Return the file descriptor of the underlying socket."""
+        return self._sock.fileno()
+
+    def send(self, msg: TransmitMessage) -> None:
+        """Send a transmit message by encoding it into the send buffer.
+
+        Messages may be sent from several threads, such as those of a watchdog
+        and a player, so the send buffer is only used by one of them at a time.
+
+        Args:
+            msg: Message to send
+
+        """
+        with self._send_lock:
+            msg.pack_frame_into(self._send_buffer)
+            self._sock.send(self._send_buffer)
+
+    def recv(self, timeout: float | None = None) -> RawCanFrame | None:
+        """Receive a single frame from the bus.
+
+        Args:
+            timeout: Maximum time in seconds to wait, or None to wait forever
+
+        Returns:
+            The received frame, or None if the timeout expired
+
+        """
+        if timeout != self._timeout:
+            self._sock.settimeout(timeout)
+            self._timeout = timeout
+
+        try:
+            if self.timestamping == "user":
+                self._sock.recv_into(self._buffer, self.FRAME_SIZE)
+                timestamp = time.time()
+            else:
+                _, ancillary, _, _ = self._sock.recvmsg_into(
+                    [self._buffer], self._ancillary_size
+                )
+                timestamp = _ancillary_timestamp(ancillary)
+        except (BlockingIOError, TimeoutError):
+            # A timeout of zero makes the socket non-blocking, which raises the
+            # former instead of the latter when no frame is waiting.
+            return None
+
+        frame = self._frame
+        frame.arbitration_id = (
+            int.from_bytes(self._view[0:4], sys.byteorder) & socket.CAN_EFF_MASK
+        )
+        frame.data = self._view[8 : 8 + self._buffer[4]]
+        frame.timestamp = timestamp
+        return frame
+
+    def close(self) -> None:
+        """Close the underlying socket."""
+        self._sock.close()
+
+
+def _ancillary_timestamp(ancillary: list[tuple[int, int, bytes]]) -> float:
+    for level, kind, data in ancillary:
+        if level != socket.SOL_SOCKET:
+            continue
+
+        if kind == _SO_TIMESTAMPNS:
+            seconds, nanoseconds = _TIMESPEC.unpack_from(data)
+            return seconds + nanoseconds * 1e-9
+
+        if kind == _SO_TIMESTAMPING:
+            # Prefer the raw hardware timestamp, which is zero when the controller
+            # did not stamp the frame, over the software timestamp.
+            seconds, nanoseconds = _TIMESPEC.unpack_from(data, _RAW_HARDWARE_OFFSET)
+            if seconds == 0 and nanoseconds == 0:
+                seconds, nanoseconds = _TIMESPEC.unpack_from(data)
+            return seconds + nanoseconds * 1e-9
+
+    # The kernel omits the timestamp when it could not stamp the frame.
+    return time.time()
+
+
+__all__ = ["RawCanFrame", "RawCanTransport", "Timestamping"]
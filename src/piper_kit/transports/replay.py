@@ -0,0 +1,88 @@
+"""Transport that replays frames recorded in a python-can log file."""
+
+import time
+from pathlib import Path
+
+import can
+
+from piper_kit.errors import EndOfReplayError
+from piper_kit.messages import TransmitMessage
+
+from .base import Transport
+
+
+class ReplayTransport(Transport):
+    """Transport that receives frames from a recorded log file.
+
+    Any log format supported by ``can.LogReader`` can be replayed, such as candump
+    ``.log``, ``.asc``, ``.blf``, or ``.csv`` files. Sent messages are discarded.
+
+    Args:
+        path: Path to the log file
+        realtime: Whether to pace frames by their recorded timestamps instead of
+            replaying them as fast as possible
+
+    """
+
+    def __init__(self, path: str | Path, *, realtime: bool = False) -> None:
+        """Open the log file for replaying."""
+        self._reader = can.LogReader(path)
+        self._messages = iter(self._reader)
+        self._realtime = realtime
+
+        self._pending = None
+        self._offset = None
+
+    def send(self, msg: TransmitMessage) -> None:
+        """Discard a message, since recorded data cannot be commanded.
+
+        Args:
+            msg: Message to discard
+
+        """
+
+    def recv(self, timeout: float | None = None) -> can.Message | None:
+        """Receive the next frame from the log file.
+
+        Args:
+            timeout: Maximum time in seconds to wait, or None to wait forever
+
+        Returns:
+            The next frame, or None if the timeout expired before it was due
+
+        Raises:
+            EndOfReplayError: If all frames in the log file have been replayed
+
+        """
+        msg = self._pending
+        if msg is None:
+            msg = next(self._messages, None)
+            if msg is None:
+                raise EndOfReplayError
+
+        if self._realtime:
+            if self._offset is None:
+                self._offset = time.monotonic() - msg.timestamp
+
+            delay = msg.timestamp + self._offset - time.monotonic()
+            if timeout is not None and delay > timeout:
+                time.sleep(timeout)
+                self._pending = msg
+                return None
+
+            if delay > 0:
+                time.sleep(delay)
+
+        self._pending = None
+        return msg
+
+    def fileno(self) -> int:
+        """Return -1, since a replayed log does not have a file descriptor."""
+        return -1
+
+    def close(self) -> None:
+        """Close the log file."""
+        self._reader.stop()
+
+
+__all__ = ["ReplayTransport"]
@@ -0,0 +1,56 @@
+"""Creation of transports from URI strings."""
+
+from urllib.parse import parse_qs, urlsplit
+
+from piper_kit.errors import InvalidTransportUriError
+
+from .base import Transport
+from .python_can import PythonCanTransport
+from .raw import RawCanTransport
+from .replay import ReplayTransport
+
+
+def open_transport(uri: str) -> Transport:
+    """Open a transport described by a URI.
+
+    The following URIs are supported:
+
+    - ``can0`` or ``socketcan://can0``: python-can socketcan bus on ``can0``.
+    - ``raw://can0``: native ``AF_CAN`` socket on ``can0``. Append
+      ``?timestamping=kernel`` or ``?timestamping=hardware`` to stamp received
+      frames in the kernel or the CAN controller.
+    - ``virtual://arm``: python-can virtual bus on the ``arm`` channel.
+    - ``replay://path/to/log.asc``: frames replayed from a python-can log file.
+      Append ``?realtime=1`` to pace frames by their recorded timestamps.
+
+    Args:
+        uri: Transport URI, or a plain CAN interface name
+
+    Returns:
+        The opened transport
+
+    Raises:
+        InvalidTransportUriError: If the URI scheme is not supported
+
+    """
+    if "://" not in uri:
+        return PythonCanTransport("socketcan", uri)
+
+    parts = urlsplit(uri)
+    target = parts.netloc + parts.path
+    match parts.scheme:
+        case "socketcan" | "virtual" as interface:
+            return PythonCanTransport(interface, target)
+        case "raw":
+            options = parse_qs(parts.query)
+            timestamping = options.get("timestamping", ["user"])[-1]
+            return RawCanTransport(target, timestamping=timestamping)
+        case "replay":
+            options = parse_qs(parts.query)
+            realtime = options.get("realtime", ["0"])[-1] not in ("0", "false")
+            return ReplayTransport(target, realtime=realtime)
+        case _:
+            raise InvalidTransportUriError(uri)
+
+
+__all__ = ["open_transport"]
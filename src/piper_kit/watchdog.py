@@ -0,0 +1,129 @@
+"""Detection of feedback that stopped arriving from the PiPER arm."""
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from typing import Literal
+
+from .messages import (
+    JointFeedback12Message,
+    JointFeedback34Message,
+    JointFeedback56Message,
+)
+
+WatchdogAction = Literal["raise", "disable"] | Callable[[int], None]
+
+JOINT_FEEDBACK_IDS = (
+    JointFeedback12Message.ID,
+    JointFeedback34Message.ID,
+    JointFeedback56Message.ID,
+)
+"""Arbitration IDs of the joint feedback messages, watched by default."""
+
+
+class FeedbackWatchdog:
+    """Tracks the last arrival of each watched feedback ID against a deadline.
+
+    The watched IDs are kept in the order they last arrived, so recording an
+    arrival moves one ID to the end and checking the deadline only looks at the
+    first ID, both in constant time however many IDs are watched. Once an ID is
+    reported as stale its deadline is rearmed, so it is reported again after
+    every further timeout until it arrives.
+
+    When passed to `piper_kit.Piper`, the watchdog is fed by every message read
+    and checked while reading and before every setpoint is sent. A missed
+    deadline then runs the action, which is one of:
+
+    - ``"raise"``: Raise `piper_kit.errors.FeedbackTimeoutError`.
+    - ``"disable"``: Disable all joints, then raise the error.
+    - A callback, called with the arbitration ID of the stale feedback.
+
+    Args:
+        timeout: Seconds after the last arrival of an ID at which it is stale
+        ids: Arbitration IDs of the feedback to watch
+        action: Action to run when feedback is stale
+        clock: Function that returns the monotonic time in seconds
+
+    """
+
+    def __init__(
+        self,
+        timeout: float,
+        ids: Iterable[int] = JOINT_FEEDBACK_IDS,
+        *,
+        action: WatchdogAction = "raise",
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the watchdog, counting every deadline from now."""
+        self.timeout = timeout
+        self.action = action
+        self.clock = clock
+
+        now = clock()
+        self._arrivals = OrderedDict.fromkeys(ids, now)
+
+    def reset(self) -> None:
+        """Count every deadline from now, such as after reconnecting."""
+        now = self.clock()
+        for arbitration_id in self._arrivals:
+            self._arrivals[arbitration_id] = now
+
+    def feed(self, arbitration_id: int, now: float | None = None) -> None:
+        """Record the arrival of a frame, ignoring IDs that are not watched.
+
+        Args:
+            arbitration_id: Arbitration ID of the frame
+            now: Monotonic time of the arrival in seconds, or None to read the clock
+
+        """
+        arrivals = self._arrivals
+        if arbitration_id in arrivals:
+            arrivals[arbitration_id] = self.clock() if now is None else now
+            arrivals.move_to_end(arbitration_id)
+
+    def remaining(self, now: float | None = None) -> float | None:
+        """Return the time until the earliest deadline.
+
+        Args:
+            now: Monotonic time in seconds, or None to read the clock
+
+        Returns:
+            The seconds until the earliest deadline, which is zero once it passed,
+            or None if no IDs are watched
+
+        """
+        if not self._arrivals:
+            return None
+
+        if now is None:
+            now = self.clock()
+
+        oldest = next(iter(self._arrivals.values()))
+        return max(oldest + self.timeout - now, 0.0)
+
+    def check(self, now: float | None = None) -> int | None:
+        """Return the ID whose deadline passed the longest ago, if any.
+
+        Args:
+            now: Monotonic time in seconds, or None to read the clock
+
+        Returns:
+            The arbitration ID of stale feedback, whose deadline is then rearmed,
+            or None if all watched feedback arrived in time
+
+        """
+        if not self._arrivals:
+            return None
+
+        if now is None:
+            now = self.clock()
+
+        arbitration_id, oldest = next(iter(self._arrivals.items()))
+        if now - oldest < self.timeout:
+            return None
+
+        self.feed(arbitration_id, now)
+        return arbitration_id
+
+
+__all__ = ["JOINT_FEEDBACK_IDS", "FeedbackWatchdog", "WatchdogAction"]
@@ -1,6 +1,10 @@
 import can
 
 from piper_kit.messages.receive import (
+    RECEIVE_MESSAGE_TYPES,
+    EndPoseFeedbackRyMessage,
+    EndPoseFeedbackXyMessage,
+    EndPoseFeedbackZpMessage,
     GripperFeedbackMessage,
     JointFeedback12Message,
     JointFeedback34Message,
@@ -15,6 +19,14 @@ def test_unknown_message() -> None:
     unknown = UnknownMessage(msg)
     assert unknown.arbitration_id == 0x123
     assert unknown.data == bytearray([0x01, 0x02, 0x03, 0x04])
+    assert unknown.data is not msg.data
+
+
+def test_receive_timestamp() -> None:
+    msg = can.Message(arbitration_id=0x123, data=bytes(8), timestamp=12.5)
+    assert UnknownMessage(msg).timestamp == 12.5
+    for message_type in RECEIVE_MESSAGE_TYPES.values():
+        assert message_type(msg).timestamp == 12.5
 
 
 class TestMotorInfoBMessage:
@@ -44,6 +56,35 @@ class TestMotorInfoBMessage:
         assert status.stalling_triggered is False
 
 
+class TestEndPoseFeedbackMessages:
+    def test_end_pose_feedback_xy_message(self) -> None:
+        msg = can.Message(
+            arbitration_id=EndPoseFeedbackXyMessage.ID,
+            data=[0x12, 0x34, 0x56, 0x78, 0x9A, 0xBC, 0xDE, 0xF0],
+        )
+        end_pose_feedback = EndPoseFeedbackXyMessage(msg)
+        assert end_pose_feedback.x == 305419896
+        assert end_pose_feedback.y == -1698898192
+
+    def test_end_pose_feedback_zp_message(self) -> None:
+        msg = can.Message(
+            arbitration_id=EndPoseFeedbackZpMessage.ID,
+            data=[0x12, 0x34, 0x56, 0x78, 0x9A, 0xBC, 0xDE, 0xF0],
+        )
+        end_pose_feedback = EndPoseFeedbackZpMessage(msg)
+        assert end_pose_feedback.z == 305419896
+        assert end_pose_feedback.pitch == -1698898192
+
+    def test_end_pose_feedback_ry_message(self) -> None:
+        msg = can.Message(
+            arbitration_id=EndPoseFeedbackRyMessage.ID,
+            data=[0x12, 0x34, 0x56, 0x78, 0x9A, 0xBC, 0xDE, 0xF0],
+        )
+        end_pose_feedback = EndPoseFeedbackRyMessage(msg)
+        assert end_pose_feedback.roll == 305419896
+        assert end_pose_feedback.yaw == -1698898192
+
+
 class TestJointFeedbackMessages:
     def test_joint_feedback_12_message(self) -> None:
         msg = can.Message(
@@ -95,3 +136,11 @@ class TestGripperFeedbackMessage:
         assert status.driver_error is False
         assert status.driver_enabled is True
         assert status.is_zeroed is False
+
+
+def test_receive_message_types() -> None:
+    assert RECEIVE_MESSAGE_TYPES[0x261] is MotorInfoBMessage
+    assert RECEIVE_MESSAGE_TYPES[0x266] is MotorInfoBMessage
+    assert RECEIVE_MESSAGE_TYPES[JointFeedback12Message.ID] is JointFeedback12Message
+    assert RECEIVE_MESSAGE_TYPES[GripperFeedbackMessage.ID] is GripperFeedbackMessage
+    assert 0x260 not in RECEIVE_MESSAGE_TYPES
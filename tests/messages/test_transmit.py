@@ -1,3 +1,6 @@
+import socket
+import sys
+
 import pytest
 
 from piper_kit.errors import (
@@ -29,6 +32,24 @@ def test_transmit_message() -> None:
     assert msg.is_extended_id is False
 
 
+def test_transmit_message_frame() -> None:
+    msg = TransmitMessage(0x123, 0x01, 0x02, 0x03, 0x04, 0x05, 0x06, 0x07, 0x08)
+    assert msg.frame == bytes(
+        [*(0x123).to_bytes(4, sys.byteorder), 8, 0, 0, 0, 1, 2, 3, 4, 5, 6, 7, 8]
+    )
+
+    msg.is_extended_id = True
+    can_id = 0x123 | socket.CAN_EFF_FLAG
+    assert msg.frame[0:4] == can_id.to_bytes(4, sys.byteorder)
+
+
+def test_transmit_message_pack_frame_into() -> None:
+    msg = TransmitMessage(0x123, 0x01, 0x02)
+    buffer = bytearray(b"\xff" * 16)
+    msg.pack_frame_into(buffer)
+    assert buffer == msg.frame
+
+
 class TestMotionControlBMessage:
     def test_motion_control_b_message(self) -> None:
         msg = MotionControlBMessage("can", "joint", 50)
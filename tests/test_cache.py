@@ -0,0 +1,185 @@
+import os
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from piper_kit import cache
+from piper_kit.cache import ArrayTrajectoryStream, TrajectoryCache, parse_trajectory
+from piper_kit.errors import InvalidTrajectoryRowError
+from piper_kit.trajectory import TrajectoryStream
+
+
+def write_trajectory(path: Path, rows: int, duration: float = 1.0) -> Path:
+    path.write_text(
+        "".join(f"{duration},{i},{i},{i},{i},{i},{i},{i * 10}\n" for i in range(rows))
+    )
+    return path
+
+
+def test_parse_trajectory(tmp_path: Path) -> None:
+    path = write_trajectory(tmp_path / "trajectory.csv", 3, duration=0.5)
+    np.testing.assert_array_equal(
+        parse_trajectory(path),
+        [[0.5, i, i, i, i, i, i, i * 10] for i in range(3)],
+    )
+
+    path.write_text("1,0,0,0,0,0,0,1,0,0,0,0,0,0,2\n")
+    np.testing.assert_array_equal(parse_trajectory(path, arm=1)[:, 7], [2])
+
+    path.write_text("")
+    assert parse_trajectory(path).shape == (0, 8)
+
+
+def test_parse_trajectory_chunks(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(cache, "_CHUNK_SIZE", 4)
+    path = write_trajectory(tmp_path / "trajectory.csv", 10)
+    path.write_text(path.read_text().replace("\n", "\n\n", 3))
+    np.testing.assert_array_equal(parse_trajectory(path)[:, 7], np.arange(10) * 10)
+
+
+class TestArrayTrajectoryStream:
+    def test_iterate(self, tmp_path: Path) -> None:
+        path = write_trajectory(tmp_path / "trajectory.csv", 100)
+        with ArrayTrajectoryStream(parse_trajectory(path)) as stream:
+            waypoints = list(stream)
+            assert stream.time == 100.0
+
+        assert [w.gripper for w in waypoints] == [i * 10 for i in range(100)]
+        assert waypoints[1].joints == (1, 1, 1, 1, 1, 1)
+
+    def test_seek(self, tmp_path: Path) -> None:
+        path = write_trajectory(tmp_path / "trajectory.csv", 100)
+        stream = ArrayTrajectoryStream(parse_trajectory(path))
+        stream.seek(42.5)
+        assert stream.time == 42.0
+        assert next(stream).gripper == 420
+
+        stream.seek(3.0)
+        assert next(stream).gripper == 20
+        assert stream.time == 3.0
+
+        stream.seek(0.0)
+        assert stream.time == 0.0
+        assert next(stream).gripper == 0
+
+    def test_seek_past_end(self, tmp_path: Path) -> None:
+        path = write_trajectory(tmp_path / "trajectory.csv", 10)
+        stream = ArrayTrajectoryStream(parse_trajectory(path))
+        stream.seek(20.0)
+        assert stream.time == 10.0
+        assert next(stream, None) is None
+
+
+class TestTrajectoryCache:
+    def test_hit(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        path = write_trajectory(tmp_path / "trajectory.csv", 10)
+        trajectories = TrajectoryCache(tmp_path / "cache")
+        assert trajectories.size == 0
+
+        [parsed] = trajectories.load(path)
+        assert isinstance(parsed, np.memmap)
+        assert trajectories.size > 0
+
+        # Hits are memory-mapped instead of parsed again.
+        def fail(*_: object) -> None:
+            pytest.fail("trajectory parsed on a cache hit")
+
+        monkeypatch.setattr(cache, "_parse_rows", fail)
+        [loaded] = trajectories.load(path)
+        assert isinstance(loaded, np.memmap)
+        np.testing.assert_array_equal(loaded, parsed)
+
+        [stream] = trajectories.open(path)
+        with stream:
+            assert [w.gripper for w in stream] == [i * 10 for i in range(10)]
+
+    def test_arms(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        path = tmp_path / "trajectory.csv"
+        path.write_text("1,0,0,0,0,0,0,1,0,0,0,0,0,0,2\n" * 3)
+        trajectories = TrajectoryCache(tmp_path / "cache")
+
+        # Every arm is parsed in a single pass over the file.
+        passes = []
+        parse_rows = cache._parse_rows  # noqa: SLF001
+
+        def count_passes(*args: object) -> None:
+            passes.append(args)
+            parse_rows(*args)
+
+        monkeypatch.setattr(cache, "_parse_rows", count_passes)
+        first, second = trajectories.load(path, [0, 1])
+        assert len(passes) == 1
+        np.testing.assert_array_equal(first[:, 7], [1, 1, 1])
+        np.testing.assert_array_equal(second[:, 7], [2, 2, 2])
+        assert len(list(trajectories.directory.glob("*.npy"))) == 2
+
+        [second] = trajectories.load(path, [1])
+        np.testing.assert_array_equal(second[:, 7], [2, 2, 2])
+        assert len(passes) == 1
+
+    def test_invalidate(self, tmp_path: Path) -> None:
+        path = write_trajectory(tmp_path / "trajectory.csv", 10)
+        trajectories = TrajectoryCache(tmp_path / "cache")
+        trajectories.load(path)
+
+        write_trajectory(path, 20)
+        [waypoints] = trajectories.load(path)
+        assert len(waypoints) == 20
+
+    def test_invalid_row(self, tmp_path: Path) -> None:
+        path = tmp_path / "trajectory.csv"
+        path.write_text("1,0,0,0,0,0,0,0\n1,invalid\n")
+        trajectories = TrajectoryCache(tmp_path / "cache")
+        with pytest.raises(InvalidTrajectoryRowError):
+            trajectories.load(path)
+        assert list(trajectories.directory.iterdir()) == []
+
+    def test_too_large(self, tmp_path: Path) -> None:
+        path = write_trajectory(tmp_path / "trajectory.csv", 10)
+        trajectories = TrajectoryCache(tmp_path / "cache", max_size=128 + 10 * 64)
+        assert trajectories.load(path, [None, None]) is None
+
+        # Files that do not fit are streamed from the file instead.
+        streams = trajectories.open(path, [None, None])
+        assert all(isinstance(stream, TrajectoryStream) for stream in streams)
+        for stream in streams:
+            with stream:
+                assert [w.gripper for w in stream] == [i * 10 for i in range(10)]
+        assert trajectories.size == 0
+
+        # A file that just fits is cached.
+        [waypoints] = trajectories.load(path)
+        assert isinstance(waypoints, np.memmap)
+        assert trajectories.size == trajectories.max_size
+
+    def test_evict(self, tmp_path: Path) -> None:
+        paths = [
+            write_trajectory(tmp_path / f"trajectory-{i}.csv", 100) for i in range(3)
+        ]
+        trajectories = TrajectoryCache(tmp_path / "cache")
+        for i, path in enumerate(paths[:2]):
+            trajectories.load(path)
+            entry = trajectories._entry(path, None)  # noqa: SLF001
+            os.utime(entry, ns=(i * 10**9, i * 10**9))
+        entry_size = trajectories.size // 2
+
+        # Loading the first trajectory makes the second the least recently used.
+        trajectories.load(paths[0])
+        trajectories.max_size = 2 * entry_size
+        trajectories.load(paths[2])
+
+        entries = set(trajectories.directory.glob("*.npy"))
+        assert entries == {
+            trajectories._entry(paths[0], None),  # noqa: SLF001
+            trajectories._entry(paths[2], None),  # noqa: SLF001
+        }
+
+        # Every other entry is evicted to make room for a new one.
+        trajectories.max_size = entry_size
+        trajectories.load(paths[1])
+        assert set(trajectories.directory.glob("*.npy")) == {
+            trajectories._entry(paths[1], None)  # noqa: SLF001
+        }
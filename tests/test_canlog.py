@@ -0,0 +1,157 @@
+from pathlib import Path
+
+import can
+import numpy as np
+import pytest
+
+from piper_kit.canlog import decode_log, load_log, read_log
+from piper_kit.messages import (
+    RECEIVE_MESSAGE_TYPES,
+    EndPoseFeedbackRyMessage,
+    EndPoseFeedbackXyMessage,
+    EndPoseFeedbackZpMessage,
+    GripperFeedbackMessage,
+    JointFeedback12Message,
+    JointFeedback34Message,
+    JointFeedback56Message,
+    MotorInfoBMessage,
+)
+
+
+def pack(*values: tuple[int, int, bool]) -> bytes:
+    return b"".join(
+        value.to_bytes(size, signed=signed) for value, size, signed in values
+    )
+
+
+def feedback_frames() -> list[can.Message]:
+    frames = []
+    for i in range(5):
+        timestamp = 1000.0 + i * 0.01
+        for arbitration_id, data in [
+            (0x2A2, pack((i * 100, 4, True), (-i * 100, 4, True))),
+            (0x2A3, pack((i * 200, 4, True), (-i * 200, 4, True))),
+            (0x2A4, pack((i * 300, 4, True), (-i * 300, 4, True))),
+            (0x2A5, pack((i * 1000, 4, True), (-i * 1000, 4, True))),
+            (0x2A6, pack((i * 2000, 4, True), (-i * 2000, 4, True))),
+            (0x2A7, pack((i * 3000, 4, True), (-i * 3000, 4, True))),
+            (0x2A8, pack((i * 500, 4, True), (i * 10, 2, False), (64, 1, False))),
+            (
+                0x261 + i,
+                pack(
+                    (240, 2, False),
+                    (-i, 2, True),
+                    (30 + i, 1, True),
+                    (64 | i, 1, False),
+                    (1000 + i, 2, False),
+                ),
+            ),
+        ]:
+            frames.append(
+                can.Message(
+                    timestamp=timestamp,
+                    arbitration_id=arbitration_id,
+                    data=data + bytes(8 - len(data)),
+                    is_extended_id=False,
+                )
+            )
+
+    # Frames that are skipped or that do not belong to the arm.
+    frames += [
+        can.Message(timestamp=1001.0, arbitration_id=0x2A5, data=b"\x00" * 4),
+        can.Message(timestamp=1001.0, arbitration_id=0x123, data=b"\x01\x02"),
+    ]
+    return frames
+
+
+def write_log(path: Path, frames: list[can.Message]) -> Path:
+    with can.Logger(path) as logger:
+        for frame in frames:
+            logger.on_message_received(frame)
+    return path
+
+
+def assert_decoded(tables: dict, frames: list[can.Message]) -> None:
+    # Decodes every frame of the arm one by one for reference.
+    expected = {}
+    for frame in frames:
+        message_type = RECEIVE_MESSAGE_TYPES.get(frame.arbitration_id)
+        if message_type is not None and len(frame.data) == 8:
+            expected.setdefault(message_type, []).append(message_type(frame))
+
+    assert set(tables) == set(expected)
+    for message_type, messages in expected.items():
+        table = tables[message_type]
+        # Some formats store timestamps relative to the start of the log.
+        timestamps = [msg.timestamp for msg in messages]
+        np.testing.assert_allclose(
+            np.diff(table["timestamp"]), np.diff(timestamps), atol=1e-6
+        )
+        for name, column in table.items():
+            if name != "timestamp":
+                values = [getattr(msg, name) for msg in messages]
+                if name in {"status", "driver_status"}:
+                    values = [status.code for status in values]
+                np.testing.assert_array_equal(column, values, err_msg=name)
+
+
+@pytest.mark.parametrize("suffix", [".log", ".asc", ".blf"])
+def test_load_log(tmp_path: Path, suffix: str) -> None:
+    frames = feedback_frames()
+    tables = load_log(write_log(tmp_path / f"session{suffix}", frames))
+    assert_decoded(tables, frames)
+
+    assert set(tables[JointFeedback12Message]) == {"timestamp", "joint_1", "joint_2"}
+    assert tables[JointFeedback12Message]["joint_1"].dtype == np.int32
+    np.testing.assert_array_equal(
+        tables[MotorInfoBMessage]["motor_id"], [1, 2, 3, 4, 5]
+    )
+    assert {
+        EndPoseFeedbackXyMessage,
+        EndPoseFeedbackZpMessage,
+        EndPoseFeedbackRyMessage,
+        JointFeedback34Message,
+        JointFeedback56Message,
+        GripperFeedbackMessage,
+    } <= set(tables)
+
+
+def test_read_candump(tmp_path: Path) -> None:
+    path = tmp_path / "session.log"
+    path.write_text(
+        "(1000.000100) can0 2A5#0000000100000002 R\n"
+        "(1000.000200) can0 123#R\n"
+        "(1000.000300) can0 2A5##10000000100000002\n"
+        "(1000.000400) can0 20000004#0000000000000000\n"
+        "(1000.000500) can0 000002A6#00000003000000\r\n"
+        "invalid\n"
+    )
+    frames = read_log(path)
+    np.testing.assert_array_equal(frames["timestamp"], [1000.0001, 1000.0005])
+    np.testing.assert_array_equal(frames["arbitration_id"], [0x2A5, 0x2A6])
+    np.testing.assert_array_equal(frames["length"], [8, 7])
+    np.testing.assert_array_equal(frames["data"][1], [0, 0, 0, 3, 0, 0, 0, 0])
+
+    # The joint feedback 34 frame is too short to decode.
+    tables = decode_log(frames)
+    assert set(tables) == {JointFeedback12Message}
+    np.testing.assert_array_equal(tables[JointFeedback12Message]["joint_2"], [2])
+
+
+@pytest.mark.parametrize("suffix", [".log", ".asc"])
+def test_read_empty_log(tmp_path: Path, suffix: str) -> None:
+    frames = read_log(write_log(tmp_path / f"session{suffix}", []))
+    assert frames["data"].shape == (0, 8)
+    assert decode_log(frames) == {}
+
+
+def test_read_skipped_frames(monkeypatch: pytest.MonkeyPatch) -> None:
+    messages = [
+        can.Message(timestamp=1.0, arbitration_id=0x2A5, is_error_frame=True),
+        can.Message(timestamp=1.0, arbitration_id=0x2A5, is_remote_frame=True),
+        can.Message(timestamp=1.0, arbitration_id=0x2A5, is_fd=True, data=bytes(12)),
+        can.Message(timestamp=2.0, arbitration_id=0x2A5, data=bytes(8)),
+    ]
+    monkeypatch.setattr(can, "LogReader", lambda _: messages)
+    frames = read_log("session.blf")
+    np.testing.assert_array_equal(frames["timestamp"], [2.0])
@@ -0,0 +1,37 @@
+import pytest
+
+from piper_kit.clock import ClockAligner
+from piper_kit.errors import UnalignedClockError
+
+
+def test_align() -> None:
+    aligner = ClockAligner()
+    assert aligner.offset is None
+    with pytest.raises(UnalignedClockError):
+        aligner.to_monotonic_ns(1.0)
+
+    # Bus timestamps are 1000 seconds behind, read after varying delays.
+    for i, delay in enumerate([300, 100, 200, 500]):
+        aligner.update(i * 0.01, 1000 * 10**9 + i * 10**7 + delay)
+
+    assert aligner.offset == 1000 * 10**9 + 100
+    assert aligner.to_monotonic_ns(2.0) == 1002 * 10**9 + 100
+
+
+def test_window() -> None:
+    aligner = ClockAligner(window=3)
+    for offset in [100, 400, 300, 200, 500]:
+        aligner.update(0.0, offset)
+
+    # The smallest offset has left the window.
+    assert aligner.offset == 200
+
+    aligner.update(0.0, 600)
+    aligner.update(0.0, 700)
+    assert aligner.offset == 500
+
+
+def test_default_clock() -> None:
+    aligner = ClockAligner(clock=lambda: 5 * 10**9)
+    aligner.update(2.0)
+    assert aligner.offset == 3 * 10**9
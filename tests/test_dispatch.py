@@ -0,0 +1,51 @@
+import can
+
+from piper_kit.dispatch import Dispatcher
+from piper_kit.messages import (
+    GripperFeedbackMessage,
+    JointFeedback12Message,
+    ReceiveMessage,
+)
+
+
+def feedback(arbitration_id: int) -> can.Message:
+    return can.Message(arbitration_id=arbitration_id, data=[0] * 8)
+
+
+def test_dispatcher() -> None:
+    dispatcher = Dispatcher()
+    joints, every_other, grippers = [], [], []
+    dispatcher.on(JointFeedback12Message, joints.append)
+    subscription = dispatcher.on(JointFeedback12Message, every_other.append, every=2)
+    dispatcher.on(GripperFeedbackMessage, grippers.append)
+
+    msgs = [JointFeedback12Message(feedback(JointFeedback12Message.ID)) for _ in "ab"]
+    gripper = GripperFeedbackMessage(feedback(GripperFeedbackMessage.ID))
+    for msg in (*msgs, gripper, msgs[0]):
+        dispatcher.dispatch(msg)
+    dispatcher.dispatch(ReceiveMessage(feedback(0x123)))
+
+    assert joints == [msgs[0], msgs[1], msgs[0]]
+    assert every_other == [msgs[0], msgs[0]]
+    assert grippers == [gripper]
+
+    subscription.cancel()
+    subscription.cancel()
+    dispatcher.dispatch(msgs[1])
+    assert every_other == [msgs[0], msgs[0]]
+    assert joints[-1] is msgs[1]
+
+
+def test_dispatcher_cancel_while_dispatching() -> None:
+    dispatcher = Dispatcher()
+    calls = []
+
+    def once(msg: GripperFeedbackMessage) -> None:
+        calls.append(msg)
+        subscription.cancel()
+
+    subscription = dispatcher.on(GripperFeedbackMessage, once)
+    msg = GripperFeedbackMessage(feedback(GripperFeedbackMessage.ID))
+    dispatcher.dispatch(msg)
+    dispatcher.dispatch(msg)
+    assert calls == [msg]
@@ -1,12 +1,32 @@
 from piper_kit.errors import (
+    EndOfReplayError,
+    FeedbackTimeoutError,
     InvalidControlModeError,
     InvalidGripperEffortError,
     InvalidJointIdError,
     InvalidMoveModeError,
     InvalidMoveSpeedRateError,
+    InvalidPacketError,
+    InvalidTimestampingError,
+    InvalidTrajectoryRowError,
+    InvalidTransportUriError,
+    RecorderWriterError,
+    SafetyViolationError,
+    UnalignedClockError,
+    UnreachablePoseError,
 )
 
 
+def test_end_of_replay_error() -> None:
+    error = EndOfReplayError()
+    assert str(error) == "End of replayed log file"
+
+
+def test_feedback_timeout_error() -> None:
+    error = FeedbackTimeoutError(0x2A5)
+    assert str(error) == "Feedback timed out: 0x2A5"
+
+
 def test_invalid_control_mode_error() -> None:
     error = InvalidControlModeError("invalid")
     assert str(error) == "Invalid control mode: 'invalid'"
@@ -30,3 +50,46 @@ def test_invalid_move_mode_error() -> None:
 def test_invalid_move_speed_rate_error() -> None:
     error = InvalidMoveSpeedRateError("invalid")
     assert str(error) == "Invalid move speed rate: 'invalid'"
+
+
+def test_invalid_packet_error() -> None:
+    error = InvalidPacketError(b"invalid")
+    assert str(error) == "Invalid state packet: b'invalid'"
+
+
+def test_invalid_timestamping_error() -> None:
+    error = InvalidTimestampingError("invalid")
+    assert str(error) == "Invalid timestamping mode: 'invalid'"
+
+
+def test_invalid_trajectory_row_error() -> None:
+    error = InvalidTrajectoryRowError("invalid")
+    assert str(error) == "Invalid trajectory row: 'invalid'"
+
+
+def test_invalid_transport_uri_error() -> None:
+    error = InvalidTransportUriError("invalid")
+    assert str(error) == "Invalid transport URI: 'invalid'"
+
+
+def test_recorder_writer_error() -> None:
+    error = RecorderWriterError(1)
+    assert str(error) == "Recorder writer exited with code 1"
+
+
+def test_safety_violation_error() -> None:
+    error = SafetyViolationError("joint 1 position 200000 outside -150000..150000")
+    assert (
+        str(error)
+        == "Safety envelope violated: joint 1 position 200000 outside -150000..150000"
+    )
+
+
+def test_unaligned_clock_error() -> None:
+    error = UnalignedClockError()
+    assert str(error) == "Clock has no samples to align with"
+
+
+def test_unreachable_pose_error() -> None:
+    error = UnreachablePoseError([1, 2, 3])
+    assert str(error) == "Unreachable end-effector pose: [1, 2, 3]"
@@ -0,0 +1,59 @@
+import pytest
+
+from piper_kit.jog import JogController
+
+
+def test_jog_controller() -> None:
+    jog = JogController(
+        [0, 100], [10, 10], [20, 20], first_hold=1.0, repeat_hold=0.2, clock=float
+    )
+    assert jog.positions == (0, 100)
+    assert jog.step(0.0) == (0, 100)
+
+    # The velocity ramps up to its maximum by the maximum acceleration.
+    jog.press(0, 1, 0.0)
+    assert jog.step(0.25) == (1, 100)
+    assert jog.velocities == (5, 0)
+    assert jog.step(0.5) == (4, 100)
+    assert jog.velocities == (10, 0)
+
+    # Repeated presses extend the hold by less than the first one.
+    jog.press(0, 1, 0.9)
+    jog.step(1.05)
+    assert jog.velocities == (10, 0)
+    jog.step(1.15)
+    assert jog.velocities[0] == pytest.approx(8)
+    assert jog.step(2.0) == (10, 100)
+    assert jog.velocities == (0, 0)
+
+    # Pressing the other direction starts a new hold.
+    jog.press(1, -1, 2.0)
+    jog.press(1, 1, 2.0)
+    jog.step(2.25)
+    assert jog.velocities == (0, 5)
+
+    jog.stop()
+    jog.step(2.5)
+    assert jog.velocities == (0, 0)
+
+
+def test_jog_controller_limits() -> None:
+    jog = JogController(
+        [0, 0], [10, 10], [100, 100], limits=[(-1, 1), (-100, 100)], clock=float
+    )
+    jog.press(0, 1, 0.0)
+    jog.press(1, -1, 0.0)
+    assert jog.step(0.2) == (1, -2)
+    assert jog.velocities == (0, -10)
+
+    jog.press(0, -1, 0.2)
+    assert jog.step(0.4) == (-1, -4)
+    assert jog.velocities == (0, -10)
+
+
+def test_jog_controller_clock() -> None:
+    now = 0.0
+    jog = JogController([0], [10], [10], clock=lambda: now)
+    jog.press(0, 1)
+    now = 0.25
+    assert jog.step() == (1,)
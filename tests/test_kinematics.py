@@ -0,0 +1,169 @@
+import numpy as np
+import pytest
+
+from piper_kit.errors import UnreachablePoseError
+from piper_kit.kinematics import (
+    JOINT_LIMITS,
+    InverseKinematics,
+    end_pose_from_transform,
+    end_pose_to_transform,
+    forward_kinematics,
+    joint_transforms,
+)
+
+
+def test_joint_transforms() -> None:
+    transforms = joint_transforms([0, 0, 0, 0, 0, 0])
+    assert transforms.shape == (6, 4, 4)
+    assert transforms[0] == pytest.approx(
+        np.array([[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 123], [0, 0, 0, 1]])
+    )
+
+    transforms = joint_transforms(np.zeros((3, 6)))
+    assert transforms.shape == (3, 6, 4, 4)
+
+
+def test_forward_kinematics_home() -> None:
+    pose = forward_kinematics([0, 0, 0, 0, 0, 0])
+    assert pose.shape == (6,)
+    assert pose == pytest.approx([56127.5, 0, 213266.3, 0, 85000, 0], abs=0.1)
+
+
+def test_forward_kinematics_base_rotation() -> None:
+    home = forward_kinematics([0, 0, 0, 0, 0, 0])
+    pose = forward_kinematics([90000, 0, 0, 0, 0, 0])
+    assert pose[0:3] == pytest.approx([0, home[0], home[2]], abs=1e-6)
+    assert pose[5] == pytest.approx(90000)
+
+
+def test_forward_kinematics_batch() -> None:
+    rng = np.random.default_rng(0)
+    joints = rng.uniform(-90000, 90000, (100, 6))
+
+    poses = forward_kinematics(joints)
+    assert poses.shape == (100, 6)
+    for i in (0, 50, 99):
+        assert poses[i] == pytest.approx(forward_kinematics(joints[i]))
+
+
+def test_end_pose_from_transform() -> None:
+    transform = np.eye(4)
+    transform[0:3, 3] = [0.1, 0.2, 0.3]
+    assert end_pose_from_transform(transform) == pytest.approx([100, 200, 300, 0, 0, 0])
+
+
+def test_end_pose_from_singular_transform() -> None:
+    # Rotation of 90 degrees about the Y axis followed by 30 degrees about X.
+    ry = np.array([[0, 0, 1], [0, 1, 0], [-1, 0, 0]])
+    c, s = np.cos(np.radians(30)), np.sin(np.radians(30))
+    rx = np.array([[1, 0, 0], [0, c, -s], [0, s, c]])
+
+    transform = np.eye(4)
+    transform[0:3, 0:3] = ry @ rx
+    pose = end_pose_from_transform(transform)
+    assert pose == pytest.approx([0, 0, 0, 30000, 90000, 0])
+
+
+def test_end_pose_to_transform() -> None:
+    rng = np.random.default_rng(0)
+    poses = np.column_stack(
+        [
+            rng.uniform(-300000, 300000, (50, 3)),
+            rng.uniform(-180000, 180000, (50, 1)),
+            rng.uniform(-89000, 89000, (50, 1)),
+            rng.uniform(-180000, 180000, (50, 1)),
+        ]
+    )
+
+    transforms = end_pose_to_transform(poses)
+    assert transforms.shape == (50, 4, 4)
+    assert end_pose_from_transform(transforms) == pytest.approx(poses)
+
+
+class TestInverseKinematics:
+    JOINTS = np.array([10000, 60000, -70000, 20000, 30000, 40000])
+
+    def assert_reaches(self, joints: np.ndarray, poses: np.ndarray) -> None:
+        error = np.abs(forward_kinematics(joints) - poses)
+        assert error[..., 0:3].max() <= 100
+        assert error[..., 3:6].max() <= 100
+
+    def test_solve(self) -> None:
+        ik = InverseKinematics()
+        pose = forward_kinematics(self.JOINTS)
+
+        joints = ik.solve(pose, seed=self.JOINTS + 5000)
+        self.assert_reaches(joints, pose)
+        assert joints == pytest.approx(self.JOINTS, abs=100)
+        assert ik.last_solution == pytest.approx(joints)
+
+    def test_solve_with_restarts(self) -> None:
+        ik = InverseKinematics()
+        pose = forward_kinematics(self.JOINTS)
+
+        joints = ik.solve(pose, seed=[-150000, 0, 0, 0, 0, 0])
+        self.assert_reaches(joints, pose)
+
+    def test_solve_half_turn_from_seed(self) -> None:
+        ik = InverseKinematics()
+        pose = forward_kinematics([0, 0, 0, 0, 0, 90000])
+
+        joints = ik.solve(pose, seed=[0, 0, 0, 0, 0, -90000])
+        self.assert_reaches(joints, pose)
+
+    def test_solve_unreachable(self) -> None:
+        ik = InverseKinematics()
+        with pytest.raises(UnreachablePoseError):
+            ik.solve([1000000, 0, 0, 0, 0, 0])
+
+    def test_solve_cache(self) -> None:
+        ik = InverseKinematics(cache_size=2)
+        poses = forward_kinematics([self.JOINTS, self.JOINTS + 1000, self.JOINTS])
+
+        first = ik.solve(poses[0], seed=self.JOINTS)
+        ik.solve(poses[1])
+
+        ik.last_solution = np.zeros(6)
+        assert ik.solve(poses[0]) == pytest.approx(first)
+        assert ik.last_solution == pytest.approx(first)
+
+        ik.solve(poses[0] + 1000)
+        assert len(ik._cache) == 2  # noqa: SLF001
+
+    def test_solve_without_cache(self) -> None:
+        ik = InverseKinematics(cache_size=0)
+        ik.solve(forward_kinematics(self.JOINTS), seed=self.JOINTS)
+        assert len(ik._cache) == 0  # noqa: SLF001
+
+    def test_solve_path(self) -> None:
+        ik = InverseKinematics()
+        steps = np.linspace(0, 1, 200)[:, np.newaxis]
+        joints = self.JOINTS + steps * [20000, 10000, -10000, 10000, -20000, 30000]
+        poses = forward_kinematics(joints)
+
+        solutions = ik.solve_path(poses, seed=self.JOINTS)
+        assert solutions.shape == (200, 6)
+        self.assert_reaches(solutions, poses)
+        assert np.abs(np.diff(solutions, axis=0)).max() < 1000
+        assert ik.last_solution == pytest.approx(solutions[-1])
+
+    def test_solve_path_far_from_seed(self) -> None:
+        ik = InverseKinematics()
+        ik.last_solution = self.JOINTS.astype(float)
+        joints = [self.JOINTS, self.JOINTS - 40000, self.JOINTS - 60000]
+        poses = forward_kinematics(np.clip(joints, JOINT_LIMITS[:, 0], None))
+
+        solutions = ik.solve_path(poses)
+        assert solutions.shape == (3, 6)
+        self.assert_reaches(solutions, poses)
+
+    def test_solve_path_unreachable(self) -> None:
+        ik = InverseKinematics()
+        poses = [forward_kinematics(self.JOINTS), [1000000, 0, 0, 0, 0, 0]]
+        with pytest.raises(UnreachablePoseError):
+            ik.solve_path(poses, seed=self.JOINTS)
+
+    def test_solve_empty_path(self) -> None:
+        ik = InverseKinematics()
+        assert ik.solve_path(np.empty((0, 6))).shape == (0, 6)
+        assert ik.last_solution == pytest.approx(np.zeros(6))
@@ -0,0 +1,82 @@
+from pathlib import Path
+
+from piper_kit.metrics import Metrics, MetricsHook, PrometheusExporter
+
+
+def test_metrics_hook() -> None:
+    hook = MetricsHook()
+    hook.frame_sent(0x155)
+    hook.send_failed(0x155, OSError())
+    hook.frame_received(0x2A5, 0.001)
+    hook.queue_depth_changed("transmit", 1)
+    hook.loop_overrun("record", 0.001)
+
+
+def test_metrics() -> None:
+    metrics = Metrics()
+    metrics.frame_sent(0x155)
+    metrics.frame_sent(0x155)
+    metrics.send_failed(0x156, OSError())
+    metrics.frame_received(0x2A5, 0.001)
+    metrics.frame_received(0x2A6, 0.003)
+    metrics.queue_depth_changed("transmit", 3)
+    metrics.queue_depth_changed("transmit", 1)
+    metrics.loop_overrun("record", 0.25)
+    metrics.loop_overrun("record", 0.5)
+
+    assert metrics.frames_sent == {0x155: 2}
+    assert metrics.send_failures == {0x156: 1}
+    assert metrics.frames_received == {0x2A5: 1, 0x2A6: 1}
+    assert metrics.decode_time.mean == 0.002
+    assert metrics.queue_depths == {"transmit": 1}
+    assert metrics.loop_overruns == {"record": 2}
+    assert metrics.overrun_time == {"record": 0.75}
+
+
+def test_prometheus_exporter(tmp_path: Path) -> None:
+    metrics = Metrics()
+    metrics.frame_sent(0x156)
+    metrics.frame_sent(0x155)
+    metrics.frame_received(0x2A5, 0.5)
+    metrics.queue_depth_changed("transmit", 2)
+    metrics.loop_overrun("record", 0.25)
+
+    exporter = PrometheusExporter(
+        metrics, tmp_path / "piper.prom", labels={"arm": 'left "0"\\\n'}
+    )
+    exporter.write()
+
+    labels = 'arm="left \\"0\\"\\\\\\n"'
+    assert (tmp_path / "piper.prom").read_text() == (
+        "# HELP piper_frames_sent_total Frames sent.\n"
+        "# TYPE piper_frames_sent_total counter\n"
+        f'piper_frames_sent_total{{{labels},id="0x155"}} 1\n'
+        f'piper_frames_sent_total{{{labels},id="0x156"}} 1\n'
+        "# HELP piper_send_failures_total Frames that failed to be sent.\n"
+        "# TYPE piper_send_failures_total counter\n"
+        "# HELP piper_frames_received_total Frames received.\n"
+        "# TYPE piper_frames_received_total counter\n"
+        f'piper_frames_received_total{{{labels},id="0x2A5"}} 1\n'
+        "# HELP piper_queue_depth Items waiting in a queue.\n"
+        "# TYPE piper_queue_depth gauge\n"
+        f'piper_queue_depth{{{labels},queue="transmit"}} 2\n'
+        "# HELP piper_loop_overruns_total Missed loop deadlines.\n"
+        "# TYPE piper_loop_overruns_total counter\n"
+        f'piper_loop_overruns_total{{{labels},loop="record"}} 1\n'
+        "# HELP piper_loop_overrun_seconds_total "
+        "Total lateness of missed loop deadlines.\n"
+        "# TYPE piper_loop_overrun_seconds_total counter\n"
+        f'piper_loop_overrun_seconds_total{{{labels},loop="record"}} 0.25\n'
+        "# HELP piper_decode_seconds Time spent decoding received frames.\n"
+        "# TYPE piper_decode_seconds summary\n"
+        f"piper_decode_seconds_sum{{{labels}}} 0.5\n"
+        f"piper_decode_seconds_count{{{labels}}} 1\n"
+    )
+    assert list(tmp_path.iterdir()) == [tmp_path / "piper.prom"]
+
+
+def test_prometheus_exporter_without_labels(tmp_path: Path) -> None:
+    exporter = PrometheusExporter(Metrics(), tmp_path / "arm.prom", prefix="arm")
+    assert exporter.render().endswith(
+        "arm_decode_seconds_sum 0.0\narm_decode_seconds_count 0\n"
+    )
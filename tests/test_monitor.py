@@ -0,0 +1,110 @@
+import can
+import pytest
+
+from piper_kit.monitor import BusMonitor, FrameStats, frame_bits
+
+
+def make_frame(arbitration_id: int, timestamp: float, length: int = 8) -> can.Message:
+    return can.Message(
+        arbitration_id=arbitration_id,
+        data=bytes(length),
+        timestamp=timestamp,
+        is_extended_id=arbitration_id > 0x7FF,
+    )
+
+
+def test_frame_bits() -> None:
+    assert frame_bits(0) == 55
+    assert frame_bits(8) == 135
+    assert frame_bits(8, extended=True) == 160
+
+
+class TestFrameStats:
+    def test_empty(self) -> None:
+        stats = FrameStats()
+        assert stats.count == 0
+        assert stats.gaps == 0
+        assert stats.last_timestamp is None
+        assert stats.rate == 0.0
+        assert stats.jitter == 0.0
+
+    def test_steady_rate(self) -> None:
+        stats = FrameStats(window=1.0)
+        for i in range(500):
+            stats.update(i * 0.005)
+
+        assert stats.count == 500
+        assert stats.gaps == 0
+        assert stats.last_timestamp == pytest.approx(2.495)
+        assert stats.rate == pytest.approx(200.0)
+        assert stats.jitter == pytest.approx(0.0, abs=1e-6)
+
+    def test_jitter(self) -> None:
+        stats = FrameStats(window=10.0)
+        for timestamp in (0.0, 0.01, 0.03, 0.04, 0.06):
+            stats.update(timestamp)
+
+        assert stats.rate == pytest.approx(4 / 0.06)
+        assert stats.jitter == pytest.approx(0.005)
+
+    def test_gaps(self) -> None:
+        stats = FrameStats(window=10.0, gap_factor=2.5)
+        for timestamp in (0.0, 0.01, 0.02, 0.03, 0.1, 0.11):
+            stats.update(timestamp)
+
+        assert stats.gaps == 1
+
+    def test_gap_longer_than_window(self) -> None:
+        stats = FrameStats(window=1.0)
+        for i in range(200):
+            stats.update(i * 0.005)
+
+        stats.expire(4.0)
+        stats.update(4.0)
+        stats.update(4.005)
+        assert stats.gaps == 1
+
+    def test_expire(self) -> None:
+        stats = FrameStats(window=1.0)
+        for i in range(10):
+            stats.update(i * 0.01)
+
+        stats.expire(1.035)
+        assert stats.rate == pytest.approx(100.0)
+
+        stats.expire(5.0)
+        assert stats.count == 10
+        assert stats.rate == 0.0
+        assert stats.jitter == 0.0
+
+
+class TestBusMonitor:
+    def test_update(self) -> None:
+        monitor = BusMonitor(window=1.0, known_ids={0x2A5})
+        for i in range(100):
+            monitor.update(make_frame(0x2A5, i * 0.01))
+            monitor.update(make_frame(0x123, i * 0.01, length=2))
+
+        assert sorted(monitor.stats) == [0x123, 0x2A5]
+        assert monitor.stats[0x2A5].count == 100
+        assert monitor.stats[0x2A5].rate == pytest.approx(100.0)
+        assert monitor.unknown_count == 100
+
+    def test_load(self) -> None:
+        monitor = BusMonitor(window=1.0, bitrate=1_000_000)
+        for i in range(1000):
+            monitor.update(make_frame(0x2A5, i * 0.001))
+
+        assert monitor.load == pytest.approx(135 * 1000 / 1_000_000)
+
+        monitor.update(make_frame(0x12345678, 1.0005))
+        assert monitor.load == pytest.approx((135 * 999 + 160) / 1_000_000)
+
+    def test_expire(self) -> None:
+        monitor = BusMonitor(window=1.0)
+        for i in range(10):
+            monitor.update(make_frame(0x2A5, i * 0.01))
+
+        monitor.expire(2.0)
+        assert monitor.stats[0x2A5].rate == 0.0
+        assert monitor.load == 0.0
@@ -0,0 +1,14 @@
+from piper_kit.motion import MoveResult
+
+
+def test_move_result() -> None:
+    result = MoveResult(settled=True, settle_time=1.5, error=[1, -2, 3])
+    assert result.settled is True
+    assert result.settle_time == 1.5
+    assert result.error == [1, -2, 3]
+    assert result.max_error == 3
+
+
+def test_move_result_missing_error() -> None:
+    result = MoveResult(settled=False, settle_time=1.5, error=[1, None, 3])
+    assert result.max_error is None
@@ -0,0 +1,411 @@
+import time
+from collections.abc import Iterator
+
+import can
+import pytest
+
+from piper_kit import Piper
+from piper_kit.errors import FeedbackTimeoutError, SafetyViolationError
+from piper_kit.messages import (
+    EnableJointMessage,
+    EndPoseControlRyMessage,
+    EndPoseControlXyMessage,
+    EndPoseControlZpMessage,
+    EndPoseFeedbackRyMessage,
+    EndPoseFeedbackXyMessage,
+    EndPoseFeedbackZpMessage,
+    GripperControlMessage,
+    GripperFeedbackMessage,
+    JointConfigMessage,
+    JointControl12Message,
+    JointControl34Message,
+    JointControl56Message,
+    JointFeedback12Message,
+    JointFeedback34Message,
+    JointFeedback56Message,
+    MotionControlBMessage,
+    MotorInfoBMessage,
+    UnknownMessage,
+)
+from piper_kit.metrics import Metrics
+from piper_kit.safety import SafetyEnvelope
+from piper_kit.transports import PythonCanTransport
+from piper_kit.watchdog import FeedbackWatchdog
+
+
+@pytest.fixture
+def channel(request: pytest.FixtureRequest) -> str:
+    return request.node.name
+
+
+@pytest.fixture
+def piper(channel: str) -> Iterator[Piper]:
+    with Piper(f"virtual://{channel}") as piper:
+        yield piper
+
+
+@pytest.fixture
+def arm(channel: str) -> Iterator[can.BusABC]:
+    with can.Bus(interface="virtual", channel=channel) as bus:
+        yield bus
+
+
+def recv_all(arm: can.BusABC) -> list[tuple[int, list[int]]]:
+    msgs = []
+    while (msg := arm.recv(0)) is not None:
+        msgs.append((msg.arbitration_id, list(msg.data)))
+    return msgs
+
+
+def send_feedback(arm: can.BusABC, arbitration_id: int, *data: int) -> None:
+    arm.send(can.Message(arbitration_id=arbitration_id, data=data))
+
+
+def test_piper_with_transport(channel: str) -> None:
+    transport = PythonCanTransport("virtual", channel)
+    with Piper(transport) as piper:
+        assert piper.transport is transport
+
+
+def test_set_motion_control_b(piper: Piper, arm: can.BusABC) -> None:
+    piper.set_motion_control_b("joint", 50)
+    assert recv_all(arm) == [
+        (MotionControlBMessage.ID, [0x01, 0x01, 0x32, 0, 0, 0, 0, 0]),
+    ]
+
+
+def test_set_end_pose_control(piper: Piper, arm: can.BusABC) -> None:
+    piper.set_end_pose_control(1, 2, 3, 4, 5, 6)
+    assert recv_all(arm) == [
+        (EndPoseControlXyMessage.ID, [0, 0, 0, 1, 0, 0, 0, 2]),
+        (EndPoseControlZpMessage.ID, [0, 0, 0, 3, 0, 0, 0, 4]),
+        (EndPoseControlRyMessage.ID, [0, 0, 0, 5, 0, 0, 0, 6]),
+    ]
+
+
+def test_set_joint_control(piper: Piper, arm: can.BusABC) -> None:
+    piper.set_joint_control(1, 2, 3, 4, 5, 6)
+    assert recv_all(arm) == [
+        (JointControl12Message.ID, [0, 0, 0, 1, 0, 0, 0, 2]),
+        (JointControl34Message.ID, [0, 0, 0, 3, 0, 0, 0, 4]),
+        (JointControl56Message.ID, [0, 0, 0, 5, 0, 0, 0, 6]),
+    ]
+
+
+def test_gripper_control(piper: Piper, arm: can.BusABC) -> None:
+    piper.set_gripper_control(1000, 2000)
+    piper.enable_gripper()
+    piper.disable_gripper()
+    assert recv_all(arm) == [
+        (GripperControlMessage.ID, [0x00, 0x00, 0x03, 0xE8, 0x07, 0xD0, 0x01, 0x00]),
+        (GripperControlMessage.ID, [0, 0, 0, 0, 0, 0, 0x01, 0]),
+        (GripperControlMessage.ID, [0, 0, 0, 0, 0, 0, 0x00, 0]),
+    ]
+
+
+def test_safety_envelope(channel: str, arm: can.BusABC) -> None:
+    safety = SafetyEnvelope(
+        max_joint_step=1000,
+        workspace=[(0, 500_000), (-500_000, 500_000), (0, 600_000)],
+        gripper_range=(0, 70_000),
+    )
+    with Piper(f"virtual://{channel}", safety=safety) as piper:
+        piper.set_joint_control(0, 1000, -1000, 0, 0, 0)
+        piper.set_end_pose_control(100_000, 0, 200_000, 0, 0, 0)
+        piper.set_gripper_control(50_000, 1000)
+        assert len(recv_all(arm)) == 7
+
+        with pytest.raises(SafetyViolationError):
+            piper.set_joint_control(0, 1000, -1000, 0, 0, 1500)
+        with pytest.raises(SafetyViolationError):
+            piper.set_end_pose_control(-100_000, 0, 200_000, 0, 0, 0)
+        with pytest.raises(SafetyViolationError):
+            piper.set_gripper_control(80_000, 1000)
+
+        # Nothing is sent for a rejected command, but disabling always is.
+        piper.disable_gripper()
+        assert recv_all(arm) == [
+            (GripperControlMessage.ID, [0, 0, 0, 0, 0, 0, 0x00, 0]),
+        ]
+
+
+def test_safety_envelope_unsent(
+    channel: str, arm: can.BusABC, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    safety = SafetyEnvelope(max_joint_step=1000)
+    watchdog = FeedbackWatchdog(0.05)
+    with Piper(f"virtual://{channel}", safety=safety, watchdog=watchdog) as piper:
+        piper.set_joint_control(0, 1000, -1000, 0, 0, 0)
+
+        # Setpoints stopped by the watchdog are not the base of the step limit.
+        time.sleep(0.05)
+        with pytest.raises(FeedbackTimeoutError):
+            piper.set_joint_control(0, 2000, -1000, 0, 0, 0)
+        assert len(recv_all(arm)) == 3
+
+        # Neither are setpoints that failed to send.
+        def fail(_: object) -> None:
+            raise can.CanError
+
+        watchdog.reset()
+        monkeypatch.setattr(piper.transport, "send", fail)
+        with pytest.raises(can.CanError):
+            piper.set_joint_control(0, 2000, -1000, 0, 0, 0)
+        with pytest.raises(SafetyViolationError, match="joint 2 step 2000"):
+            piper.set_joint_control(0, 3000, -1000, 0, 0, 0)
+
+
+def test_watchdog_raise(channel: str, arm: can.BusABC) -> None:
+    watchdog = FeedbackWatchdog(0.05, [JointFeedback12Message.ID])
+    with Piper(f"virtual://{channel}", watchdog=watchdog) as piper:
+        send_feedback(arm, JointFeedback12Message.ID, *[0] * 8)
+        assert isinstance(piper.read_message(), JointFeedback12Message)
+        piper.set_joint_control(0, 0, 0, 0, 0, 0)
+        piper.set_end_pose_control(0, 0, 0, 0, 0, 0)
+        piper.set_gripper_control(0, 0)
+        assert len(recv_all(arm)) == 7
+
+        with pytest.raises(FeedbackTimeoutError):
+            piper.read_message()
+        with pytest.raises(FeedbackTimeoutError):
+            piper.read_message(1.0)
+        assert piper.read_message(0) is None
+
+        # Stale feedback stops setpoints, but never disabling.
+        for send in (
+            lambda: piper.set_joint_control(0, 0, 0, 0, 0, 0),
+            lambda: piper.set_end_pose_control(0, 0, 0, 0, 0, 0),
+            lambda: piper.set_gripper_control(0, 0),
+        ):
+            time.sleep(0.05)
+            with pytest.raises(FeedbackTimeoutError):
+                send()
+        piper.disable_gripper()
+        assert len(recv_all(arm)) == 1
+
+
+def test_watchdog_disable(channel: str, arm: can.BusABC) -> None:
+    watchdog = FeedbackWatchdog(0.05, action="disable")
+    with Piper(f"virtual://{channel}", watchdog=watchdog) as piper:
+        with pytest.raises(FeedbackTimeoutError):
+            piper.read_message()
+        assert recv_all(arm) == [
+            (EnableJointMessage.ID, [0x07, 0x01, 0, 0, 0, 0, 0, 0]),
+        ]
+
+
+def test_watchdog_callback(channel: str, arm: can.BusABC) -> None:
+    stale = []
+    watchdog = FeedbackWatchdog(0.02, [GripperFeedbackMessage.ID], action=stale.append)
+    with Piper(f"virtual://{channel}", watchdog=watchdog) as piper:
+        assert piper.read_message(0.05) is None
+        assert stale[:2] == [GripperFeedbackMessage.ID] * 2
+
+        send_feedback(arm, MotorInfoBMessage.ID1, *[0] * 8)
+        assert isinstance(piper.read_message(), MotorInfoBMessage)
+
+
+def test_metrics(channel: str, arm: can.BusABC) -> None:
+    metrics = Metrics()
+    with Piper(f"virtual://{channel}", metrics=metrics) as piper:
+        piper.set_joint_control(0, 0, 0, 0, 0, 0)
+        assert len(recv_all(arm)) == 3
+
+        send_feedback(arm, JointFeedback12Message.ID, *[0] * 8)
+        assert isinstance(piper.read_message(), JointFeedback12Message)
+
+        piper.transport.close()
+        with pytest.raises(can.CanOperationError):
+            piper.enable_all_joints()
+
+    assert metrics.frames_sent == {
+        JointControl12Message.ID: 1,
+        JointControl34Message.ID: 1,
+        JointControl56Message.ID: 1,
+    }
+    assert metrics.send_failures == {EnableJointMessage.ID: 1}
+    assert metrics.frames_received == {JointFeedback12Message.ID: 1}
+    assert metrics.decode_time.count == 1
+
+
+def test_enable_joints(piper: Piper, arm: can.BusABC) -> None:
+    piper.enable_joint(1)
+    piper.disable_joint(2)
+    piper.enable_all_joints()
+    piper.disable_all_joints()
+    assert recv_all(arm) == [
+        (EnableJointMessage.ID, [1, 0x02, 0, 0, 0, 0, 0, 0]),
+        (EnableJointMessage.ID, [2, 0x01, 0, 0, 0, 0, 0, 0]),
+        (EnableJointMessage.ID, [7, 0x02, 0, 0, 0, 0, 0, 0]),
+        (EnableJointMessage.ID, [7, 0x01, 0, 0, 0, 0, 0, 0]),
+    ]
+
+
+def test_set_joint_configs(piper: Piper, arm: can.BusABC) -> None:
+    piper.set_joint_config(1, set_zero=True)
+    piper.set_all_joint_configs(clear_error=True)
+    assert recv_all(arm) == [
+        (JointConfigMessage.ID, [1, 0xAE, 0x00, 0x7F, 0xFF, 0x00, 0, 0]),
+        (JointConfigMessage.ID, [7, 0x00, 0x00, 0x7F, 0xFF, 0xAE, 0, 0]),
+    ]
+
+
+def test_read_message(piper: Piper, arm: can.BusABC) -> None:
+    send_feedback(arm, MotorInfoBMessage.ID3, 0, 0, 0, 0, 0, 0x40, 0, 0)
+    send_feedback(arm, JointFeedback12Message.ID, 0, 0, 0, 1, 0, 0, 0, 2)
+    send_feedback(arm, JointFeedback34Message.ID, 0, 0, 0, 3, 0, 0, 0, 4)
+    send_feedback(arm, JointFeedback56Message.ID, 0, 0, 0, 5, 0, 0, 0, 6)
+    send_feedback(arm, GripperFeedbackMessage.ID, 0, 0, 0, 7, 0, 0, 0, 0)
+    send_feedback(arm, 0x123, 1, 2)
+
+    send_feedback(arm, EndPoseFeedbackXyMessage.ID, 0, 0, 0, 1, 0, 0, 0, 2)
+    send_feedback(arm, EndPoseFeedbackZpMessage.ID, 0, 0, 0, 3, 0, 0, 0, 4)
+    send_feedback(arm, EndPoseFeedbackRyMessage.ID, 0, 0, 0, 5, 0, 0, 0, 6)
+
+    msg = piper.read_message()
+    assert isinstance(msg, MotorInfoBMessage)
+    assert msg.motor_id == 3
+
+    assert isinstance(piper.read_message(), JointFeedback12Message)
+    assert isinstance(piper.read_message(), JointFeedback34Message)
+    assert isinstance(piper.read_message(), JointFeedback56Message)
+    assert isinstance(piper.read_message(), GripperFeedbackMessage)
+    assert isinstance(piper.read_message(), UnknownMessage)
+    assert isinstance(piper.read_message(), EndPoseFeedbackXyMessage)
+    assert isinstance(piper.read_message(), EndPoseFeedbackZpMessage)
+    assert isinstance(piper.read_message(), EndPoseFeedbackRyMessage)
+    assert piper.read_message(timeout=0.01) is None
+
+
+def test_subscriptions(piper: Piper, arm: can.BusABC) -> None:
+    grippers = []
+    piper.on(GripperFeedbackMessage, grippers.append, every=2)
+
+    # Frames read while waiting for other feedback are not taken from subscribers.
+    for position in (1, 2, 3):
+        send_feedback(arm, GripperFeedbackMessage.ID, 0, 0, 0, position, 0, 0, 0, 0)
+    send_feedback(arm, JointFeedback12Message.ID, *[0] * 8)
+    send_feedback(arm, JointFeedback34Message.ID, *[0] * 8)
+    send_feedback(arm, JointFeedback56Message.ID, *[0] * 8)
+    assert piper.read_all_joint_feedbacks() == [0] * 6
+    assert [msg.position for msg in grippers] == [1, 3]
+
+
+def test_read_all_motor_info_bs(piper: Piper, arm: can.BusABC) -> None:
+    send_feedback(arm, JointFeedback12Message.ID, 0, 0, 0, 0, 0, 0, 0, 0)
+    for motor_id in range(6, 0, -1):
+        arbitration_id = MotorInfoBMessage.ID0 + motor_id
+        send_feedback(arm, arbitration_id, 0, motor_id, 0, 0, 0, 0, 0, 0)
+
+    infos = piper.read_all_motor_info_bs()
+    assert [i.motor_id for i in infos] == [1, 2, 3, 4, 5, 6]
+    assert [i.bus_voltage for i in infos] == [1, 2, 3, 4, 5, 6]
+
+
+def test_read_all_joint_feedbacks(piper: Piper, arm: can.BusABC) -> None:
+    send_feedback(arm, GripperFeedbackMessage.ID, 0, 0, 0, 7, 0, 0, 0, 0)
+    send_feedback(arm, JointFeedback56Message.ID, 0, 0, 0, 5, 0, 0, 0, 6)
+    send_feedback(arm, JointFeedback34Message.ID, 0, 0, 0, 3, 0, 0, 0, 4)
+    send_feedback(arm, JointFeedback12Message.ID, 0, 0, 0, 1, 0, 0, 0, 2)
+
+    assert piper.read_all_joint_feedbacks() == [1, 2, 3, 4, 5, 6]
+
+
+def test_read_gripper_feedback(piper: Piper, arm: can.BusABC) -> None:
+    send_feedback(arm, JointFeedback12Message.ID, 0, 0, 0, 1, 0, 0, 0, 2)
+    send_feedback(arm, GripperFeedbackMessage.ID, 0, 0, 0, 7, 0, 0, 0, 0)
+
+    assert piper.read_gripper_feedback().position == 7
+
+
+def test_read_end_pose(piper: Piper, arm: can.BusABC) -> None:
+    send_feedback(arm, JointFeedback12Message.ID, 0, 0, 0, 0, 0, 0, 0, 0)
+    send_feedback(arm, JointFeedback34Message.ID, 0, 0, 0, 0, 0, 0, 0, 0)
+    send_feedback(arm, JointFeedback56Message.ID, 0, 0, 0, 0, 0, 0, 0, 0)
+
+    assert piper.read_end_pose() == [56128, 0, 213266, 0, 85000, 0]
+
+
+def send_pairs(arm: can.BusABC, ids: list[int], values: list[int]) -> None:
+    for i, arbitration_id in enumerate(ids):
+        data = values[i * 2].to_bytes(4, signed=True)
+        data += values[i * 2 + 1].to_bytes(4, signed=True)
+        arm.send(can.Message(arbitration_id=arbitration_id, data=data))
+
+
+JOINT_FEEDBACK_IDS = [
+    JointFeedback12Message.ID,
+    JointFeedback34Message.ID,
+    JointFeedback56Message.ID,
+]
+
+END_POSE_FEEDBACK_IDS = [
+    EndPoseFeedbackXyMessage.ID,
+    EndPoseFeedbackZpMessage.ID,
+    EndPoseFeedbackRyMessage.ID,
+]
+
+
+def test_move_joints_to(piper: Piper, arm: can.BusABC) -> None:
+    send_pairs(arm, JOINT_FEEDBACK_IDS, [5000, 0, 0, 0, 0, 0])
+    send_feedback(arm, GripperFeedbackMessage.ID, 0, 0, 0, 0, 0, 0, 0, 0)
+    send_pairs(arm, JOINT_FEEDBACK_IDS[0:1], [1500, 2000])
+
+    result = piper.move_joints_to([1000, 2000, 0, 0, 0, 0], tolerance=500)
+    assert result.settled is True
+    assert result.settle_time >= 0
+    assert result.error == [-500, 0, 0, 0, 0, 0]
+    assert recv_all(arm) == [
+        (JointControl12Message.ID, [0, 0, 0x03, 0xE8, 0, 0, 0x07, 0xD0]),
+        (JointControl34Message.ID, [0, 0, 0, 0, 0, 0, 0, 0]),
+        (JointControl56Message.ID, [0, 0, 0, 0, 0, 0, 0, 0]),
+    ]
+
+
+def test_move_joints_to_timeout(piper: Piper, arm: can.BusABC) -> None:
+    send_pairs(arm, JOINT_FEEDBACK_IDS[0:2], [5000, 0, 0, 0])
+
+    result = piper.move_joints_to([0, 0, 0, 0, 0, 0], timeout=0.05)
+    assert result.settled is False
+    assert result.settle_time >= 0.05
+    assert result.error == [-5000, 0, 0, 0, None, None]
+
+
+def test_move_end_pose_to(piper: Piper, arm: can.BusABC) -> None:
+    send_pairs(arm, END_POSE_FEEDBACK_IDS, [1, 2, 3, 4, 5, 6])
+
+    result = piper.move_end_pose_to([1, 2, 3, 4, 5, 6], timeout=1.0)
+    assert result.settled is True
+    assert result.error == [0, 0, 0, 0, 0, 0]
+    assert [i for i, _ in recv_all(arm)] == [
+        EndPoseControlXyMessage.ID,
+        EndPoseControlZpMessage.ID,
+        EndPoseControlRyMessage.ID,
+    ]
+
+
+def test_move_end_pose_to_wraps_angles(piper: Piper, arm: can.BusABC) -> None:
+    send_pairs(arm, END_POSE_FEEDBACK_IDS, [1, 2, 3, -179990, 179990, -180000])
+
+    result = piper.move_end_pose_to([1, 2, 3, 180000, -179990, 180000], timeout=1.0)
+    assert result.settled is True
+    assert result.error == [0, 0, 0, -10, 20, 0]
+
+
+def test_wait_all_joints_enabled(piper: Piper, arm: can.BusABC) -> None:
+    for motor_id in range(1, 7):
+        arbitration_id = MotorInfoBMessage.ID0 + motor_id
+        send_feedback(arm, arbitration_id, 0, 0, 0, 0, 0, 0x00, 0, 0)
+    send_feedback(arm, JointFeedback12Message.ID, 0, 0, 0, 0, 0, 0, 0, 0)
+    for motor_id in range(1, 7):
+        arbitration_id = MotorInfoBMessage.ID0 + motor_id
+        send_feedback(arm, arbitration_id, 0, 0, 0, 0, 0, 0x40, 0, 0)
+
+    assert piper.wait_all_joints_enabled() is True
+    assert piper.read_message(timeout=0) is None
+
+
+def test_wait_all_joints_enabled_timeout(piper: Piper, arm: can.BusABC) -> None:
+    send_feedback(arm, MotorInfoBMessage.ID1, 0, 0, 0, 0, 0, 0x40, 0, 0)
+
+    assert piper.wait_all_joints_enabled(timeout=0.05) is False
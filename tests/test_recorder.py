@@ -0,0 +1,156 @@
+import os
+import queue
+import signal
+import threading
+import time
+from pathlib import Path
+
+import can
+import numpy as np
+import pytest
+
+from piper_kit.errors import RecorderWriterError
+from piper_kit.messages import (
+    GripperFeedbackMessage,
+    JointFeedback12Message,
+    JointFeedback56Message,
+    MotorInfoBMessage,
+)
+from piper_kit.recorder import COLUMNS, Episode, EpisodeRecorder, _write_chunks
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0
+
+    def __call__(self) -> int:
+        return self.now
+
+
+def feedback(message_type: type, timestamp: float, *values: int) -> object:
+    data = b"".join(v.to_bytes(4, signed=True) for v in values).ljust(8, b"\0")
+    arbitration_id = getattr(message_type, "ID", MotorInfoBMessage.ID1)
+    return message_type(
+        can.Message(arbitration_id=arbitration_id, data=data, timestamp=timestamp)
+    )
+
+
+def record(path: Path, *, compress: bool) -> None:
+    clock = FakeClock()
+    with EpisodeRecorder(
+        path, ["leader", "follower"], chunk_size=3, compress=compress, clock=clock
+    ) as recorder:
+        for i in range(7):
+            clock.now = (i + 10) * 10**9
+            recorder.update(0, feedback(JointFeedback12Message, i, i, -i))
+            if i % 2 == 0:
+                recorder.update(1, feedback(GripperFeedbackMessage, 100 + i, i * 10))
+            recorder.update(1, feedback(MotorInfoBMessage, 100 + i))
+            recorder.sample()
+
+        recorder.update(1, feedback(JointFeedback56Message, 107, 5, 6))
+        recorder.sample(20 * 10**9)
+        assert recorder.rows == 8
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_record(tmp_path: Path, *, compress: bool) -> None:
+    record(tmp_path / "episode", compress=compress)
+
+    episode = Episode(tmp_path / "episode")
+    assert episode.arms == ("leader", "follower")
+    assert episode.rows == 8
+    assert episode.compressed == compress
+    assert [len(chunk["time"]) for chunk in episode.chunks()] == [3, 3, 2]
+
+    columns = episode.load()
+    assert sorted(columns) == sorted(COLUMNS)
+    assert columns["time"].tolist() == [(i + 10) * 10**9 for i in range(7)] + [
+        20 * 10**9
+    ]
+
+    positions = columns["positions"]
+    assert positions[:, 0, 0].tolist() == [0, 1, 2, 3, 4, 5, 6, 6]
+    assert positions[:, 0, 1].tolist() == [0, -1, -2, -3, -4, -5, -6, -6]
+    assert positions[:, 1, 6].tolist() == [0, 0, 20, 20, 40, 40, 60, 60]
+    assert positions[-1, 1].tolist() == [0, 0, 0, 0, 5, 6, 60]
+
+    # Both arms are aligned on the monotonic clock despite their bus clocks.
+    stamps = columns["stamps"]
+    assert stamps[:, 0].tolist() == [*columns["time"][:7].tolist(), 16 * 10**9]
+    assert stamps[:3, 1].tolist() == [10 * 10**9, 10 * 10**9, 12 * 10**9]
+
+
+def test_memory_map(tmp_path: Path) -> None:
+    record(tmp_path, compress=False)
+    chunk = next(Episode(tmp_path, mmap_mode="r").chunks())
+    assert all(isinstance(chunk[column], np.memmap) for column in COLUMNS)
+
+
+def test_empty_episode(tmp_path: Path) -> None:
+    recorder = EpisodeRecorder(tmp_path, ["arm"])
+    recorder.close()
+    recorder.close()
+
+    columns = Episode(tmp_path).load()
+    assert columns["time"].shape == (0,)
+    assert columns["positions"].shape == (0, 1, 7)
+    assert columns["stamps"].shape == (0, 1)
+
+
+def test_backpressure(tmp_path: Path) -> None:
+    recorder = EpisodeRecorder(tmp_path, ["arm"], chunk_size=1, max_pending=1)
+    os.kill(recorder._writer.pid, signal.SIGSTOP)  # noqa: SLF001
+    threading.Timer(
+        0.3,
+        os.kill,
+        (recorder._writer.pid, signal.SIGCONT),  # noqa: SLF001
+    ).start()
+
+    # Sampling waits for the stopped writer once a chunk is pending.
+    start = time.monotonic()
+    recorder.sample()
+    recorder.sample()
+    assert time.monotonic() - start >= 0.2
+
+    recorder.close()
+    assert Episode(tmp_path).rows == 2
+
+
+def test_writer_exited_while_sampling(tmp_path: Path) -> None:
+    recorder = EpisodeRecorder(tmp_path, ["arm"], chunk_size=1, max_pending=1)
+    recorder._writer.terminate()  # noqa: SLF001
+    recorder._writer.join()  # noqa: SLF001
+
+    recorder.sample()
+    with pytest.raises(RecorderWriterError):
+        recorder.sample()
+
+
+def test_writer_exited_while_closing(tmp_path: Path) -> None:
+    recorder = EpisodeRecorder(tmp_path, ["arm"])
+    recorder._writer.terminate()  # noqa: SLF001
+    recorder._writer.join()  # noqa: SLF001
+
+    with pytest.raises(RecorderWriterError):
+        recorder.close()
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_write_chunks(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, *, compress: bool
+) -> None:
+    # Runs the writer in this process, since coverage does not follow spawned ones.
+    handlers = {}
+    monkeypatch.setattr("piper_kit.recorder.signal.signal", handlers.__setitem__)
+
+    chunks = queue.Queue()
+    chunks.put((0, {"time": np.arange(3)}))
+    chunks.put(None)
+    _write_chunks(chunks, tmp_path, compress=compress)
+    assert handlers == {signal.SIGINT: signal.SIG_IGN}
+
+    if compress:
+        assert np.load(tmp_path / "chunk-000000.npz")["time"].tolist() == [0, 1, 2]
+    else:
+        assert np.load(tmp_path / "chunk-000000" / "time.npy").tolist() == [0, 1, 2]
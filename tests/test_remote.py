@@ -0,0 +1,163 @@
+import socket
+import time
+
+import pytest
+
+from piper_kit.errors import InvalidPacketError
+from piper_kit.remote import (
+    JitterBuffer,
+    StateReceiver,
+    StateSender,
+    decode_state,
+    encode_state,
+)
+
+MS = 10**6
+
+# Send times in the clock of the sender, received 1000 seconds later in the
+# monotonic clock of the receiver.
+OFFSET = 1000 * 10**9
+
+POSITIONS = [
+    (0, 0, 0, 0, 0, 0, 0),
+    (1000, -1000, 2000, -2000, 3000, -3000, 4000),
+    (2000, -2000, 4000, -4000, 6000, -6000, 8000),
+]
+
+
+def test_encode_decode_state() -> None:
+    packet = encode_state(7, 123456789, POSITIONS[1])
+    assert len(packet) == 44
+    assert decode_state(packet) == (7, 123456789, POSITIONS[1])
+
+
+@pytest.mark.parametrize(
+    "packet",
+    [
+        encode_state(0, 0, POSITIONS[0])[:-1],
+        encode_state(0, 0, POSITIONS[0]) + b"\x00",
+        b"XX" + encode_state(0, 0, POSITIONS[0])[2:],
+        b"PK\x02" + encode_state(0, 0, POSITIONS[0])[3:],
+    ],
+)
+def test_decode_invalid_state(packet: bytes) -> None:
+    with pytest.raises(InvalidPacketError):
+        decode_state(packet)
+
+
+def test_jitter_buffer_interpolate() -> None:
+    buffer = JitterBuffer(min_delay=0.005)
+    assert buffer.sample(OFFSET) is None
+
+    for i, positions in enumerate(POSITIONS):
+        assert buffer.push(i, i * 10 * MS, positions, OFFSET + i * 10 * MS)
+
+    assert buffer.jitter == 0
+    assert buffer.delay == 0.005
+
+    # Positions are played back 5 ms late, holding the first and last packets.
+    assert buffer.sample(OFFSET) == POSITIONS[0]
+    assert buffer.sample(OFFSET + 10 * MS) == (
+        500,
+        -500,
+        1000,
+        -1000,
+        1500,
+        -1500,
+        2000,
+    )
+    assert buffer.sample(OFFSET + 15 * MS) == POSITIONS[1]
+    assert buffer.sample(OFFSET + 20 * MS) == (
+        1500,
+        -1500,
+        3000,
+        -3000,
+        4500,
+        -4500,
+        6000,
+    )
+    assert buffer.sample(OFFSET + 100 * MS) == POSITIONS[2]
+
+
+def test_jitter_buffer_drop_late() -> None:
+    buffer = JitterBuffer()
+    assert buffer.push(0, 0, POSITIONS[0], OFFSET)
+
+    # Duplicate and older packets are late.
+    assert not buffer.push(0, 0, POSITIONS[0], OFFSET)
+    assert not buffer.push(2**32 - 1, 0, POSITIONS[0], OFFSET)
+
+    # Skipped packets are lost.
+    assert buffer.push(3, 30 * MS, POSITIONS[1], OFFSET + 30 * MS)
+    assert (buffer.received, buffer.lost, buffer.late) == (4, 2, 2)
+
+    # A packet arriving after its time was played back is late.
+    assert buffer.sample(OFFSET + 100 * MS) == POSITIONS[1]
+    assert not buffer.push(4, 40 * MS, POSITIONS[2], OFFSET + 200 * MS)
+    assert buffer.sample(OFFSET + 200 * MS) == POSITIONS[1]
+    assert (buffer.received, buffer.lost, buffer.late) == (5, 2, 3)
+
+
+def test_jitter_buffer_wrap_sequence() -> None:
+    buffer = JitterBuffer()
+    assert buffer.push(2**32 - 1, 0, POSITIONS[0], OFFSET)
+    assert buffer.push(1, 10 * MS, POSITIONS[1], OFFSET + 10 * MS)
+    assert (buffer.lost, buffer.late) == (1, 0)
+
+
+def test_jitter_buffer_adapt_delay() -> None:
+    buffer = JitterBuffer(min_delay=0.001, max_delay=0.05)
+    for i, delay in enumerate([0, 4, 0, 4, 0, 4, 0, 4]):
+        buffer.push(i, i * 10 * MS, POSITIONS[0], OFFSET + (i * 10 + delay) * MS)
+
+    assert 0.001 < buffer.jitter < 0.004
+    assert buffer.delay == pytest.approx(3 * buffer.jitter)
+
+    buffer.jitter_factor = 100
+    assert buffer.delay == 0.05
+
+
+def test_jitter_buffer_default_clock() -> None:
+    now = OFFSET
+    buffer = JitterBuffer(min_delay=0.005, clock=lambda: now)
+    buffer.push(0, 0, POSITIONS[0])
+    now += 10 * MS
+    buffer.push(1, 10 * MS, POSITIONS[1])
+    now += 5 * MS
+    assert buffer.sample() == POSITIONS[1]
+
+
+def test_send_receive() -> None:
+    with (
+        StateReceiver(("127.0.0.1", 0)) as receiver,
+        StateSender(receiver.address) as sender,
+    ):
+        assert receiver.fileno() >= 0
+        assert receiver.poll() == 0
+        assert receiver.sample() is None
+
+        for positions in POSITIONS:
+            sender.send(positions)
+        assert sender.sequence == 3
+
+        assert receiver.poll(timeout=1.0) == 3
+        assert receiver.latency.count == 3
+        assert receiver.latency.min >= receiver.buffer.delay
+
+        time.sleep(0.01)
+        assert receiver.sample() == POSITIONS[2]
+
+
+def test_receive_invalid_and_late() -> None:
+    with (
+        StateReceiver(("127.0.0.1", 0)) as receiver,
+        socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sender,
+    ):
+        packet = encode_state(0, time.time_ns(), POSITIONS[0])
+        for data in [b"invalid", packet, packet]:
+            sender.sendto(data, receiver.address)
+
+        assert receiver.poll(timeout=1.0) == 1
+        assert receiver.invalid == 1
+        assert receiver.buffer.late == 1
+        assert receiver.latency.count == 1
@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+
+from piper_kit.errors import SafetyViolationError
+from piper_kit.safety import JOINT_LIMITS, SafetyEnvelope
+
+
+class TestSafetyEnvelope:
+    def test_joint_limits(self) -> None:
+        safety = SafetyEnvelope()
+        safety.check_joints(0, [low for low, _ in JOINT_LIMITS])
+        safety.check_joints(0, [high for _, high in JOINT_LIMITS])
+        safety.check_joints(4, (70_000, -120_000))
+
+        with pytest.raises(SafetyViolationError, match="joint 3 position 1"):
+            safety.check_joints(2, (1, 0))
+
+    def test_joint_step(self) -> None:
+        safety = SafetyEnvelope(max_joint_step=1000)
+        safety.record_joints(0, (0, 0))
+        safety.check_joints(0, (1000, 1000))
+        safety.record_joints(0, (1000, 1000))
+
+        with pytest.raises(SafetyViolationError, match="joint 2 step 1001"):
+            safety.check_joints(0, (1500, 2001))
+
+        # Checked positions are not remembered until they are recorded.
+        safety.check_joints(0, (2000, 2000))
+        with pytest.raises(SafetyViolationError, match="joint 1 step -1001"):
+            safety.check_joints(0, (-1,))
+
+        # The step is only limited once a joint has been recorded.
+        safety.check_joints(2, (-50_000, 50_000))
+
+        safety.reset()
+        safety.check_joints(0, (100_000, 100_000))
+
+    def test_workspace(self) -> None:
+        safety = SafetyEnvelope(
+            workspace=[(0, 100), (-100, 100), (0, 200)], max_position_step=50
+        )
+        safety.check_positions(0, (100, -100, 0))
+        safety.record_positions(0, (100, -100, 0))
+        safety.check_positions(2, (50,))
+        safety.record_positions(2, (50,))
+
+        with pytest.raises(SafetyViolationError, match="y position 101"):
+            safety.check_positions(1, (101,))
+        with pytest.raises(SafetyViolationError, match="z step 51"):
+            safety.check_positions(2, (101,))
+
+    def test_unbounded_workspace(self) -> None:
+        safety = SafetyEnvelope()
+        safety.check_positions(0, (-(10**9), 10**9, 0))
+
+    def test_gripper_range(self) -> None:
+        SafetyEnvelope().check_gripper(10**9)
+
+        safety = SafetyEnvelope(gripper_range=(0, 70_000))
+        safety.check_gripper(70_000)
+        with pytest.raises(SafetyViolationError, match="gripper position -1"):
+            safety.check_gripper(-1)
+
+    def test_validate_joint_trajectory(self) -> None:
+        safety = SafetyEnvelope(max_joint_step=1000, gripper_range=(0, 70_000))
+        joints = np.zeros((100, 6), dtype=int)
+        joints[:, 0] = np.arange(100) * 1000
+        grippers = np.full(100, 50_000)
+        safety.validate_joint_trajectory(joints, grippers)
+        safety.validate_joint_trajectory(joints.tolist())
+
+        joints[40, 0] += 1
+        with pytest.raises(SafetyViolationError, match="row 40"):
+            safety.validate_joint_trajectory(joints)
+
+        joints[40, 0] -= 1
+        joints[70, 2] = 1
+        with pytest.raises(SafetyViolationError, match="row 70"):
+            SafetyEnvelope().validate_joint_trajectory(joints)
+
+        grippers[20] = 80_000
+        with pytest.raises(SafetyViolationError, match="row 20"):
+            safety.validate_joint_trajectory(joints, grippers)
@@ -0,0 +1,85 @@
+from collections.abc import Iterator
+
+import can
+import pytest
+
+from piper_kit import Piper
+from piper_kit.kinematics import forward_kinematics
+from piper_kit.messages import (
+    GripperFeedbackMessage,
+    JointFeedback12Message,
+    JointFeedback34Message,
+    JointFeedback56Message,
+    MotorInfoBMessage,
+)
+from piper_kit.state import ArmState, ArmStateTracker
+
+
+def test_arm_state() -> None:
+    state = ArmState()
+    assert state.joints == (0,) * 6
+    assert state.gripper == 0
+    assert state.status == (0,) * 7
+    assert state.timestamp == 0.0
+    assert state.sequence == 0
+
+    with pytest.raises(AttributeError):
+        state.gripper = 1
+    with pytest.raises(AttributeError):
+        del state.gripper
+    with pytest.raises(AttributeError):
+        state.other = 1
+
+    next_state = state.replace(gripper=1000, timestamp=1.5)
+    assert repr(next_state) == (
+        "ArmState(joints=(0, 0, 0, 0, 0, 0), gripper=1000, "
+        "status=(0, 0, 0, 0, 0, 0, 0), timestamp=1.5, sequence=1)"
+    )
+    assert state.gripper == 0
+
+
+def test_arm_state_end_pose() -> None:
+    joints = (10000, 20000, -30000, 0, 15000, 0)
+    pose = forward_kinematics(list(joints)).round().astype(int).tolist()
+    assert ArmState(joints=joints).end_pose == pose
+
+
+@pytest.fixture
+def arm() -> Iterator[can.BusABC]:
+    with can.Bus(interface="virtual", channel="state") as bus:
+        yield bus
+
+
+def send(arm: can.BusABC, arbitration_id: int, *data: int) -> None:
+    arm.send(can.Message(arbitration_id=arbitration_id, data=data))
+
+
+def test_arm_state_tracker(arm: can.BusABC) -> None:
+    with Piper("virtual://state") as piper:
+        tracker = ArmStateTracker(piper)
+
+        send(arm, JointFeedback12Message.ID, 0, 0, 0, 1, 0, 0, 0, 2)
+        send(arm, JointFeedback34Message.ID, 0, 0, 0, 3, 0, 0, 0, 4)
+        for _ in range(2):
+            piper.read_message()
+
+        # The joints are only published once a whole cycle has arrived.
+        assert tracker.state.sequence == 0
+
+        send(arm, JointFeedback56Message.ID, 0, 0, 0, 5, 0, 0, 0, 6)
+        send(arm, GripperFeedbackMessage.ID, 0, 0, 0, 7, 0, 0, 0x40, 0)
+        send(arm, MotorInfoBMessage.ID2, 0, 0, 0, 0, 0, 0x40, 0, 0)
+        for _ in range(3):
+            piper.read_message()
+
+        state = tracker.state
+        assert state.joints == (1, 2, 3, 4, 5, 6)
+        assert state.gripper == 7
+        assert state.status == (0, 0x40, 0, 0, 0, 0, 0x40)
+        assert state.sequence == 3
+        assert state.timestamp > 0
+
+        tracker.close()
+        send(arm, GripperFeedbackMessage.ID, 0, 0, 0, 8, 0, 0, 0, 0)
+        piper.read_message()
+        assert tracker.state is state
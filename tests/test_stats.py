@@ -0,0 +1,26 @@
+import math
+
+import pytest
+
+from piper_kit.stats import RunningStats
+
+
+def test_empty() -> None:
+    stats = RunningStats()
+    assert stats.count == 0
+    assert stats.mean == 0.0
+    assert stats.std == 0.0
+    assert stats.min == math.inf
+    assert stats.max == -math.inf
+
+
+def test_update() -> None:
+    stats = RunningStats()
+    for value in (2, 4, 4, 4, 5, 5, 7, 9):
+        stats.update(value)
+
+    assert stats.count == 8
+    assert stats.mean == pytest.approx(5.0)
+    assert stats.std == pytest.approx(2.0)
+    assert stats.min == 2
+    assert stats.max == 9
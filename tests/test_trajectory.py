@@ -0,0 +1,344 @@
+import math
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from piper_kit.errors import InvalidTrajectoryRowError
+from piper_kit.trajectory import (
+    SyncPlayer,
+    TrackingGovernor,
+    TrajectoryPlayer,
+    TrajectoryStream,
+    Waypoint,
+    format_waypoint,
+    parse_waypoint,
+    simplify_waypoints,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def write_trajectory(path: Path, rows: int, duration: float = 1.0) -> Path:
+    with path.open("w") as file:
+        for i in range(rows):
+            file.write(f"{duration},{i},{i},{i},{i},{i},{i},{i * 10}\n")
+            if i == 1:
+                file.write("\n")
+    return path
+
+
+def test_parse_waypoint() -> None:
+    waypoint = parse_waypoint("0.5,1,2,3,4,5,6,7\n")
+    assert waypoint.duration == 0.5
+    assert waypoint.joints == (1, 2, 3, 4, 5, 6)
+    assert waypoint.gripper == 7
+
+
+@pytest.mark.parametrize("line", ["0.5,1,2,3", "0.5,1,2,3,4,5,6,x"])
+def test_parse_invalid_waypoint(line: str) -> None:
+    with pytest.raises(InvalidTrajectoryRowError):
+        parse_waypoint(line)
+
+
+def test_parse_multi_arm_waypoint() -> None:
+    line = "0.5,1,2,3,4,5,6,7,11,12,13,14,15,16,17"
+    waypoint = parse_waypoint(line, 1)
+    assert waypoint.duration == 0.5
+    assert waypoint.joints == (11, 12, 13, 14, 15, 16)
+    assert waypoint.gripper == 17
+
+    assert parse_waypoint(line, 0).gripper == 7
+    assert parse_waypoint("0.5,1,2,3,4,5,6,7", 0).gripper == 7
+
+    for arm, invalid in [(None, line), (2, line), (0, "0.5,1,2,3,4,5,6,7,8")]:
+        with pytest.raises(InvalidTrajectoryRowError):
+            parse_waypoint(invalid, arm)
+
+
+def test_format_waypoint() -> None:
+    waypoint = Waypoint(0.25, (1.0, 2, 3, 4, 5, 6), 7.5)
+    assert format_waypoint(waypoint) == "0.25,1,2,3,4,5,6,7.5"
+
+    parsed = parse_waypoint(format_waypoint(waypoint))
+    assert parsed.duration == waypoint.duration
+    assert parsed.joints == waypoint.joints
+    assert parsed.gripper == waypoint.gripper
+
+
+def interpolate(waypoints: list[Waypoint], times: np.ndarray) -> np.ndarray:
+    waypoint_times = np.cumsum([w.duration for w in waypoints])
+    positions = np.array([(*w.joints, w.gripper) for w in waypoints])
+    return np.stack(
+        [np.interp(times, waypoint_times, column) for column in positions.T], axis=1
+    )
+
+
+class TestSimplifyWaypoints:
+    def test_short(self) -> None:
+        waypoints = [Waypoint(1.0, (0,) * 6, 0), Waypoint(1.0, (1,) * 6, 1)]
+        assert simplify_waypoints(waypoints, 10) == waypoints
+
+    def test_straight_line(self) -> None:
+        waypoints = [Waypoint(0.01, (i,) * 6, i * 2) for i in range(100)]
+        simplified = simplify_waypoints(waypoints, 1)
+
+        assert [w.gripper for w in simplified] == [0, 198]
+        assert [w.duration for w in simplified] == pytest.approx([0.01, 0.99])
+
+    def test_within_tolerance(self) -> None:
+        waypoints = [
+            Waypoint(
+                0.005,
+                tuple(10000 * math.sin(i * 0.01 + j) for j in range(6)),
+                5000 * math.cos(i * 0.02),
+            )
+            for i in range(2000)
+        ]
+        simplified = simplify_waypoints(waypoints, 50)
+        assert len(simplified) < len(waypoints) / 10
+
+        times = np.linspace(0.005, 10, 10000)
+        error = interpolate(simplified, times) - interpolate(waypoints, times)
+        assert np.abs(error).max() <= 50
+
+    def test_pause(self) -> None:
+        waypoints = [
+            Waypoint(1.0, (0,) * 6, 0),
+            Waypoint(1.0, (100,) * 6, 0),
+            Waypoint(2.0, (100,) * 6, 0),
+            Waypoint(0.0, (0,) * 6, 0),
+        ]
+        simplified = simplify_waypoints(waypoints, 1)
+        assert [w.joints[0] for w in simplified] == [0, 100, 100, 0]
+
+
+class TestTrajectoryStream:
+    def test_iterate(self, tmp_path: Path) -> None:
+        path = write_trajectory(tmp_path / "trajectory.csv", 100)
+        with TrajectoryStream(path, chunk_size=8, prefetch=2) as stream:
+            waypoints = list(stream)
+            assert stream.time == 100.0
+
+        assert [w.gripper for w in waypoints] == [i * 10 for i in range(100)]
+
+    def test_empty(self, tmp_path: Path) -> None:
+        path = tmp_path / "trajectory.csv"
+        path.write_text("")
+        with TrajectoryStream(path) as stream:
+            assert list(stream) == []
+            assert list(stream) == []
+
+    def test_exact_chunks(self, tmp_path: Path) -> None:
+        path = write_trajectory(tmp_path / "trajectory.csv", 16)
+        with TrajectoryStream(path, chunk_size=8) as stream:
+            assert len(list(stream)) == 16
+
+    def test_invalid_row(self, tmp_path: Path) -> None:
+        path = tmp_path / "trajectory.csv"
+        path.write_text("1,0,0,0,0,0,0,0\n1,invalid\n")
+        with (
+            TrajectoryStream(path, chunk_size=1) as stream,
+            pytest.raises(InvalidTrajectoryRowError),
+        ):
+            list(stream)
+
+    def test_arm(self, tmp_path: Path) -> None:
+        path = tmp_path / "trajectory.csv"
+        path.write_text(
+            "1,0,0,0,0,0,0,1,0,0,0,0,0,0,2\n1,0,0,0,0,0,0,3,0,0,0,0,0,0,4\n"
+        )
+        with TrajectoryStream(path, arm=1) as stream:
+            assert [w.gripper for w in stream] == [2, 4]
+
+    def test_missing_file(self, tmp_path: Path) -> None:
+        with pytest.raises(FileNotFoundError):
+            TrajectoryStream(tmp_path / "missing.csv")
+
+    def test_seek(self, tmp_path: Path) -> None:
+        path = write_trajectory(tmp_path / "trajectory.csv", 100)
+        with TrajectoryStream(
+            path, chunk_size=4, prefetch=1, index_interval=10
+        ) as stream:
+            stream.seek(42.5)
+            assert stream.time == 42.0
+            assert next(stream).gripper == 420
+
+            # Seeking backward resumes from the sparse index.
+            stream.seek(3.0)
+            assert next(stream).gripper == 20
+            assert stream.time == 3.0
+
+            stream.seek(95.0)
+            assert next(stream).gripper == 940
+
+            stream.seek(0.0)
+            assert next(stream).gripper == 0
+
+    def test_seek_past_end(self, tmp_path: Path) -> None:
+        path = write_trajectory(tmp_path / "trajectory.csv", 10)
+        with TrajectoryStream(path, chunk_size=4) as stream:
+            stream.seek(20.0)
+            assert stream.time == 10.0
+            assert next(stream, None) is None
+
+
+class TestTrajectoryPlayer:
+    def test_play(self, tmp_path: Path) -> None:
+        path = write_trajectory(tmp_path / "trajectory.csv", 3)
+        clock = FakeClock()
+        with TrajectoryStream(path) as stream:
+            player = TrajectoryPlayer(stream, [-10] * 6, -100, clock=clock)
+            assert player.sample() == ([-10] * 6, -100)
+
+            clock.now = 0.5
+            assert player.sample() == ([-5] * 6, -50)
+            assert player.time == 0.5
+
+            clock.now = 1.5
+            assert player.sample() == ([0.5] * 6, 5)
+            assert not player.finished
+
+            clock.now = 10.0
+            assert player.sample() == ([2] * 6, 20)
+            assert player.finished
+
+    def test_speed_and_pause(self, tmp_path: Path) -> None:
+        path = write_trajectory(tmp_path / "trajectory.csv", 10)
+        clock = FakeClock()
+        with TrajectoryStream(path) as stream:
+            player = TrajectoryPlayer(stream, [0] * 6, 0, speed=2.0, clock=clock)
+            assert player.speed == 2.0
+
+            clock.now = 1.0
+            assert player.time == 2.0
+
+            player.speed = 0.5
+            clock.now = 2.0
+            assert player.time == 2.5
+
+            player.pause()
+            assert player.paused
+            clock.now = 10.0
+            assert player.time == 2.5
+
+            player.resume()
+            assert not player.paused
+            clock.now = 12.0
+            assert player.time == 3.5
+            assert player.sample() == ([2.5] * 6, 25)
+
+    def test_scale(self, tmp_path: Path) -> None:
+        path = write_trajectory(tmp_path / "trajectory.csv", 10)
+        clock = FakeClock()
+        with TrajectoryStream(path) as stream:
+            player = TrajectoryPlayer(stream, [0] * 6, 0, speed=2.0, clock=clock)
+            assert player.scale == 1.0
+
+            player.scale = 0.25
+            clock.now = 2.0
+            assert player.time == 1.0
+            assert player.speed == 2.0
+
+    def test_seek(self, tmp_path: Path) -> None:
+        path = write_trajectory(tmp_path / "trajectory.csv", 10)
+        clock = FakeClock()
+        with TrajectoryStream(path) as stream:
+            player = TrajectoryPlayer(stream, [0] * 6, 0, clock=clock)
+
+            clock.now = 1.0
+            player.seek(5.5)
+            assert player.time == 5.5
+            assert player.sample() == ([0] * 6, 0)
+
+            # Moves from the previous position to the next waypoint.
+            clock.now = 1.25
+            assert player.sample() == ([2.5] * 6, 25)
+
+    def test_loop(self, tmp_path: Path) -> None:
+        path = write_trajectory(tmp_path / "trajectory.csv", 3)
+        clock = FakeClock()
+        with TrajectoryStream(path) as stream:
+            player = TrajectoryPlayer(stream, [0] * 6, 0, loop=True, clock=clock)
+
+            clock.now = 3.5
+            assert player.sample() == ([1] * 6, 10)
+            assert player.time == 0.5
+            assert not player.finished
+
+    def test_loop_empty(self, tmp_path: Path) -> None:
+        path = tmp_path / "trajectory.csv"
+        path.write_text("")
+        with TrajectoryStream(path) as stream:
+            player = TrajectoryPlayer(stream, [1] * 6, 2, loop=True)
+            assert player.finished
+            assert player.sample() == ([1] * 6, 2)
+
+    def test_zero_duration(self, tmp_path: Path) -> None:
+        path = tmp_path / "trajectory.csv"
+        path.write_text("0,1,1,1,1,1,1,1\n")
+        with TrajectoryStream(path) as stream:
+            player = TrajectoryPlayer(stream, [0] * 6, 0, clock=FakeClock())
+            assert player.sample() == ([1] * 6, 1)
+            assert player.finished
+
+
+class TestSyncPlayer:
+    def test_play(self, tmp_path: Path) -> None:
+        first = write_trajectory(tmp_path / "first.csv", 3)
+        second = write_trajectory(tmp_path / "second.csv", 5, duration=0.5)
+        clock = FakeClock()
+        with TrajectoryStream(first) as a, TrajectoryStream(second) as b:
+            player = SyncPlayer(
+                [a, b], [([-10] * 6, -100), ([-2] * 6, -20)], speed=2.0, clock=clock
+            )
+            assert player.speed == 2.0
+
+            clock.now = 0.25
+            assert player.time == 0.5
+            assert player.sample() == [([-5] * 6, -50), ([0] * 6, 0)]
+
+            player.speed = 1.0
+            player.scale = 0.5
+            assert player.scale == 0.5
+            clock.now = 0.75
+            assert player.time == 0.75
+
+            player.scale = 1.0
+            player.pause()
+            assert player.paused
+            clock.now = 5.0
+            assert player.time == 0.75
+
+            player.resume()
+            assert not player.paused
+            player.seek(1.5)
+            clock.now = 5.25
+            assert player.sample() == [([-0.75] * 6, -7.5), ([2.5] * 6, 25)]
+            assert not player.finished
+
+            clock.now = 10.0
+            assert player.sample() == [([2] * 6, 20), ([4] * 6, 40)]
+            assert player.finished
+
+
+class TestTrackingGovernor:
+    def test_within_threshold(self) -> None:
+        governor = TrackingGovernor(1000)
+        assert governor.update([0] * 6, [1000, -1000, None, 0, 0, 0]) == 1.0
+        assert governor.errors[0].mean == -1000
+        assert governor.errors[1].mean == 1000
+        assert governor.errors[2].count == 0
+
+    def test_slow_down(self) -> None:
+        governor = TrackingGovernor(1000, min_scale=0.2)
+        assert governor.update([4000, 0, 0, 0, 0, 0], [0] * 6) == 0.25
+        assert governor.update([0, 0, 0, 0, 0, 0], [0, 10000, 0, 0, 0, 0]) == 0.2
+        assert governor.errors[0].max == 4000
+        assert governor.errors[1].min == -10000
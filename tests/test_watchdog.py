@@ -0,0 +1,44 @@
+import pytest
+
+from piper_kit.watchdog import JOINT_FEEDBACK_IDS, FeedbackWatchdog
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_feedback_watchdog() -> None:
+    clock = FakeClock()
+    watchdog = FeedbackWatchdog(1.0, clock=clock)
+    assert watchdog.remaining() == 1.0
+    assert watchdog.check() is None
+
+    clock.now = 0.5
+    watchdog.feed(JOINT_FEEDBACK_IDS[0])
+    watchdog.feed(JOINT_FEEDBACK_IDS[1])
+    watchdog.feed(0x123)
+    assert watchdog.remaining() == 0.5
+    assert watchdog.check(0.9) is None
+
+    # The ID that arrived the longest ago is reported first and then rearmed.
+    assert watchdog.check(1.0) == JOINT_FEEDBACK_IDS[2]
+    assert watchdog.check(1.0) is None
+    assert watchdog.remaining(1.0) == pytest.approx(0.5)
+    assert watchdog.check(1.5) == JOINT_FEEDBACK_IDS[0]
+    assert watchdog.check(1.5) == JOINT_FEEDBACK_IDS[1]
+    assert watchdog.remaining(3.0) == 0.0
+
+    clock.now = 3.0
+    watchdog.reset()
+    assert watchdog.remaining() == 1.0
+
+
+def test_feedback_watchdog_without_ids() -> None:
+    watchdog = FeedbackWatchdog(1.0, ())
+    watchdog.feed(JOINT_FEEDBACK_IDS[0])
+    assert watchdog.remaining() is None
+    assert watchdog.check() is None
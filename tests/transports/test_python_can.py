@@ -0,0 +1,31 @@
+import can
+
+from piper_kit.messages import JointControl12Message
+from piper_kit.transports.python_can import PythonCanTransport
+
+
+def test_python_can_transport() -> None:
+    transport = PythonCanTransport("virtual", "test_python_can_transport")
+    assert transport.fileno() == -1
+
+    with can.Bus(interface="virtual", channel="test_python_can_transport") as peer:
+        transport.send(JointControl12Message(1000, -2000))
+        msg = peer.recv(1.0)
+        assert msg.arbitration_id == JointControl12Message.ID
+        assert list(msg.data) == [0x00, 0x00, 0x03, 0xE8, 0xFF, 0xFF, 0xF8, 0x30]
+
+        peer.send(can.Message(arbitration_id=0x123, data=[0x01, 0x02]))
+        frame = transport.recv(1.0)
+        assert frame.arbitration_id == 0x123
+        assert frame.data == bytearray([0x01, 0x02])
+
+        assert transport.recv(0.01) is None
+
+    transport.close()
+
+
+def test_python_can_transport_fileno() -> None:
+    transport = PythonCanTransport("virtual", "test_python_can_transport_fileno")
+    transport.bus.fileno = lambda: 3
+    assert transport.fileno() == 3
+    transport.close()
@@ -0,0 +1,160 @@
+import errno
+import threading
+import time
+
+import can
+import pytest
+
+from piper_kit.messages import (
+    EnableJointMessage,
+    JointConfigMessage,
+    JointControl12Message,
+    JointControl34Message,
+)
+from piper_kit.metrics import Metrics
+from piper_kit.transports import QueuedTransport, Transport, queued
+
+
+class FakeTransport(Transport):
+    def __init__(self) -> None:
+        self.sent = []
+        self.errors = []
+        self.blocked = threading.Event()
+        self.blocked.set()
+        self.closed = False
+
+    def send(self, msg: can.Message) -> None:
+        self.blocked.wait()
+        if self.errors:
+            raise self.errors.pop(0)
+        self.sent.append(msg)
+
+    def recv(self, timeout: float | None = None) -> str:
+        return f"frame {timeout}"
+
+    def fileno(self) -> int:
+        return 42
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def test_queued_transport_delegates() -> None:
+    inner = FakeTransport()
+    transport = QueuedTransport(inner)
+    assert transport.recv(0.5) == "frame 0.5"
+    assert transport.fileno() == 42
+
+    transport.close()
+    assert inner.closed
+
+
+def test_queued_transport_priorities() -> None:
+    inner = FakeTransport()
+    transport = QueuedTransport(inner)
+
+    # Hold the first frame in the transport while the others are queued.
+    inner.blocked.clear()
+    first = JointControl12Message(0, 0)
+    transport.send(first)
+    time.sleep(0.01)
+
+    setpoints = [JointControl12Message(i, i) for i in range(1, 4)]
+    joints = JointControl34Message(1, 1)
+    config = JointConfigMessage(1, clear_error=True)
+    disable = EnableJointMessage(7, enable=False)
+    for msg in (setpoints[0], joints, config, setpoints[1], disable, setpoints[2]):
+        transport.send(msg)
+
+    inner.blocked.set()
+    assert transport.flush(1.0)
+    assert inner.sent == [first, disable, config, setpoints[2], joints]
+    transport.close()
+
+
+def test_queued_transport_rate_limit() -> None:
+    inner = FakeTransport()
+    transport = QueuedTransport(inner, rate=100, burst=2)
+
+    configs = [JointConfigMessage(1) for _ in range(4)]
+    start = time.monotonic()
+    for msg in configs:
+        transport.send(msg)
+    enable = EnableJointMessage(7)
+    transport.send(enable)
+
+    # The safety frame skips the rate limit, so it does not wait for the others.
+    assert transport.flush(1.0)
+    assert time.monotonic() - start >= 0.019
+    assert inner.sent.index(enable) < 3
+    assert inner.sent[3:] == configs[2:]
+    transport.close()
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        OSError(errno.ENOBUFS, "No buffer space available"),
+        can.CanOperationError("Failed to transmit", error_code=errno.ENOBUFS),
+    ],
+)
+def test_queued_transport_buffer_full(error: Exception) -> None:
+    inner = FakeTransport()
+    inner.errors = [error] * 3
+    transport = QueuedTransport(inner)
+
+    msg = JointControl12Message(1, 2)
+    transport.send(msg)
+    assert transport.flush(1.0)
+    assert inner.sent == [msg]
+    transport.close()
+
+
+def test_queued_transport_error() -> None:
+    inner = FakeTransport()
+    error = OSError(errno.ENETDOWN, "Network is down")
+    inner.errors = [error]
+    transport = QueuedTransport(inner)
+
+    transport.send(JointControl12Message(1, 2))
+    assert transport.flush(1.0)
+    assert inner.sent == []
+
+    with pytest.raises(OSError, match="Network is down"):
+        transport.send(JointControl12Message(1, 2))
+
+    msg = JointControl12Message(3, 4)
+    transport.send(msg)
+    transport.close()
+    assert inner.sent == [msg]
+
+
+def test_queued_transport_close_timeout(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(queued, "_CLOSE_TIMEOUT", 0.05)
+    inner = FakeTransport()
+    inner.errors = [OSError(errno.ENOBUFS, "No buffer space available")] * 1000
+    transport = QueuedTransport(inner)
+
+    transport.send(JointControl12Message(1, 2))
+    assert not transport.flush(0.01)
+    transport.close()
+    assert inner.sent == []
+    assert inner.closed
+
+
+def test_queued_transport_metrics() -> None:
+    inner = FakeTransport()
+    inner.errors = [OSError(errno.ENETDOWN, "Network is down")]
+    metrics = Metrics()
+    transport = QueuedTransport(inner, metrics=metrics)
+
+    inner.blocked.clear()
+    transport.send(JointControl12Message(1, 2))
+    transport.send(JointControl34Message(3, 4))
+    assert metrics.queue_depths == {"transmit": 2}
+
+    inner.blocked.set()
+    assert transport.flush(1.0)
+    assert metrics.queue_depths == {"transmit": 0}
+    assert metrics.send_failures == {JointControl12Message.ID: 1}
+    transport.close()
@@ -0,0 +1,146 @@
+import socket
+import struct
+import threading
+import time
+from collections.abc import Iterator
+
+import pytest
+
+from piper_kit.errors import InvalidTimestampingError
+from piper_kit.messages import JointControl12Message, JointFeedback12Message
+from piper_kit.transports import raw
+from piper_kit.transports.raw import RawCanTransport
+
+
+class FakeCanSocket(socket.socket):
+    def bind(self, address: tuple[str]) -> None:
+        self.address = address
+
+
+@pytest.fixture
+def peer(monkeypatch: pytest.MonkeyPatch) -> Iterator[socket.socket]:
+    local, remote = socket.socketpair(socket.AF_UNIX, socket.SOCK_SEQPACKET)
+
+    def fake_socket(*_args: int) -> FakeCanSocket:
+        return FakeCanSocket(
+            socket.AF_UNIX, socket.SOCK_SEQPACKET, fileno=local.detach()
+        )
+
+    monkeypatch.setattr(raw.socket, "socket", fake_socket)
+    with remote:
+        yield remote
+
+
+def test_raw_can_transport_bind(peer: socket.socket) -> None:  # noqa: ARG001
+    bus = RawCanTransport("vcan0")
+    assert bus._sock.address == ("vcan0",)  # noqa: SLF001
+    assert bus.fileno() >= 0
+    bus.close()
+    assert bus._sock.fileno() == -1  # noqa: SLF001
+
+
+def test_raw_can_transport_send(peer: socket.socket) -> None:
+    bus = RawCanTransport("vcan0")
+    bus.send(JointControl12Message(1000, -2000))
+    assert peer.recv(32) == JointControl12Message(1000, -2000).frame
+    bus.close()
+
+
+def test_raw_can_transport_send_threads(peer: socket.socket) -> None:
+    bus = RawCanTransport("vcan0")
+    messages = [JointControl12Message(i, -i) for i in range(4)]
+
+    def send(msg: JointControl12Message) -> None:
+        for _ in range(50):
+            bus.send(msg)
+
+    threads = [threading.Thread(target=send, args=(msg,)) for msg in messages]
+    for thread in threads:
+        thread.start()
+
+    # Every frame is one of the messages, never a mix of two of them.
+    frames = {msg.frame for msg in messages}
+    for _ in range(len(messages) * 50):
+        assert peer.recv(32) in frames
+
+    for thread in threads:
+        thread.join()
+    bus.close()
+
+
+def test_raw_can_transport_recv(peer: socket.socket) -> None:
+    bus = RawCanTransport("vcan0")
+
+    can_id = JointFeedback12Message.ID | socket.CAN_EFF_FLAG
+    data = bytes([0x12, 0x34, 0x56, 0x78, 0x9A, 0xBC, 0xDE, 0xF0])
+    peer.send(struct.pack("=IB3x8s", can_id, 8, data))
+
+    frame = bus.recv()
+    assert frame.arbitration_id == JointFeedback12Message.ID
+    assert frame.data == data
+    assert frame.timestamp > 0
+
+    feedback = JointFeedback12Message(frame)
+    assert feedback.joint_1 == 305419896
+    assert feedback.joint_2 == -1698898192
+
+    peer.send(struct.pack("=IB3x8s", 0x123, 2, b"\x01\x02"))
+    assert bus.recv(1.0) is frame
+    assert frame.arbitration_id == 0x123
+    assert frame.data == b"\x01\x02"
+
+    assert bus.recv(0.01) is None
+    assert bus.recv(0) is None
+    bus.close()
+
+
+def test_raw_can_transport_kernel_timestamps(peer: socket.socket) -> None:
+    bus = RawCanTransport("vcan0", timestamping="kernel")
+    before = time.time()
+    peer.send(struct.pack("=IB3x8s", 0x123, 2, b"\x01\x02"))
+
+    frame = bus.recv(1.0)
+    assert frame.data == b"\x01\x02"
+    assert before - 0.01 <= frame.timestamp <= time.time()
+
+    assert bus.recv(0.01) is None
+    bus.close()
+
+
+def test_raw_can_transport_hardware_timestamps(
+    monkeypatch: pytest.MonkeyPatch, peer: socket.socket
+) -> None:
+    # Unix sockets do not support hardware timestamping, so fake its messages.
+    ancillaries = iter(
+        [
+            [(socket.SOL_SOCKET, 37, struct.pack("@6l", 5, 0, 0, 0, 12, 500_000_000))],
+            [(socket.SOL_SOCKET, 37, struct.pack("@6l", 5, 250_000_000, 0, 0, 0, 0))],
+            [(socket.SOL_SOCKET + 1, 37, b""), (socket.SOL_SOCKET, 0, b"")],
+        ]
+    )
+
+    def recvmsg_into(
+        sock: socket.socket, buffers: list[bytearray], ancillary_size: int
+    ) -> tuple[int, list[tuple[int, int, bytes]], int, None]:
+        assert ancillary_size == socket.CMSG_SPACE(48)
+        return sock.recv_into(buffers[0]), next(ancillaries), 0, None
+
+    monkeypatch.setattr(FakeCanSocket, "setsockopt", lambda *_args: None)
+    monkeypatch.setattr(FakeCanSocket, "recvmsg_into", recvmsg_into)
+
+    bus = RawCanTransport("vcan0", timestamping="hardware")
+    for _ in range(3):
+        peer.send(struct.pack("=IB3x8s", 0x123, 0, b""))
+
+    assert bus.recv().timestamp == 12.5
+    assert bus.recv().timestamp == 5.25
+
+    # Falls back to the host clock when the kernel sent no timestamp.
+    before = time.time()
+    assert before <= bus.recv().timestamp <= time.time()
+    bus.close()
+
+
+def test_raw_can_transport_invalid_timestamping() -> None:
+    with pytest.raises(InvalidTimestampingError):
+        RawCanTransport("vcan0", timestamping="invalid")
@@ -0,0 +1,55 @@
+import time
+from pathlib import Path
+
+import can
+import pytest
+
+from piper_kit.errors import EndOfReplayError
+from piper_kit.messages import JointControl12Message
+from piper_kit.transports.replay import ReplayTransport
+
+
+@pytest.fixture
+def log_file(tmp_path: Path) -> Path:
+    path = tmp_path / "replay.log"
+    with can.CanutilsLogWriter(path, channel="can0") as writer:
+        writer.on_message_received(
+            can.Message(timestamp=100.0, arbitration_id=0x2A5, data=[1, 2])
+        )
+        writer.on_message_received(
+            can.Message(timestamp=100.1, arbitration_id=0x2A6, data=[3, 4])
+        )
+
+    return path
+
+
+def test_replay_transport(log_file: Path) -> None:
+    transport = ReplayTransport(log_file)
+    assert transport.fileno() == -1
+
+    transport.send(JointControl12Message(0, 0))
+
+    frame = transport.recv()
+    assert frame.arbitration_id == 0x2A5
+    assert frame.data == bytearray([1, 2])
+
+    frame = transport.recv()
+    assert frame.arbitration_id == 0x2A6
+    assert frame.data == bytearray([3, 4])
+
+    with pytest.raises(EndOfReplayError):
+        transport.recv()
+
+    transport.close()
+
+
+def test_replay_transport_realtime(log_file: Path) -> None:
+    transport = ReplayTransport(log_file, realtime=True)
+
+    start = time.monotonic()
+    assert transport.recv().arbitration_id == 0x2A5
+    assert transport.recv(0.01) is None
+    assert transport.recv(1.0).arbitration_id == 0x2A6
+    assert time.monotonic() - start >= 0.1
+
+    transport.close()
@@ -0,0 +1,67 @@
+import pytest
+
+from piper_kit.errors import InvalidTransportUriError
+from piper_kit.transports import uri
+from piper_kit.transports.uri import open_transport
+
+
+class FakeTransport:
+    def __init__(self, *args: object, **kwargs: object) -> None:
+        self.args = args
+        self.kwargs = kwargs
+
+
+@pytest.fixture(autouse=True)
+def fake_transports(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(uri, "PythonCanTransport", type("", (FakeTransport,), {}))
+    monkeypatch.setattr(uri, "RawCanTransport", type("", (FakeTransport,), {}))
+    monkeypatch.setattr(uri, "ReplayTransport", type("", (FakeTransport,), {}))
+
+
+def test_open_interface_name() -> None:
+    transport = open_transport("can0")
+    assert isinstance(transport, uri.PythonCanTransport)
+    assert transport.args == ("socketcan", "can0")
+
+
+def test_open_socketcan_uri() -> None:
+    transport = open_transport("socketcan://can1")
+    assert isinstance(transport, uri.PythonCanTransport)
+    assert transport.args == ("socketcan", "can1")
+
+
+def test_open_virtual_uri() -> None:
+    transport = open_transport("virtual://arm")
+    assert isinstance(transport, uri.PythonCanTransport)
+    assert transport.args == ("virtual", "arm")
+
+
+def test_open_raw_uri() -> None:
+    transport = open_transport("raw://can0")
+    assert isinstance(transport, uri.RawCanTransport)
+    assert transport.args == ("can0",)
+    assert transport.kwargs == {"timestamping": "user"}
+
+
+def test_open_raw_uri_with_timestamping() -> None:
+    transport = open_transport("raw://can0?timestamping=hardware")
+    assert transport.kwargs == {"timestamping": "hardware"}
+
+
+def test_open_replay_uri() -> None:
+    transport = open_transport("replay://logs/session.asc")
+    assert isinstance(transport, uri.ReplayTransport)
+    assert transport.args == ("logs/session.asc",)
+    assert transport.kwargs == {"realtime": False}
+
+    transport = open_transport("replay:///data/session.blf?realtime=1")
+    assert transport.args == ("/data/session.blf",)
+    assert transport.kwargs == {"realtime": True}
+
+    transport = open_transport("replay://session.log?realtime=false")
+    assert transport.kwargs == {"realtime": False}
+
+
+def test_open_invalid_uri() -> None:
+    with pytest.raises(InvalidTransportUriError):
+        open_transport("invalid://can0")